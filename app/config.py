@@ -13,6 +13,8 @@ class Settings:
     # Paths
     BASE_DIR: Path = Path(__file__).resolve().parent.parent   # E:\08 TalentIQ
     DATASETS_DIR: Path = BASE_DIR / "datasets"
+    CACHE_DIR: Path = BASE_DIR / ".cache"                     # derived artifacts (safe to delete)
+    DATASET_SNAPSHOT_DIR: Path = CACHE_DIR / "datasets"       # python -m app.core.dataset_snapshot compile
 
     # CORS
     ALLOWED_ORIGINS: list[str] = [
@@ -25,8 +27,83 @@ class Settings:
     EMBEDDING_DIM: int = 384
     TOP_K_ROLES: int = 5
 
-    # Upload limits
+    # Embedding backend — "torch" (fp32 PyTorch) or "onnx_int8" (ONNX Runtime,
+    # int8 dynamic quantization). Role and resume vectors always share it.
+    EMBEDDING_BACKEND: str = "torch"
+    ONNX_MODEL_FILE: str = "onnx/model_qint8_avx512_vnni.onnx"
+    EMBEDDING_PARITY_CHECK: bool = True          # compare int8 vs fp32 on the role set
+    EMBEDDING_PARITY_TOLERANCE: float = 0.02     # max allowed 1 - cosine per role
+
+    # Resume embedding — "full" encodes the whole text in one pass (MiniLM
+    # truncates at 256 word pieces, dropping the end of long resumes);
+    # "chunked" encodes each section in overlapping word windows as one batch
+    # and pools the vectors ("mean", word-weighted, or "max")
+    RESUME_EMBEDDING_MODE: str = "full"
+    RESUME_EMBEDDING_POOLING: str = "mean"
+    RESUME_CHUNK_WORDS: int = 150                # words per window (≈ 200-230 word pieces)
+    RESUME_CHUNK_OVERLAP: int = 30               # words shared by consecutive windows
+
+    # Role-embedding cache — persists the encoded role matrix (.npy)
+    # under CACHE_DIR so warm starts skip re-encoding roles_database.json
+    EMBEDDING_CACHE_ENABLED: bool = True
+
+    # Load the embedding model during startup instead of on the first /analyze
+    EMBEDDING_WARMUP: bool = True
+
+    # Cross-request micro-batching of encode calls (app/core/embedding_dispatcher)
+    EMBEDDING_DISPATCHER: bool = True
+    EMBEDDING_MAX_BATCH: int = 32                # texts per batched encode
+    EMBEDDING_BATCH_WAIT_MS: float = 5.0         # max wait to fill a batch
+
+    # Analysis pipeline executor — keeps CPU-bound work off the event loop.
+    # "thread" shares engines with the API process; "process" scales across
+    # cores (each worker loads its own model). Requests beyond
+    # PIPELINE_WORKERS + PIPELINE_MAX_QUEUE are rejected with 503.
+    PIPELINE_EXECUTOR: str = "thread"
+    PIPELINE_WORKERS: int = min(4, os.cpu_count() or 1)
+    PIPELINE_MAX_QUEUE: int = 16
+    STAGE_WORKERS: int = 4                       # concurrent engine stages (1 = sequential)
+
+    # Asynchronous analysis jobs (POST /analyze/jobs)
+    JOB_MAX_PENDING: int = 64                    # queued jobs before 503
+    JOB_RESULT_TTL_SECONDS: int = 900            # keep finished jobs this long
+
+    # Result cache for POST /analyze (app/services/result_cache.py) — keyed by
+    # upload bytes, target role, JD and a pipeline/dataset version. The version
+    # is computed at startup: restart after editing datasets/ or settings
+    RESULT_CACHE_ENABLED: bool = True
+    RESULT_CACHE_MAX_ENTRIES: int = 256
+    RESULT_CACHE_MAX_MB: int = 64
+    RESULT_CACHE_TTL_SECONDS: int = 3600
+    RESULT_CACHE_DISK: bool = False              # also persist under CACHE_DIR/results
+
+    # Role-independent profile phase (steps 1-6) memoised per resume text, so
+    # changing only target_role / jd_text skips extraction + embedding (0 = off)
+    PROFILE_CACHE_SIZE: int = 128
+
+    # JD features (keywords, skill/tool terms, requirements) per distinct
+    # user-provided JD text; the roles' default JDs are pinned separately
+    JD_CACHE_SIZE: int = 256
+
+    # JD comparison — "lexical" (keyword overlap + section scores) or
+    # "semantic" (adds per-requirement evidence from sentence embeddings)
+    JD_COMPARISON_MODE: str = "lexical"
+    JD_REQUIREMENT_THRESHOLD: float = 0.5        # cosine at which a requirement counts as met
+
+    # Uploads are parsed in memory. PERSIST_UPLOADS keeps a content-addressed
+    # copy (UPLOAD_DIR/<sha256>.<ext>) that is purged after UPLOAD_TTL_SECONDS
+    UPLOAD_DIR: Path = BASE_DIR / "uploads"
+    PERSIST_UPLOADS: bool = False
+    UPLOAD_TTL_SECONDS: int = 7 * 24 * 3600
+
+    # Upload limits — oversized files get 413, oversized documents 422. Request
+    # bodies are capped at MAX_FILE_SIZE_MB (MAX_BATCH_MB for /analyze/batch)
+    # plus form overhead, counted as the body streams in
     MAX_FILE_SIZE_MB: int = 10
+    MAX_PDF_PAGES: int = 20
+    MAX_EXTRACTED_CHARS: int = 200_000
+    MAX_BATCH_SIZE: int = 200                    # files + texts per /analyze/batch
+    MAX_BATCH_MB: int = 50                       # whole /analyze/batch request body
     ALLOWED_EXTENSIONS: set[str] = {".pdf", ".docx"}
 
 
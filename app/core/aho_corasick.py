@@ -0,0 +1,88 @@
+"""
+TalentIQ — Aho–Corasick Multi-pattern Matcher
+Pure-Python automaton that finds every occurrence of every pattern in a
+single left-to-right pass over the text — O(len(text) + matches) per scan,
+independent of how many patterns were compiled in.
+
+Build it once (e.g. at engine init) and reuse it for every document:
+
+    matcher = AhoCorasick(["ci cd", "c++", "machine learning"])
+    for start, end, pattern in matcher.iter_matches(text):
+        ...
+
+Matching is exact and case-sensitive; callers normalise both patterns and
+text (lower-casing, separator folding) and apply any boundary rules to the
+reported spans.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable, Iterator
+
+
+class AhoCorasick:
+    """Immutable multi-pattern automaton over ``patterns`` (empty strings are ignored)."""
+
+    __slots__ = ("_goto", "_fail", "_out", "_size")
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        goto: list[dict[str, int]] = [{}]
+        out: list[tuple[str, ...]] = [()]
+
+        # 1. Trie of all patterns
+        count = 0
+        for pattern in dict.fromkeys(patterns):
+            if not pattern:
+                continue
+            node = 0
+            for ch in pattern:
+                nxt = goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[node][ch] = nxt
+                    goto.append({})
+                    out.append(())
+                node = nxt
+            out[node] = (pattern,)
+            count += 1
+
+        # 2. Failure links (BFS) — each node inherits its fallback's outputs
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in goto[node].items():
+                queue.append(child)
+                f = fail[node]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fallback = goto[f].get(ch, 0)
+                fail[child] = fallback if fallback != child else 0
+                if out[fail[child]]:
+                    out[child] = out[child] + out[fail[child]]
+
+        self._goto = goto
+        self._fail = fail
+        self._out = out
+        self._size = count
+
+    def __len__(self) -> int:
+        """Number of distinct patterns."""
+        return self._size
+
+    def iter_matches(self, text: str) -> Iterator[tuple[int, int, str]]:
+        """
+        Yield ``(start, end, pattern)`` for every occurrence in ``text``,
+        overlapping ones included, ordered by ``end`` (``text[start:end] == pattern``).
+        """
+        goto, fail, out = self._goto, self._fail, self._out
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if out[node]:
+                end = i + 1
+                for pattern in out[node]:
+                    yield end - len(pattern), end, pattern
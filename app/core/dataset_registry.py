@@ -0,0 +1,175 @@
+"""
+TalentIQ — Shared Dataset Registry
+Loads each reference dataset at most once per process and hands the same
+read-only view to every engine that needs it.
+
+    from app.core import dataset_registry
+    roles_db = dataset_registry.get("roles_database")
+
+Views are immutable where the type allows it: top-level mappings are
+``MappingProxyType``, vocabularies are ``frozenset`` and snapshot columns
+are read-only (memory-mapped) numpy arrays. Role records nested inside
+``roles_database`` stay plain dicts so they serialise as-is — treat them
+as read-only.
+
+``stats()`` reports the load time and approximate resident size of every
+dataset loaded so far (exposed on ``/health``).
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Callable
+
+import numpy as np
+
+from app.config import settings
+from app.core import dataset_snapshot
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class _Entry:
+    value: Any
+    load_seconds: float
+    nbytes: int
+
+
+# ---------------------------------------------------------------------------
+# Loaders — each returns an immutable view; registered in ``_LOADERS``
+# ---------------------------------------------------------------------------
+
+def _load_roles_database() -> MappingProxyType:
+    """role_id → role record from roles_database.json."""
+    json_path = settings.DATASETS_DIR / "roles_database.json"
+    with open(json_path, encoding="utf-8") as fh:
+        data = json.load(fh)
+    return MappingProxyType(data.get("roles", {}))
+
+
+def _load_role_skills() -> frozenset[str]:
+    """Lower-cased required + preferred skills across every role."""
+    skills: set[str] = set()
+    for info in get("roles_database").values():
+        for s in info.get("required_skills", []):
+            skills.add(s.lower().strip())
+        for s in info.get("preferred_skills", []):
+            skills.add(s.lower().strip())
+    return frozenset(skills)
+
+
+def _load_skills_master() -> MappingProxyType:
+    """Column name → array, one row per unique lower-cased skill name."""
+    return MappingProxyType(dataset_snapshot.load("skills_master"))
+
+
+def _load_skill_names() -> frozenset[str]:
+    """Every lower-cased skill name in skills_master.csv."""
+    return frozenset(get("skills_master")["skill_lower"].tolist())
+
+
+_LOADERS: dict[str, Callable[[], Any]] = {
+    "roles_database": _load_roles_database,
+    "role_skills": _load_role_skills,
+    "skills_master": _load_skills_master,
+    "skill_names": _load_skill_names,
+}
+
+_entries: dict[str, _Entry] = {}
+_locks: dict[str, threading.Lock] = {name: threading.Lock() for name in _LOADERS}
+
+
+# ---------------------------------------------------------------------------
+# Size accounting
+# ---------------------------------------------------------------------------
+
+def _sizeof(obj: Any, seen: set[int] | None = None) -> int:
+    """Approximate deep size in bytes (numpy arrays count their buffer)."""
+    if seen is None:
+        seen = set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    if isinstance(obj, np.ndarray):
+        return obj.nbytes
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (dict, MappingProxyType)):
+        size += sum(_sizeof(k, seen) + _sizeof(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(_sizeof(item, seen) for item in obj)
+    return size
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+def get(name: str) -> Any:
+    """
+    Return the shared view of dataset ``name``, loading it on first use.
+
+    Thread-safe: concurrent first callers block on a per-dataset lock and
+    the loader runs once. Failed loads are not cached, so a later call
+    retries (and raises again if the source is still unavailable).
+
+    Raises
+    ------
+    KeyError
+        If ``name`` is not a registered dataset.
+    """
+    entry = _entries.get(name)
+    if entry is not None:
+        return entry.value
+
+    if name not in _LOADERS:
+        raise KeyError(f"Unknown dataset {name!r}. Known: {', '.join(names())}")
+
+    with _locks[name]:
+        entry = _entries.get(name)
+        if entry is None:
+            t0 = time.perf_counter()
+            value = _LOADERS[name]()
+            elapsed = time.perf_counter() - t0
+            entry = _Entry(value=value, load_seconds=elapsed, nbytes=_sizeof(value))
+            _entries[name] = entry
+            logger.info(
+                "Dataset %s loaded in %.1f ms (~%.1f KiB)",
+                name, elapsed * 1000, entry.nbytes / 1024,
+            )
+    return entry.value
+
+
+def is_loaded(name: str) -> bool:
+    """Check whether ``name`` has been loaded in this process."""
+    return name in _entries
+
+
+def names() -> list[str]:
+    """All registered dataset names."""
+    return list(_LOADERS)
+
+
+def stats() -> dict[str, dict]:
+    """
+    Load time and approximate size of every dataset loaded so far.
+
+    Returns
+    -------
+    dict[str, dict]
+        name → {"load_seconds", "nbytes"}
+    """
+    return {
+        name: {
+            "load_seconds": round(entry.load_seconds, 4),
+            "nbytes": entry.nbytes,
+        }
+        for name, entry in _entries.items()
+    }
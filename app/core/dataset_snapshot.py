@@ -0,0 +1,346 @@
+"""
+TalentIQ — Compiled Dataset Snapshots
+Turns the large CSV datasets into pre-deduplicated, column-typed ``.npy``
+artifacts holding exactly the lookup tables each engine builds, so engine
+construction memory-maps a few arrays instead of parsing 50K-row CSVs.
+
+Each snapshot lives in ``settings.DATASET_SNAPSHOT_DIR/<name>/`` as one
+``.npy`` file per column plus ``meta.json`` recording the source CSV's size,
+mtime and sha256. ``load()`` uses the artifact only while it matches the
+source (mtime/size fast path, sha256 fallback); otherwise it rebuilds the
+same columns from the CSV in memory.
+
+Usage:
+    python -m app.core.dataset_snapshot compile   # build every snapshot
+    python -m app.core.dataset_snapshot status    # fresh / stale / missing
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Bump when a builder's output columns or semantics change
+FORMAT_VERSION = 1
+
+Columns = dict[str, np.ndarray]
+
+
+# ---------------------------------------------------------------------------
+# Builders — CSV → engine lookup columns (pandas only runs here)
+# ---------------------------------------------------------------------------
+
+def _str_array(values) -> np.ndarray:
+    """Fixed-width unicode array (mmap-able, no pickle)."""
+    return np.asarray(list(values), dtype=np.str_)
+
+
+def _build_skill_synonyms(csv_path: Path) -> Columns:
+    """SkillNormalizationEngine: original_term → normalized_skill_name (last row wins)."""
+    import pandas as pd
+
+    df = pd.read_csv(csv_path)
+    orig = df["original_term"].astype(str).str.strip().str.lower()
+    canon = df["normalized_skill_name"].astype(str).str.strip().str.lower()
+    pairs = pd.DataFrame({"orig": orig, "canon": canon})
+    pairs = pairs[(pairs["orig"] != "") & (pairs["canon"] != "") & (pairs["orig"] != pairs["canon"])]
+    pairs = pairs.drop_duplicates(subset=["orig"], keep="last")
+    return {
+        "original_term": _str_array(pairs["orig"]),
+        "normalized_skill_name": _str_array(pairs["canon"]),
+    }
+
+
+def _build_soft_skill_indicators(csv_path: Path) -> Columns:
+    """SoftSkillEngine: one indicator per phrase, highest confidence first."""
+    import pandas as pd
+
+    df = pd.read_csv(csv_path)
+    df["phrase_lower"] = df["phrase_pattern"].str.lower().str.strip()
+    df["weight"] = pd.to_numeric(df["weight"], errors="coerce").fillna(0.5)
+    df["confidence_score"] = pd.to_numeric(
+        df["confidence_score"], errors="coerce"
+    ).fillna(0.5)
+    if "polarity" not in df.columns:
+        df["polarity"] = "positive"
+
+    deduped = (
+        df.sort_values("confidence_score", ascending=False)
+        .drop_duplicates(subset=["phrase_lower", "soft_skill_type"], keep="first")
+    )
+    deduped = deduped[deduped["phrase_lower"].notna() & (deduped["phrase_lower"].str.len() > 2)]
+    # The engine keeps the first row per phrase regardless of skill type
+    deduped = deduped.drop_duplicates(subset=["phrase_lower"], keep="first")
+
+    return {
+        "phrase": _str_array(deduped["phrase_lower"]),
+        "type": _str_array(deduped["soft_skill_type"].astype(str).str.strip()),
+        "weight": np.maximum(deduped["weight"].to_numpy(dtype=np.float64), 0.3),
+        "polarity": _str_array(deduped["polarity"].astype(str).str.strip().str.lower()),
+        "original": _str_array(deduped["phrase_pattern"].astype(str).str.strip()),
+    }
+
+
+def _build_certification_master(csv_path: Path) -> Columns:
+    """CertificationEngine: highest-recognition row per (certification, skill_id)."""
+    import pandas as pd
+
+    df = pd.read_csv(csv_path)
+    df["related_skill_id"] = df["related_skill_id"].astype(str).str.strip()
+    df["global_recognition_score"] = pd.to_numeric(
+        df["global_recognition_score"], errors="coerce"
+    ).fillna(0)
+
+    certs = (
+        df.sort_values("global_recognition_score", ascending=False)
+        .drop_duplicates(subset=["certification_name", "related_skill_id"], keep="first")
+        .reset_index(drop=True)
+    )
+    return {
+        "certification_name": _str_array(certs["certification_name"].astype(str)),
+        "provider": _str_array(certs["provider"].astype(str)),
+        "related_skill_id": _str_array(certs["related_skill_id"]),
+        "difficulty_level": _str_array(certs["difficulty_level"].astype(str)),
+        "average_cost": pd.to_numeric(certs["average_cost"], errors="coerce")
+        .fillna(0).to_numpy(dtype=np.int64),
+        "duration_months": pd.to_numeric(certs["duration_months"], errors="coerce")
+        .fillna(0).to_numpy(dtype=np.int64),
+        "global_recognition_score": certs["global_recognition_score"].to_numpy(dtype=np.float64),
+    }
+
+
+def _build_skills_master(csv_path: Path) -> Columns:
+    """
+    IndustryInsightEngine + CertificationEngine: one row per lower-cased skill
+    (sorted), with the first-seen skill_id, median demand/trend and the
+    modal is_emerging flag.
+    """
+    import pandas as pd
+
+    df = pd.read_csv(csv_path)
+    df["skill_lower"] = df["skill_name"].str.lower().str.strip()
+    df["skill_id"] = df["skill_id"].astype(str).str.strip()
+    df["demand_score"] = pd.to_numeric(df["demand_score"], errors="coerce").fillna(0)
+    df["global_trend_score"] = pd.to_numeric(
+        df["global_trend_score"], errors="coerce"
+    ).fillna(0)
+    df["is_emerging"] = df["is_emerging"].str.strip().str.lower() == "yes"
+    df["row"] = np.arange(len(df))
+
+    grouped = df.groupby("skill_lower", as_index=False).agg(
+        skill_id=("skill_id", "first"),
+        first_seen=("row", "min"),
+        demand_score=("demand_score", "median"),
+        global_trend_score=("global_trend_score", "median"),
+        is_emerging=("is_emerging", lambda x: x.mode()[0] if len(x.mode()) > 0 else False),
+    )
+    return {
+        "skill_lower": _str_array(grouped["skill_lower"]),
+        "skill_id": _str_array(grouped["skill_id"]),
+        "first_seen": grouped["first_seen"].to_numpy(dtype=np.int64),
+        "demand_score": grouped["demand_score"].to_numpy(dtype=np.float64),
+        "global_trend_score": grouped["global_trend_score"].to_numpy(dtype=np.float64),
+        "is_emerging": grouped["is_emerging"].to_numpy(dtype=bool),
+    }
+
+
+@dataclass(frozen=True, slots=True)
+class _Spec:
+    source: str                                  # CSV under DATASETS_DIR
+    build: Callable[[Path], Columns]
+
+
+_SPECS: dict[str, _Spec] = {
+    "skill_synonyms": _Spec("skill_synonyms.csv", _build_skill_synonyms),
+    "soft_skill_indicators": _Spec("soft_skill_indicators.csv", _build_soft_skill_indicators),
+    "certification_master": _Spec("certification_master.csv", _build_certification_master),
+    "skills_master": _Spec("skills_master.csv", _build_skills_master),
+}
+
+
+# ---------------------------------------------------------------------------
+# Freshness
+# ---------------------------------------------------------------------------
+
+def _source_path(name: str) -> Path:
+    return settings.DATASETS_DIR / _SPECS[name].source
+
+
+def _snapshot_dir(name: str) -> Path:
+    return settings.DATASET_SNAPSHOT_DIR / name
+
+
+def _sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for block in iter(lambda: fh.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _read_meta(name: str) -> dict | None:
+    try:
+        with open(_snapshot_dir(name) / "meta.json", encoding="utf-8") as fh:
+            return json.load(fh)
+    except (OSError, ValueError):
+        return None
+
+
+def status(name: str) -> str:
+    """Return ``fresh``, ``stale``, ``missing`` or ``no-source`` for a snapshot."""
+    source = _source_path(name)
+    if not source.exists():
+        return "no-source"
+    meta = _read_meta(name)
+    if meta is None or meta.get("format_version") != FORMAT_VERSION:
+        return "missing"
+
+    stat = source.stat()
+    if meta["source_size"] == stat.st_size and meta["source_mtime_ns"] == stat.st_mtime_ns:
+        return "fresh"
+    # mtime moved (checkout, copy) — the content hash decides
+    if meta["source_size"] == stat.st_size and meta["source_sha256"] == _sha256(source):
+        return "fresh"
+    return "stale"
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+def load(name: str) -> Columns:
+    """
+    Return the lookup columns for dataset ``name``.
+
+    Uses the memory-mapped snapshot when it is fresh; otherwise parses the
+    source CSV with the same builder (nothing is written).
+
+    Raises
+    ------
+    KeyError
+        If ``name`` is not a known snapshot.
+    FileNotFoundError
+        If the source CSV does not exist.
+    """
+    spec = _SPECS[name]
+    t0 = time.perf_counter()
+    state = status(name)
+
+    if state == "fresh":
+        meta = _read_meta(name) or {}
+        try:
+            columns = {
+                col: np.load(_snapshot_dir(name) / f"{col}.npy", mmap_mode="r")
+                for col in meta["columns"]
+            }
+        except (OSError, ValueError, KeyError) as exc:
+            logger.warning("Snapshot %s unreadable (%s) — parsing CSV", name, exc)
+        else:
+            logger.info(
+                "Dataset %s: snapshot mmap'd in %.1f ms (%d rows)",
+                name, (time.perf_counter() - t0) * 1000, meta.get("rows", 0),
+            )
+            return columns
+
+    source = _source_path(name)
+    if not source.exists():
+        raise FileNotFoundError(f"Dataset source not found: {source}")
+    columns = spec.build(source)
+    logger.info(
+        "Dataset %s: parsed %s in %.1f ms (snapshot %s — run "
+        "'python -m app.core.dataset_snapshot compile')",
+        name, spec.source, (time.perf_counter() - t0) * 1000, state,
+    )
+    return columns
+
+
+def compile_snapshot(name: str) -> dict:
+    """Build the snapshot for ``name`` from its CSV and return its metadata."""
+    source = _source_path(name)
+    stat = source.stat()
+    t0 = time.perf_counter()
+    columns = _SPECS[name].build(source)
+
+    out_dir = _snapshot_dir(name)
+    tmp_dir = out_dir.with_name(f".{name}.{os.getpid()}.tmp")
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    tmp_dir.mkdir(parents=True)
+
+    rows = 0
+    for col, values in columns.items():
+        np.save(tmp_dir / f"{col}.npy", np.ascontiguousarray(values))
+        rows = len(values)
+    meta = {
+        "format_version": FORMAT_VERSION,
+        "source": _SPECS[name].source,
+        "source_size": stat.st_size,
+        "source_mtime_ns": stat.st_mtime_ns,
+        "source_sha256": _sha256(source),
+        "columns": list(columns),
+        "rows": rows,
+        "compile_seconds": round(time.perf_counter() - t0, 3),
+    }
+    with open(tmp_dir / "meta.json", "w", encoding="utf-8") as fh:
+        json.dump(meta, fh, indent=2)
+
+    shutil.rmtree(out_dir, ignore_errors=True)
+    os.replace(tmp_dir, out_dir)
+    return meta
+
+
+def compile_all() -> dict[str, dict | None]:
+    """Compile every snapshot whose source CSV exists (None for skipped ones)."""
+    results: dict[str, dict | None] = {}
+    for name in _SPECS:
+        if not _source_path(name).exists():
+            logger.warning("Skipping %s — %s not found", name, _SPECS[name].source)
+            results[name] = None
+            continue
+        results[name] = compile_snapshot(name)
+    return results
+
+
+def snapshot_names() -> list[str]:
+    """Names of every dataset that can be compiled."""
+    return list(_SPECS)
+
+
+def _main(argv: list[str]) -> int:
+    logging.basicConfig(level=logging.INFO)
+    command = argv[0] if argv else "status"
+
+    if command == "compile":
+        for name, meta in compile_all().items():
+            if meta is None:
+                print(f"  {name:<24} skipped (no source)")
+            else:
+                print(
+                    f"  {name:<24} {meta['rows']:>7} rows  "
+                    f"{meta['compile_seconds']:.2f} s  ← {meta['source']}"
+                )
+        return 0
+    if command == "status":
+        for name in _SPECS:
+            print(f"  {name:<24} {status(name)}")
+        return 0
+
+    print(__doc__)
+    return 2
+
+
+if __name__ == "__main__":
+    sys.exit(_main(sys.argv[1:]))
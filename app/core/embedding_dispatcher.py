@@ -0,0 +1,151 @@
+"""
+TalentIQ — Embedding Dispatcher
+Cross-request dynamic micro-batching for ``model.encode``.
+
+Concurrent callers each want a handful of vectors; the transformer is far
+more efficient on one batch than on many single-sentence calls. A single
+background thread collects encode requests for up to
+``EMBEDDING_BATCH_WAIT_MS`` (or until ``EMBEDDING_MAX_BATCH`` texts are
+pending), encodes them in one call and fans the vectors back out.
+
+Requests that are already a full batch (e.g. the role set at startup)
+are encoded inline on the caller's thread. Every vector is
+L2-normalised, so callers can compare them with a plain dot product.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from app.config import settings
+from app.core import model_loader
+from app.core.metrics import Histogram
+
+logger = logging.getLogger(__name__)
+
+batch_size_histogram = Histogram((1, 2, 4, 8, 16, 32, 64, 128))
+wait_ms_histogram = Histogram((0.5, 1, 2, 5, 10, 25, 50, 100, 250))
+
+
+@dataclass(slots=True)
+class _Request:
+    texts: list[str]
+    future: Future
+    enqueued_at: float = field(default_factory=time.perf_counter)
+
+
+_queue: queue.Queue[_Request] = queue.Queue()
+_worker: threading.Thread | None = None
+_worker_lock = threading.Lock()
+
+
+def _encode_now(texts: list[str]) -> np.ndarray:
+    embeddings = model_loader.get_model().encode(
+        texts, show_progress_bar=False, normalize_embeddings=True,
+    )
+    return np.asarray(embeddings, dtype=np.float32).reshape(len(texts), -1)
+
+
+def _ensure_worker() -> None:
+    global _worker  # noqa: PLW0603
+
+    if _worker is not None and _worker.is_alive():
+        return
+    with _worker_lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = threading.Thread(
+                target=_batch_loop, name="embedding-dispatcher", daemon=True,
+            )
+            _worker.start()
+
+
+def _batch_loop() -> None:
+    max_batch = max(1, settings.EMBEDDING_MAX_BATCH)
+    max_wait = max(0.0, settings.EMBEDDING_BATCH_WAIT_MS) / 1000
+
+    while True:
+        batch = [_queue.get()]
+        pending = len(batch[0].texts)
+        deadline = batch[0].enqueued_at + max_wait
+
+        # Collect more requests until the batch is full or the oldest one
+        # has waited long enough
+        while pending < max_batch:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                request = _queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            batch.append(request)
+            pending += len(request.texts)
+
+        started = time.perf_counter()
+        for request in batch:
+            wait_ms_histogram.observe((started - request.enqueued_at) * 1000)
+        batch_size_histogram.observe(pending)
+
+        texts = [text for request in batch for text in request.texts]
+        try:
+            vectors = _encode_now(texts)
+        except Exception as exc:
+            logger.exception("Batched encode of %d texts failed", len(texts))
+            for request in batch:
+                request.future.set_exception(exc)
+            continue
+
+        offset = 0
+        for request in batch:
+            n = len(request.texts)
+            request.future.set_result(vectors[offset:offset + n])
+            offset += n
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+def encode(texts: list[str]) -> np.ndarray:
+    """
+    Encode ``texts`` → ``(N, dim)`` float32 matrix of L2-normalised rows.
+
+    Blocks the calling thread until the batch containing these texts has
+    been encoded — never call it on the event loop.
+    """
+    if not texts:
+        return np.zeros((0, settings.EMBEDDING_DIM), dtype=np.float32)
+
+    if not settings.EMBEDDING_DISPATCHER or len(texts) >= settings.EMBEDDING_MAX_BATCH:
+        batch_size_histogram.observe(len(texts))
+        wait_ms_histogram.observe(0.0)
+        return _encode_now(texts)
+
+    _ensure_worker()
+    request = _Request(texts=list(texts), future=Future())
+    _queue.put(request)
+    return request.future.result()
+
+
+def encode_one(text: str) -> np.ndarray:
+    """Encode a single text → ``(dim,)`` L2-normalised vector."""
+    return encode([text])[0]
+
+
+def stats() -> dict:
+    """Batch-size and queue-wait histograms plus current settings."""
+    return {
+        "enabled": settings.EMBEDDING_DISPATCHER,
+        "max_batch": settings.EMBEDDING_MAX_BATCH,
+        "max_wait_ms": settings.EMBEDDING_BATCH_WAIT_MS,
+        "queued": _queue.qsize(),
+        "batch_size": batch_size_histogram.snapshot(),
+        "wait_ms": wait_ms_histogram.snapshot(),
+    }
@@ -0,0 +1,250 @@
+"""
+TalentIQ — In-process Metrics
+Minimal thread-safe instruments (no prometheus_client dependency).
+
+Histogram buckets are cumulative upper bounds, Prometheus-style, so a
+snapshot can be rendered as-is by ``PrometheusText``.
+
+``timed(step)`` measures a pipeline step: the duration goes into the
+``step_seconds`` histogram for ``/metrics`` and, inside
+``collect_timings()``, into that request's own timing breakdown. The
+breakdown lives in a context variable, so it follows the request onto
+stage-scheduler threads.
+"""
+
+from __future__ import annotations
+
+import bisect
+import math
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+# Seconds — from a sub-millisecond regex pass to a multi-second PDF parse
+LATENCY_BUCKETS: tuple[float, ...] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10,
+)
+
+
+class Histogram:
+    """Fixed-bucket histogram of observed values."""
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self._bounds: tuple[float, ...] = tuple(sorted(buckets))
+        self._counts: list[int] = [0] * (len(self._bounds) + 1)   # last = +Inf
+        self._count = 0
+        self._sum = 0.0
+        self._max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        slot = bisect.bisect_left(self._bounds, value)
+        with self._lock:
+            self._counts[slot] += 1
+            self._count += 1
+            self._sum += value
+            self._max = max(self._max, value)
+
+    def snapshot(self) -> dict:
+        """
+        Current state of the histogram.
+
+        Returns
+        -------
+        dict
+            count, sum, mean, max, and buckets — cumulative counts keyed by
+            upper bound (``"+Inf"`` last)
+        """
+        with self._lock:
+            counts = list(self._counts)
+            count, total, peak = self._count, self._sum, self._max
+
+        buckets: dict[str, int] = {}
+        running = 0
+        for bound, n in zip((*self._bounds, math.inf), counts):
+            running += n
+            buckets["+Inf" if math.isinf(bound) else f"{bound:g}"] = running
+        return {
+            "count": count,
+            "sum": round(total, 6),
+            "mean": round(total / count, 6) if count else 0.0,
+            "max": round(peak, 6),
+            "buckets": buckets,
+        }
+
+
+class Counter:
+    """Monotonically increasing count."""
+
+    def __init__(self) -> None:
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+
+class Family(Generic[T]):
+    """Instruments of one kind keyed by a tuple of label values."""
+
+    def __init__(self, label_names: tuple[str, ...], factory: Callable[[], T]) -> None:
+        self.label_names = label_names
+        self._factory = factory
+        self._children: dict[tuple[str, ...], T] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values: str) -> T:
+        """The instrument for ``values`` (created on first use)."""
+        child = self._children.get(values)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(values, self._factory())
+        return child
+
+    def items(self) -> list[tuple[dict[str, str], T]]:
+        """``(labels, instrument)`` pairs, sorted by label values."""
+        with self._lock:
+            children = sorted(self._children.items())
+        return [(dict(zip(self.label_names, key)), child) for key, child in children]
+
+
+# ---------------------------------------------------------------------------
+# Shared instruments
+# ---------------------------------------------------------------------------
+
+step_seconds: Family[Histogram] = Family(("step",), lambda: Histogram(LATENCY_BUCKETS))
+http_requests: Family[Counter] = Family(("method", "path", "status"), Counter)
+http_request_seconds: Family[Histogram] = Family(
+    ("method", "path"), lambda: Histogram(LATENCY_BUCKETS),
+)
+
+
+# ---------------------------------------------------------------------------
+# Pipeline step timings
+# ---------------------------------------------------------------------------
+
+_timings: ContextVar[dict[str, float] | None] = ContextVar("step_timings", default=None)
+
+
+@contextmanager
+def collect_timings(into: dict[str, float] | None = None) -> Iterator[dict[str, float]]:
+    """
+    Collect ``timed()`` durations for the enclosed work into a dict
+    (``into``, or a new one).
+
+    Nested calls without ``into`` share the outermost dict, so an entry
+    point and the pipeline it calls report a single breakdown.
+    """
+    current = _timings.get()
+    if current is not None and into is None:
+        yield current
+        return
+    timings: dict[str, float] = {} if into is None else into
+    token = _timings.set(timings)
+    try:
+        yield timings
+    finally:
+        _timings.reset(token)
+
+
+def current_timings() -> dict[str, float] | None:
+    """The active ``collect_timings()`` dict, if any."""
+    return _timings.get()
+
+
+@contextmanager
+def timed(step: str) -> Iterator[None]:
+    """Time the enclosed block as pipeline step ``step``."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        step_seconds.labels(step).observe(elapsed)
+        timings = _timings.get()
+        if timings is not None:
+            timings[step] = timings.get(step, 0.0) + elapsed
+
+
+# ---------------------------------------------------------------------------
+# Prometheus text exposition
+# ---------------------------------------------------------------------------
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: dict[str, str] | None) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(str(v))}"' for k, v in labels.items()) + "}"
+
+
+def _format_value(value: float | int | bool) -> str:
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, float) and math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return f"{value:g}" if isinstance(value, float) else str(value)
+
+
+class PrometheusText:
+    """Builder for the Prometheus text exposition format (version 0.0.4)."""
+
+    CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(self) -> None:
+        self._lines: list[str] = []
+
+    def _header(self, name: str, kind: str, help_text: str) -> None:
+        self._lines.append(f"# HELP {name} {help_text}")
+        self._lines.append(f"# TYPE {name} {kind}")
+
+    def gauge(
+        self, name: str, help_text: str,
+        samples: float | list[tuple[dict[str, str], float]],
+    ) -> None:
+        self._samples(name, "gauge", help_text, samples)
+
+    def counter(
+        self, name: str, help_text: str,
+        samples: float | list[tuple[dict[str, str], float]],
+    ) -> None:
+        self._samples(name, "counter", help_text, samples)
+
+    def _samples(self, name, kind, help_text, samples) -> None:
+        if not isinstance(samples, list):
+            samples = [({}, samples)]
+        self._header(name, kind, help_text)
+        for labels, value in samples:
+            self._lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+
+    def histogram(
+        self, name: str, help_text: str,
+        samples: dict | list[tuple[dict[str, str], dict]],
+    ) -> None:
+        """``samples`` are ``Histogram.snapshot()`` dicts (optionally labelled)."""
+        if not isinstance(samples, list):
+            samples = [({}, samples)]
+        self._header(name, "histogram", help_text)
+        for labels, snap in samples:
+            for bound, count in snap["buckets"].items():
+                self._lines.append(
+                    f"{name}_bucket{_format_labels({**labels, 'le': bound})} {count}"
+                )
+            self._lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(float(snap['sum']))}")
+            self._lines.append(f"{name}_count{_format_labels(labels)} {snap['count']}")
+
+    def render(self) -> str:
+        return "\n".join(self._lines) + "\n"
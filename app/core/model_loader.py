@@ -1,9 +1,181 @@
 """
-TalentIQ — Singleton Model Loader
-Loads SentenceTransformer ONCE at startup and reuses across all engines.
+TalentIQ — Lazy Model Loader
+Loads the SentenceTransformer on first use (or during the explicit warm-up
+phase in the FastAPI lifespan) and reuses it across all engines.
+
+Importing this module is cheap: code paths that never embed (``/roles``,
+``/upload``, CLI tools, unit tests) never pay for the model load.
+
+Backends (``settings.EMBEDDING_BACKEND``):
+    torch      — original fp32 PyTorch model
+    onnx_int8  — ONNX Runtime export with int8 dynamic quantization; falls
+                 back to ``torch`` if onnxruntime/optimum or the export is
+                 unavailable, or if ``check_parity()`` finds too much drift.
 """
 
-from sentence_transformers import SentenceTransformer
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING
+
+import numpy as np
+
 from app.config import settings
 
-model = SentenceTransformer(settings.EMBEDDING_MODEL)
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
+
+logger = logging.getLogger(__name__)
+
+BACKEND_TORCH = "torch"
+BACKEND_ONNX_INT8 = "onnx_int8"
+
+_model: SentenceTransformer | None = None
+_active_backend: str | None = None
+_load_seconds: float | None = None
+_lock = threading.Lock()
+
+
+def _load(backend: str) -> SentenceTransformer:
+    from sentence_transformers import SentenceTransformer
+
+    if backend == BACKEND_ONNX_INT8:
+        return SentenceTransformer(
+            settings.EMBEDDING_MODEL,
+            device="cpu",
+            backend="onnx",
+            model_kwargs={"file_name": settings.ONNX_MODEL_FILE},
+        )
+    return SentenceTransformer(settings.EMBEDDING_MODEL)
+
+
+def get_model() -> SentenceTransformer:
+    """Return the shared model, loading it on the first call (thread-safe)."""
+    global _model, _active_backend, _load_seconds  # noqa: PLW0603
+
+    if _model is not None:
+        return _model
+
+    with _lock:
+        if _model is None:
+            backend = configured_backend()
+            logger.info(
+                "Loading embedding model %s (backend=%s) …",
+                settings.EMBEDDING_MODEL, backend,
+            )
+            t0 = time.perf_counter()
+            try:
+                _model = _load(backend)
+            except Exception as exc:
+                if backend == BACKEND_TORCH:
+                    raise
+                logger.warning(
+                    "Embedding backend %s unavailable (%s) — falling back to %s",
+                    backend, exc, BACKEND_TORCH,
+                )
+                backend = BACKEND_TORCH
+                _model = _load(backend)
+            _active_backend = backend
+            _load_seconds = time.perf_counter() - t0
+            logger.info(
+                "Embedding model %s loaded in %.2f s (backend=%s)",
+                settings.EMBEDDING_MODEL, _load_seconds, backend,
+            )
+    return _model
+
+
+def warm_up() -> float:
+    """Load the model now (if not already loaded) and return its load time in seconds."""
+    get_model()
+    return _load_seconds or 0.0
+
+
+def is_loaded() -> bool:
+    """Check whether the model has been loaded in this process."""
+    return _model is not None
+
+
+def load_time() -> float | None:
+    """Seconds spent constructing the model, or None if it was never loaded."""
+    return _load_seconds
+
+
+def configured_backend() -> str:
+    """The backend requested in settings (unknown values mean ``torch``)."""
+    backend = settings.EMBEDDING_BACKEND.strip().lower()
+    return backend if backend in (BACKEND_TORCH, BACKEND_ONNX_INT8) else BACKEND_TORCH
+
+
+def active_backend() -> str | None:
+    """The backend actually serving embeddings, or None if not loaded yet."""
+    return _active_backend
+
+
+def check_parity(texts: list[str]) -> dict:
+    """
+    Compare the active backend against the fp32 reference on ``texts``.
+
+    Cosine drift is ``1 - cos(fp32, active)`` per text. If the maximum drift
+    exceeds ``settings.EMBEDDING_PARITY_TOLERANCE`` the shared model is
+    swapped for the fp32 reference so every later embedding stays comparable.
+
+    Returns
+    -------
+    dict
+        backend, max_drift, mean_drift, tolerance, passed
+    """
+    global _model, _active_backend  # noqa: PLW0603
+
+    model = get_model()
+    tolerance = settings.EMBEDDING_PARITY_TOLERANCE
+    if _active_backend == BACKEND_TORCH or not texts:
+        return {
+            "backend": _active_backend,
+            "max_drift": 0.0,
+            "mean_drift": 0.0,
+            "tolerance": tolerance,
+            "passed": True,
+        }
+
+    reference = _load(BACKEND_TORCH)
+    candidate = np.asarray(
+        model.encode(texts, show_progress_bar=False, normalize_embeddings=True),
+        dtype=np.float32,
+    )
+    expected = np.asarray(
+        reference.encode(texts, show_progress_bar=False, normalize_embeddings=True),
+        dtype=np.float32,
+    )
+    drift = 1.0 - np.sum(candidate * expected, axis=1)
+    report = {
+        "backend": _active_backend,
+        "max_drift": round(float(drift.max()), 6),
+        "mean_drift": round(float(drift.mean()), 6),
+        "tolerance": tolerance,
+        "passed": bool(drift.max() <= tolerance),
+    }
+
+    if report["passed"]:
+        logger.info(
+            "Embedding parity OK for %s on %d texts — max drift %.5f (≤ %.5f)",
+            _active_backend, len(texts), report["max_drift"], tolerance,
+        )
+    else:
+        logger.warning(
+            "Embedding parity FAILED for %s on %d texts — max drift %.5f > %.5f; "
+            "switching to %s",
+            _active_backend, len(texts), report["max_drift"], tolerance, BACKEND_TORCH,
+        )
+        with _lock:
+            _model = reference
+            _active_backend = BACKEND_TORCH
+    return report
+
+
+def __getattr__(name: str):
+    # Backwards compatibility for ``from app.core.model_loader import model``.
+    if name == "model":
+        return get_model()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
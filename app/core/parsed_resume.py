@@ -0,0 +1,138 @@
+"""
+TalentIQ — Parsed Resume
+Shared, immutable view of one resume's text, built once per request and
+handed to every text-reading engine instead of the raw string.
+
+It carries the derived forms the engines used to recompute on their own:
+the lower-cased text, its set of word tokens, non-empty lines, bullet
+lines, sentences and detected section headings. Engines still accept a
+plain ``str`` and parse it on the spot (``ParsedResume.of``).
+
+All derived views are lower-case. Section offsets index ``text`` (not
+``lower``: the two differ in length for the rare characters whose
+lower-case form is longer, e.g. "İ").
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+
+_TOKEN = re.compile(r"\w+")
+_SENTENCE_END = re.compile(r"[.!?]+")
+_HEADING_TRIM = re.compile(r"^[^a-z]+|[^a-z]+$")
+
+# Characters that open a bullet line (ATS parsers count these)
+BULLET_CHARS = "•-*●"
+
+# Canonical section name → pattern for a heading line (lower-case, with
+# surrounding punctuation trimmed). Order matters: first match wins.
+SECTION_HEADINGS: dict[str, re.Pattern[str]] = {
+    name: re.compile(pattern)
+    for name, pattern in {
+        "contact": r"contact(?:\s+(?:information|info|details))?",
+        "summary": r"(?:professional\s+|career\s+)?(?:summary|profile|objective)|about\s+me",
+        "experience": (
+            r"(?:professional\s+|work\s+|relevant\s+)?experience|"
+            r"employment(?:\s+(?:history|record))?|(?:work|career)\s+history|internships?"
+        ),
+        "education": r"education(?:al\s+background)?|academic\s+(?:background|qualifications?)|qualifications?",
+        "skills": (
+            r"(?:(?:core|key|technical|professional|soft)\s+){0,2}skills(?:\s*(?:&|and)\s*[a-z]+)?|"
+            r"technologies|tech(?:nical)?\s+stack|core\s+competencies|tools(?:\s*(?:&|and)\s*technologies)?"
+        ),
+        "projects": r"(?:academic\s+|personal\s+|key\s+|selected\s+)?projects?",
+        "certifications": (
+            r"certifications?(?:\s*(?:&|and)\s*[a-z]+)?|licen[cs]es(?:\s*(?:&|and)\s*certifications?)?|"
+            r"courses?|training"
+        ),
+        "achievements": (
+            r"(?:interests\s*(?:&|and)\s*)?achievements?|awards?(?:\s*(?:&|and)\s*[a-z]+)?|"
+            r"honou?rs?(?:\s*(?:&|and)\s*awards?)?"
+        ),
+        "publications": r"publications?|research",
+        "activities": (
+            r"(?:extra[\s-]?curricular\s+)?activities|volunteer(?:ing)?(?:\s+experience)?|leadership|"
+            r"interests|hobbies"
+        ),
+        "other": r"declaration|references?|languages",
+    }.items()
+}
+_MAX_HEADING_WORDS = 4
+
+
+@dataclass(frozen=True, slots=True)
+class Section:
+    """A detected section: canonical ``name``, its heading line and body span in ``text``."""
+
+    name: str
+    heading: str
+    start: int
+    end: int
+
+
+@dataclass(frozen=True, slots=True)
+class ParsedResume:
+    """One resume's text and every derived view the engines read (see module doc)."""
+
+    text: str
+    lower: str
+    token_set: frozenset[str]
+    word_count: int             # whitespace-delimited words
+    lines: tuple[str, ...]      # stripped, non-empty
+    bullets: tuple[str, ...]    # lines opening with a BULLET_CHARS marker
+    sentences: tuple[str, ...]  # stripped, non-empty; split on runs of . ! ?
+    sections: tuple[Section, ...]
+
+    @classmethod
+    def of(cls, source: str | ParsedResume) -> ParsedResume:
+        """Return ``source`` if it is already parsed, else parse it."""
+        return source if isinstance(source, ParsedResume) else cls.parse(source)
+
+    @classmethod
+    def parse(cls, text: str) -> ParsedResume:
+        lower = text.lower()
+        lines: list[str] = []
+        headings: list[tuple[str, str, int, int]] = []  # name, heading, line start, body start
+        offset = 0
+        # lower() never adds or removes "\n", so the two splits line up
+        for raw_line, low_line in zip(text.split("\n"), lower.split("\n")):
+            line = low_line.strip()
+            if line:
+                lines.append(line)
+                name = _section_heading(line)
+                if name:
+                    heading = raw_line.strip().rstrip("_=*-─═ \t")
+                    headings.append((name, heading, offset, offset + len(raw_line) + 1))
+            offset += len(raw_line) + 1
+
+        sections: list[Section] = []
+        if headings and text[:headings[0][2]].strip():
+            sections.append(Section("header", "", 0, headings[0][2]))
+        for i, (name, heading, _, body_start) in enumerate(headings):
+            end = headings[i + 1][2] if i + 1 < len(headings) else len(text)
+            sections.append(Section(name, heading, min(body_start, len(text)), end))
+
+        return cls(
+            text=text,
+            lower=lower,
+            token_set=frozenset(_TOKEN.findall(lower)),
+            word_count=len(lower.split()),
+            lines=tuple(lines),
+            bullets=tuple(ln for ln in lines if ln[0] in BULLET_CHARS),
+            sentences=tuple(
+                s for s in (part.strip() for part in _SENTENCE_END.split(lower)) if s
+            ),
+            sections=tuple(sections),
+        )
+
+
+def _section_heading(line: str) -> str | None:
+    """Canonical section name if the (lower-case, stripped) line is a heading."""
+    candidate = _HEADING_TRIM.sub("", line)  # also drops "____" rules after a heading
+    if not candidate or len(candidate) > 48 or len(candidate.split()) > _MAX_HEADING_WORDS:
+        return None
+    for name, pattern in SECTION_HEADINGS.items():
+        if pattern.fullmatch(candidate):
+            return name
+    return None
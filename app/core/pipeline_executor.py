@@ -0,0 +1,297 @@
+"""
+TalentIQ — Pipeline Executor
+Runs the CPU-bound analysis pipeline off the asyncio event loop so a slow
+resume never stalls ``/health``, ``/roles`` or other in-flight requests.
+
+Modes (``settings.PIPELINE_EXECUTOR``):
+    thread   — ThreadPoolExecutor; engines are shared with the caller.
+               Torch, NumPy and the PDF parsers release the GIL for most of
+               their work, so this scales reasonably on its own.
+    process  — ProcessPoolExecutor (spawn); each worker initialises its own
+               vector store and model (warm-started from the disk cache) and
+               scales pure-Python engine work across cores.
+
+Admission is bounded: at most ``PIPELINE_WORKERS`` jobs run and at most
+``PIPELINE_MAX_QUEUE`` more wait. Beyond that ``submit()`` raises
+``QueueFullError`` immediately instead of letting latency grow unbounded.
+Background work (``submit_blocking()``) is only handed over when a worker
+is idle, so it never occupies the wait queue — that stays free for
+interactive requests.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+MODE_THREAD = "thread"
+MODE_PROCESS = "process"
+
+
+class QueueFullError(RuntimeError):
+    """Raised when every worker is busy and the wait queue is full."""
+
+
+class PipelineFuture(Future):
+    """
+    Future returned by ``submit()``. Resolves to the job's return value.
+
+    ``started()`` reports whether a worker has picked the job up;
+    ``started_at`` / ``submitted_at`` are wall-clock timestamps
+    (``started_at`` is filled in once the job finishes).
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.submitted_at: float = time.time()
+        self.started_at: float | None = None
+        self._inner: Future | None = None
+
+    def started(self) -> bool:
+        inner = self._inner
+        return self.done() or (inner is not None and (inner.running() or inner.done()))
+
+
+_executor: Executor | None = None
+_mode: str | None = None
+_lock = threading.Lock()
+_slot_freed = threading.Condition(_lock)
+
+# Counters (guarded by ``_lock``)
+_in_flight = 0
+_submitted = 0
+_completed = 0
+_failed = 0
+_rejected = 0
+_wait_total = 0.0
+_wait_max = 0.0
+_wait_last = 0.0
+
+
+# ---------------------------------------------------------------------------
+# Worker-side helpers (must be importable / picklable for process mode)
+# ---------------------------------------------------------------------------
+
+def _init_worker() -> None:
+    """Process-pool initializer — build this worker's vector store and model."""
+    logging.basicConfig(level=logging.INFO)
+    from app.core import model_loader, vector_store
+
+    vector_store.initialise()
+    if settings.EMBEDDING_WARMUP:
+        model_loader.warm_up()
+
+
+def _timed_call(fn: Callable, args: tuple, kwargs: dict) -> tuple[float, Any]:
+    # time.time() rather than perf_counter(): it must be comparable across
+    # processes to measure how long the job waited in the queue.
+    started_at = time.time()
+    return started_at, fn(*args, **kwargs)
+
+
+# ---------------------------------------------------------------------------
+# Lifecycle
+# ---------------------------------------------------------------------------
+
+def configured_mode() -> str:
+    """The executor mode requested in settings (unknown values mean ``thread``)."""
+    mode = settings.PIPELINE_EXECUTOR.strip().lower()
+    return mode if mode in (MODE_THREAD, MODE_PROCESS) else MODE_THREAD
+
+
+def _workers() -> int:
+    return max(1, settings.PIPELINE_WORKERS)
+
+
+def start() -> None:
+    """Create the executor (idempotent). Called from the FastAPI lifespan."""
+    global _executor, _mode  # noqa: PLW0603
+
+    with _lock:
+        if _executor is not None:
+            return
+        _mode = configured_mode()
+        if _mode == MODE_PROCESS:
+            _executor = ProcessPoolExecutor(
+                max_workers=_workers(),
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+            )
+        else:
+            _executor = ThreadPoolExecutor(
+                max_workers=_workers(), thread_name_prefix="pipeline",
+            )
+    logger.info(
+        "Pipeline executor started — mode=%s, workers=%d, max_queue=%d",
+        _mode, _workers(), settings.PIPELINE_MAX_QUEUE,
+    )
+
+
+def shutdown(wait: bool = True) -> None:
+    """Stop accepting work and release the workers."""
+    global _executor  # noqa: PLW0603
+
+    with _lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=wait, cancel_futures=True)
+        logger.info("Pipeline executor stopped")
+
+
+def uses_processes() -> bool:
+    """True when jobs run in a separate process (arguments must be picklable)."""
+    return (_mode or configured_mode()) == MODE_PROCESS
+
+
+# ---------------------------------------------------------------------------
+# Submission
+# ---------------------------------------------------------------------------
+
+def _record_done(outer: PipelineFuture, inner: Future) -> None:
+    global _in_flight, _completed, _failed  # noqa: PLW0603
+    global _wait_total, _wait_max, _wait_last  # noqa: PLW0603
+
+    with _lock:
+        _in_flight -= 1
+        if not inner.cancelled():
+            if inner.exception() is None:
+                _completed += 1
+            else:
+                _failed += 1
+        _slot_freed.notify()
+
+    if inner.cancelled():
+        outer.cancel()
+        return
+    exc = inner.exception()
+    if exc is not None:
+        if outer.set_running_or_notify_cancel():
+            outer.set_exception(exc)
+        return
+
+    started_at, result = inner.result()
+    outer.started_at = started_at
+    wait = max(0.0, started_at - outer.submitted_at)
+    with _lock:
+        _wait_total += wait
+        _wait_max = max(_wait_max, wait)
+        _wait_last = wait
+    if outer.set_running_or_notify_cancel():
+        outer.set_result(result)
+
+
+def _submit(
+    fn: Callable, args: tuple, kwargs: dict, timeout: float | None, block: bool,
+) -> PipelineFuture:
+    global _in_flight, _submitted, _rejected  # noqa: PLW0603
+
+    if _executor is None:
+        start()
+    # Blocking (background) callers only take a slot a worker can start on
+    capacity = _workers() if block else _workers() + max(0, settings.PIPELINE_MAX_QUEUE)
+    with _lock:
+        if block:
+            _slot_freed.wait_for(lambda: _in_flight < capacity, timeout=timeout)
+        if _in_flight >= capacity:
+            _rejected += 1
+            raise QueueFullError(
+                f"Analysis queue is full ({_in_flight} jobs in flight, capacity {capacity})"
+            )
+        _in_flight += 1
+        _submitted += 1
+
+    outer = PipelineFuture()
+    try:
+        inner = _executor.submit(_timed_call, fn, args, kwargs)
+    except Exception:
+        with _lock:
+            _in_flight -= 1
+            _slot_freed.notify()
+        raise
+    outer._inner = inner
+    inner.add_done_callback(lambda f: _record_done(outer, f))
+    outer.add_done_callback(lambda f: inner.cancel() if f.cancelled() else None)
+    return outer
+
+
+def submit(fn: Callable, /, *args: Any, **kwargs: Any) -> PipelineFuture:
+    """
+    Schedule ``fn(*args, **kwargs)`` on the pipeline executor.
+
+    In process mode ``fn`` and its arguments must be picklable.
+
+    Returns
+    -------
+    PipelineFuture
+        Resolves to ``fn``'s return value. Cancelling it cancels the job
+        if it has not started yet; a running job finishes in the background
+        and its result is discarded.
+
+    Raises
+    ------
+    QueueFullError
+        If ``PIPELINE_WORKERS`` jobs are running and ``PIPELINE_MAX_QUEUE``
+        more are already waiting.
+    """
+    return _submit(fn, args, kwargs, timeout=None, block=False)
+
+
+def submit_blocking(
+    fn: Callable, /, *args: Any, timeout: float | None = None, **kwargs: Any,
+) -> PipelineFuture:
+    """
+    Like ``submit()`` but wait up to ``timeout`` seconds (forever if None)
+    for an idle worker instead of failing immediately. Background jobs
+    never wait in the executor queue, so a backlog of them cannot push
+    interactive ``submit()`` calls into ``QueueFullError``. For background
+    dispatchers — never call this on the event loop.
+    """
+    return _submit(fn, args, kwargs, timeout=timeout, block=True)
+
+
+async def run(fn: Callable, /, *args: Any, **kwargs: Any) -> Any:
+    """Await ``fn(*args, **kwargs)`` on the executor without blocking the event loop."""
+    return await asyncio.wrap_future(submit(fn, *args, **kwargs))
+
+
+# ---------------------------------------------------------------------------
+# Introspection
+# ---------------------------------------------------------------------------
+
+def stats() -> dict:
+    """
+    Concurrency limits, current load and queue-wait times.
+
+    Returns
+    -------
+    dict
+        mode, workers, max_queue, in_flight, queued, submitted, completed,
+        failed, rejected, queue_wait_ms (last, avg, max)
+    """
+    with _lock:
+        finished = _completed
+        return {
+            "mode": _mode or configured_mode(),
+            "workers": _workers(),
+            "max_queue": settings.PIPELINE_MAX_QUEUE,
+            "in_flight": _in_flight,
+            "queued": max(0, _in_flight - _workers()),
+            "submitted": _submitted,
+            "completed": _completed,
+            "failed": _failed,
+            "rejected": _rejected,
+            "queue_wait_ms": {
+                "last": round(_wait_last * 1000, 2),
+                "avg": round(_wait_total / finished * 1000, 2) if finished else 0.0,
+                "max": round(_wait_max * 1000, 2),
+            },
+        }
@@ -0,0 +1,229 @@
+"""
+TalentIQ — Stage Scheduler
+Runs a pipeline expressed as a DAG of stages, executing every stage whose
+inputs are ready concurrently on a shared thread pool
+(``settings.STAGE_WORKERS``; ``1`` runs the stages sequentially in
+dependency order).
+
+Each ``Stage`` declares the names it ``requires`` — keys of the initial
+context or names of other stages — and receives exactly those values as a
+read-only mapping. Its return value becomes the value of its own name.
+A stage that raises yields ``{"_error": "<name> failed: …"}`` (the same
+fallback contract as ``AnalysisService._safe_call``), so one failing
+stage never aborts the others.
+
+``run()`` also returns a trace with per-stage timings and the critical
+path — the chain of dependent stages that determined the wall time.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import logging
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class Stage:
+    name: str
+    fn: Callable[[Mapping[str, Any]], Any]
+    requires: tuple[str, ...] = ()
+
+
+_pool: ThreadPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> ThreadPoolExecutor:
+    global _pool  # noqa: PLW0603
+
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ThreadPoolExecutor(
+                    max_workers=settings.STAGE_WORKERS, thread_name_prefix="stage",
+                )
+    return _pool
+
+
+def validate(stages: Sequence[Stage], context_keys: set[str] | frozenset[str]) -> None:
+    """
+    Check that names are unique, every requirement is satisfiable and the
+    graph is acyclic.
+
+    Raises
+    ------
+    ValueError
+        On a duplicate name, unknown requirement or dependency cycle.
+    """
+    names = [s.name for s in stages]
+    if len(names) != len(set(names)):
+        raise ValueError(f"Duplicate stage names in {names}")
+    known = set(names) | set(context_keys)
+    for stage in stages:
+        missing = [r for r in stage.requires if r not in known]
+        if missing:
+            raise ValueError(f"Stage {stage.name!r} requires unknown input(s) {missing}")
+    # Kahn's algorithm — anything left over sits on a cycle
+    if len(_topological_order(stages)) != len(stages):
+        raise ValueError("Stage graph contains a cycle")
+
+
+def _topological_order(stages: Sequence[Stage]) -> list[Stage]:
+    by_name = {s.name: s for s in stages}
+    indegree = {s.name: sum(r in by_name for r in s.requires) for s in stages}
+    dependants: dict[str, list[str]] = defaultdict(list)
+    for stage in stages:
+        for r in stage.requires:
+            if r in by_name:
+                dependants[r].append(stage.name)
+
+    ready = [s.name for s in stages if indegree[s.name] == 0]
+    order: list[Stage] = []
+    while ready:
+        name = ready.pop(0)
+        order.append(by_name[name])
+        for d in dependants[name]:
+            indegree[d] -= 1
+            if indegree[d] == 0:
+                ready.append(d)
+    return order
+
+
+def _call(stage: Stage, inputs: Mapping[str, Any]) -> tuple[Any, float, float]:
+    start = time.perf_counter()
+    try:
+        output = stage.fn(inputs)
+    except Exception as exc:
+        logger.exception("Stage [%s] failed: %s", stage.name, exc)
+        output = {"_error": f"{stage.name} failed: {exc}"}
+    return output, start, time.perf_counter()
+
+
+def _notify(callback: Callable[[str, Any], None] | None, name: str, output: Any) -> None:
+    if callback is None:
+        return
+    try:
+        callback(name, output)
+    except Exception:
+        logger.exception("on_stage_done callback failed for stage [%s]", name)
+
+
+def _inputs(stage: Stage, values: dict[str, Any]) -> Mapping[str, Any]:
+    return MappingProxyType({r: values[r] for r in stage.requires})
+
+
+def run(
+    stages: Sequence[Stage],
+    context: Mapping[str, Any],
+    on_stage_done: Callable[[str, Any], None] | None = None,
+) -> tuple[dict[str, Any], dict]:
+    """
+    Execute ``stages`` against ``context``.
+
+    ``on_stage_done(name, output)`` is called on the calling thread as
+    each stage finishes, in completion order. Exceptions it raises are
+    logged and ignored.
+
+    Returns
+    -------
+    tuple[dict, dict]
+        outputs — stage name → return value
+        trace   — mode, workers, wall_seconds, serial_seconds,
+                  stage_seconds, critical_path, critical_path_seconds
+    """
+    validate(stages, set(context))
+    by_name = {s.name: s for s in stages}
+    values: dict[str, Any] = dict(context)
+    spans: dict[str, tuple[float, float]] = {}
+    t0 = time.perf_counter()
+
+    if settings.STAGE_WORKERS <= 1:
+        mode = "sequential"
+        for stage in _topological_order(stages):
+            output, start, end = _call(stage, _inputs(stage, values))
+            values[stage.name] = output
+            spans[stage.name] = (start, end)
+            _notify(on_stage_done, stage.name, output)
+    else:
+        mode = "parallel"
+        pool = _get_pool()
+        waiting = {s.name: {r for r in s.requires if r in by_name} for s in stages}
+        dependants: dict[str, list[str]] = defaultdict(list)
+        for stage in stages:
+            for r in waiting[stage.name]:
+                dependants[r].append(stage.name)
+
+        running: dict[Future, str] = {}
+
+        def _submit(names: list[str]) -> None:
+            for name in names:
+                stage = by_name[name]
+                # Run in a copy of the caller's context so per-request state
+                # (e.g. metrics.collect_timings) follows the stage
+                ctx = contextvars.copy_context()
+                running[pool.submit(ctx.run, _call, stage, _inputs(stage, values))] = name
+
+        _submit([name for name, deps in waiting.items() if not deps])
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                output, start, end = future.result()
+                values[name] = output
+                spans[name] = (start, end)
+                ready = []
+                for d in dependants[name]:
+                    waiting[d].discard(name)
+                    if not waiting[d]:
+                        ready.append(d)
+                _submit(ready)
+                _notify(on_stage_done, name, output)
+
+    wall = time.perf_counter() - t0
+    outputs = {name: values[name] for name in by_name}
+    return outputs, _trace(by_name, spans, t0, wall, mode)
+
+
+def _trace(
+    by_name: dict[str, Stage],
+    spans: dict[str, tuple[float, float]],
+    t0: float,
+    wall: float,
+    mode: str,
+) -> dict:
+    path: list[str] = []
+    if spans:
+        # Walk back from the last stage to finish through whichever of its
+        # stage dependencies finished last
+        current = max(spans, key=lambda n: spans[n][1])
+        path.append(current)
+        while True:
+            deps = [r for r in by_name[current].requires if r in spans]
+            if not deps:
+                break
+            current = max(deps, key=lambda n: spans[n][1])
+            path.append(current)
+        path.reverse()
+
+    durations = {name: end - start for name, (start, end) in spans.items()}
+    return {
+        "mode": mode,
+        "workers": max(1, settings.STAGE_WORKERS),
+        "wall_seconds": round(wall, 4),
+        "serial_seconds": round(sum(durations.values()), 4),
+        "stage_seconds": {name: round(d, 4) for name, d in durations.items()},
+        "critical_path": path,
+        "critical_path_seconds": round(spans[path[-1]][1] - t0, 4) if path else 0.0,
+    }
@@ -1,27 +1,49 @@
 """
-TalentIQ — FAISS Vector Store
+TalentIQ — Role Vector Store
 Precomputes job-role embeddings from roles_database.json (primary) and
-job_roles_master.csv (legacy fallback) then builds a FAISS index for
-fast cosine-similarity search.
-
-Call ``initialise()`` once at application startup.
-After that, use ``search(query_vector, top_k)`` from any engine.
+job_roles_master.csv (legacy fallback) as one L2-normalised matrix.
+
+Call ``initialise()`` once at application startup. After that,
+``similarities(query)`` scores resume embedding(s) against every role in
+one matmul. Matching ranks the whole catalogue (hybrid scoring needs every
+role's score), so there is no top-k index: at this catalogue size an
+exhaustive inner product costs the same as a FAISS ``IndexFlatIP`` search.
+
+``initialise()`` also builds immutable lookup tables — case-insensitive
+role name → position, role id → position, and per-role skill/keyword
+tuples and frozensets — so every ``get_role*`` accessor is an O(1) dict
+hit that returns shared, read-only data instead of scanning the role list.
+``get_role_features()`` serves the same data as sparse role × vocabulary
+matrices plus experience arrays, and ``similarities()`` scores a resume
+against every role, for whole-catalogue scoring in one vectorised pass.
+
+The encoded role matrix is persisted under ``settings.CACHE_DIR``. The
+cache key hashes every composed role text plus the model name, embedding
+dimension, the backend that actually loaded and (for ONNX) the model file,
+so any dataset or model change invalidates it automatically; warm starts
+memory-map the matrix instead of re-encoding. Roles are encoded through
+``embedding_dispatcher`` (and so ``model_loader``) so they always share the
+backend used for resume embeddings — a quantized backend is loaded before
+the cache lookup, so a fallback to torch never meets int8 role vectors.
 """
 
 from __future__ import annotations
 
 import csv
-import json
+import hashlib
 import logging
+import os
 import time
+from collections.abc import Mapping
 from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
 
-import faiss
 import numpy as np
+from scipy import sparse
 
 from app.config import settings
-from app.core.model_loader import model
+from app.core import dataset_registry, embedding_dispatcher, model_loader
 
 logger = logging.getLogger(__name__)
 
@@ -43,15 +65,45 @@ class JobRole:
     years_experience_max: str
 
 
+@dataclass(frozen=True, slots=True)
+class _RoleTerms:
+    skills: tuple[str, ...]         # required + preferred, deduplicated, DB order
+    keywords: tuple[str, ...]
+    skill_set: frozenset[str]       # lower-cased, stripped — for overlap scoring
+    keyword_set: frozenset[str]
+
+
+_NO_TERMS = _RoleTerms((), (), frozenset(), frozenset())
+
+
+@dataclass(frozen=True, slots=True)
+class RoleFeatures:
+    """Role × vocabulary matrices for vectorised scoring; rows follow ``get_roles()``."""
+
+    skill_vocab: Mapping[str, int]      # lower-cased skill → column of ``skills``
+    skills: sparse.csr_matrix           # (N, |skill_vocab|) binary
+    skill_counts: np.ndarray            # (N,) distinct skills per role
+    keyword_vocab: Mapping[str, int]
+    keywords: sparse.csr_matrix
+    keyword_counts: np.ndarray
+    exp_min: np.ndarray                 # (N,) years (0 when unset)
+    exp_max: np.ndarray                 # (N,) years (2 × exp_min when unset)
+
+
 # ---------------------------------------------------------------------------
 # Module-level globals — populated once by ``initialise()``
 # ---------------------------------------------------------------------------
 
-_index: faiss.IndexFlatIP | None = None      # FAISS inner-product index
-_roles: list[JobRole] = []                    # parallel list (index ↔ role)
-_embeddings: np.ndarray | None = None         # (N, 384) matrix kept for debug
+_roles: tuple[JobRole, ...] = ()              # parallel to the matrix rows (position ↔ role)
+_embeddings: np.ndarray | None = None         # (N, 384) matrix (mmap on warm start)
 _ready: bool = False
-_roles_db: dict = {}                          # Full roles_database.json data
+_roles_db: Mapping[str, dict] = {}            # Shared roles_database.json view
+
+# Lookup tables (parallel to ``_roles``)
+_position_by_name: Mapping[str, int] = MappingProxyType({})   # lower-cased role_name
+_position_by_id: Mapping[str, int] = MappingProxyType({})
+_role_terms: tuple[_RoleTerms, ...] = ()
+_role_features: RoleFeatures | None = None
 
 
 # ---------------------------------------------------------------------------
@@ -86,11 +138,8 @@ def _compose_text(role: JobRole) -> str:
 
 def _load_roles_json(json_path: Path) -> list[JobRole]:
     """Load roles from roles_database.json — the comprehensive role DB."""
-    with open(json_path, encoding="utf-8") as fh:
-        data = json.load(fh)
-
     global _roles_db  # noqa: PLW0603
-    _roles_db = data.get("roles", {})
+    _roles_db = dataset_registry.get("roles_database")
 
     roles: list[JobRole] = []
     for role_key, info in _roles_db.items():
@@ -138,17 +187,160 @@ def _load_roles_csv(csv_path: Path) -> list[JobRole]:
     return list(seen.values())
 
 
+# ---------------------------------------------------------------------------
+# On-disk embedding cache
+# ---------------------------------------------------------------------------
+
+_CACHE_SUBDIR = "role_index"
+
+
+def _cache_key(texts: list[str], backend: str) -> str:
+    """Hash the composed role texts together with the model identity."""
+    digest = hashlib.sha256()
+    digest.update(settings.EMBEDDING_MODEL.encode("utf-8"))
+    digest.update(f"|dim={settings.EMBEDDING_DIM}|backend={backend}".encode("utf-8"))
+    if backend == model_loader.BACKEND_ONNX_INT8:
+        digest.update(f"|onnx={settings.ONNX_MODEL_FILE}".encode("utf-8"))
+    for text in texts:
+        digest.update(b"\x00")
+        digest.update(text.encode("utf-8"))
+    return digest.hexdigest()[:32]
+
+
+def _cache_path(key: str) -> Path:
+    return settings.CACHE_DIR / _CACHE_SUBDIR / f"roles_{key}.npy"
+
+
+def _load_cache(key: str, n_roles: int) -> np.ndarray | None:
+    """
+    Return the mmap'd embedding matrix for ``key`` or None on miss/corruption.
+    """
+    emb_path = _cache_path(key)
+    if not emb_path.exists():
+        return None
+    try:
+        embeddings = np.load(emb_path, mmap_mode="r")
+    except Exception as exc:
+        logger.warning("Ignoring unreadable role-embedding cache %s: %s", key, exc)
+        return None
+
+    expected = (n_roles, settings.EMBEDDING_DIM)
+    if embeddings.shape != expected or embeddings.dtype != np.float32:
+        logger.warning(
+            "Role-embedding cache %s has shape %s — expected %s; rebuilding",
+            key, embeddings.shape, expected,
+        )
+        return None
+    return embeddings
+
+
+def _save_cache(key: str, embeddings: np.ndarray) -> None:
+    """Atomically write the role matrix, dropping stale keys."""
+    emb_path = _cache_path(key)
+    cache_dir = emb_path.parent
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_emb = emb_path.with_suffix(f".npy.{os.getpid()}.tmp")
+        with open(tmp_emb, "wb") as fh:
+            np.save(fh, embeddings)
+        os.replace(tmp_emb, emb_path)
+    except OSError as exc:
+        logger.warning("Could not persist role-embedding cache: %s", exc)
+        return
+
+    # Older layouts also wrote roles_<key>.faiss — removed here with stale keys
+    for stale in cache_dir.glob("roles_*"):
+        if stale != emb_path and not stale.name.endswith(".tmp"):
+            try:
+                stale.unlink()
+            except OSError:
+                pass
+    logger.info("Role-embedding cache written → %s", emb_path.name)
+
+
+# ---------------------------------------------------------------------------
+# Role lookup tables
+# ---------------------------------------------------------------------------
+
+def _terms_for(info: Mapping | None) -> _RoleTerms:
+    if not info:
+        return _NO_TERMS
+    skills = tuple(dict.fromkeys(info.get("required_skills", []) + info.get("preferred_skills", [])))
+    keywords = tuple(info.get("keywords", []))
+    return _RoleTerms(
+        skills=skills,
+        keywords=keywords,
+        skill_set=frozenset(s.lower().strip() for s in skills),
+        keyword_set=frozenset(k.lower().strip() for k in keywords),
+    )
+
+
+def _binary_matrix(rows: list[frozenset[str]]) -> tuple[Mapping[str, int], sparse.csr_matrix, np.ndarray]:
+    """Vocabulary, (len(rows), |vocab|) 0/1 CSR matrix and per-row term counts."""
+    vocab: dict[str, int] = {}
+    indptr = [0]
+    indices: list[int] = []
+    for terms in rows:
+        indices.extend(vocab.setdefault(t, len(vocab)) for t in sorted(terms))
+        indptr.append(len(indices))
+    matrix = sparse.csr_matrix(
+        (np.ones(len(indices), dtype=np.float32), indices, indptr),
+        shape=(len(rows), len(vocab)),
+    )
+    counts = np.diff(matrix.indptr).astype(np.float32)
+    return MappingProxyType(vocab), matrix, counts
+
+
+def _years(value: str, default: float) -> float:
+    try:
+        return float(value) if value else default
+    except ValueError:
+        return default
+
+
+def _build_features() -> RoleFeatures:
+    skill_vocab, skills, skill_counts = _binary_matrix([t.skill_set for t in _role_terms])
+    keyword_vocab, keywords, keyword_counts = _binary_matrix([t.keyword_set for t in _role_terms])
+    exp_min = np.array([_years(r.years_experience_min, 0.0) for r in _roles], dtype=np.float64)
+    exp_max = np.array(
+        [_years(r.years_experience_max, lo * 2) for r, lo in zip(_roles, exp_min)],
+        dtype=np.float64,
+    )
+    for array in (skill_counts, keyword_counts, exp_min, exp_max):
+        array.flags.writeable = False
+    return RoleFeatures(
+        skill_vocab=skill_vocab, skills=skills, skill_counts=skill_counts,
+        keyword_vocab=keyword_vocab, keywords=keywords, keyword_counts=keyword_counts,
+        exp_min=exp_min, exp_max=exp_max,
+    )
+
+
+def _build_lookups() -> None:
+    """Index ``_roles`` by name and id; first occurrence wins, like the old scans."""
+    global _position_by_name, _position_by_id, _role_terms, _role_features  # noqa: PLW0603
+
+    by_name: dict[str, int] = {}
+    by_id: dict[str, int] = {}
+    for pos, role in enumerate(_roles):
+        by_name.setdefault(role.role_name.lower(), pos)
+        by_id.setdefault(role.role_id, pos)
+    _position_by_name = MappingProxyType(by_name)
+    _position_by_id = MappingProxyType(by_id)
+    _role_terms = tuple(_terms_for(_roles_db.get(role.role_id)) for role in _roles)
+    _role_features = _build_features()
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
 
 def initialise() -> None:
     """
-    Load roles → encode → build FAISS index.
+    Load roles → encode into the role matrix (or load it from the disk cache).
     Prefers roles_database.json; falls back to job_roles_master.csv.
     Safe to call multiple times; subsequent calls are no-ops.
     """
-    global _index, _roles, _embeddings, _ready  # noqa: PLW0603
+    global _roles, _embeddings, _ready  # noqa: PLW0603
 
     if _ready:
         logger.info("Vector store already initialised — skipping.")
@@ -159,9 +351,9 @@ def initialise() -> None:
     csv_path = settings.DATASETS_DIR / "job_roles_master.csv"
 
     if json_path.exists():
-        _roles = _load_roles_json(json_path)
+        _roles = tuple(_load_roles_json(json_path))
     elif csv_path.exists():
-        _roles = _load_roles_csv(csv_path)
+        _roles = tuple(_load_roles_csv(csv_path))
     else:
         raise FileNotFoundError(
             f"No role dataset found. Expected {json_path} or {csv_path}"
@@ -169,72 +361,92 @@ def initialise() -> None:
 
     if not _roles:
         raise ValueError("Role dataset contains no usable rows.")
+    _build_lookups()
 
-    # 2. Compose text & encode
+    # 2. Compose text → warm start from disk cache if the key still matches
     texts = [_compose_text(r) for r in _roles]
+    backend = model_loader.configured_backend()
+    if backend != model_loader.BACKEND_TORCH:
+        # A quantized backend falls back to torch if it cannot load — resolve
+        # that now so the cache is keyed on the backend that embeds resumes
+        model_loader.get_model()
+        backend = model_loader.active_backend() or backend
+    key = _cache_key(texts, backend)
+    cached = _load_cache(key, len(texts)) if settings.EMBEDDING_CACHE_ENABLED else None
+    if cached is not None:
+        _embeddings = cached
+        logger.info(
+            "Role-embedding cache hit (%s) — %d vectors memory-mapped, dim=%d",
+            key, *_embeddings.shape,
+        )
+        _ready = True
+        return
+
+    # 3. Encode — a quantized backend must first stay within the parity
+    #    tolerance on the role set, otherwise model_loader falls back to fp32
+    if backend != model_loader.BACKEND_TORCH and settings.EMBEDDING_PARITY_CHECK:
+        model_loader.check_parity(texts)
+
     logger.info("Encoding %d role descriptions …", len(texts))
     t0 = time.perf_counter()
-    _embeddings = model.encode(texts, show_progress_bar=False, normalize_embeddings=True)
-    _embeddings = np.asarray(_embeddings, dtype=np.float32)
+    _embeddings = embedding_dispatcher.encode(texts)
     elapsed = time.perf_counter() - t0
     logger.info("Encoded %d roles in %.2f s → matrix %s", len(texts), elapsed, _embeddings.shape)
 
-    # 3. Build FAISS inner-product index (cosine sim because vectors are L2-normed)
-    dim = _embeddings.shape[1]
-    _index = faiss.IndexFlatIP(dim)
-    _index.add(_embeddings)  # type: ignore[call-arg]
-    logger.info("FAISS index built — %d vectors, dim=%d", _index.ntotal, dim)
+    if settings.EMBEDDING_CACHE_ENABLED:
+        if model_loader.active_backend() == backend:
+            _save_cache(key, _embeddings)
+        else:
+            logger.warning(
+                "Not caching role embeddings — backend %s fell back to %s",
+                backend, model_loader.active_backend(),
+            )
 
     _ready = True
 
 
-def search(query_vector: np.ndarray, top_k: int | None = None) -> list[dict]:
+def similarities(query: np.ndarray) -> np.ndarray:
     """
-    Return the top-k most-similar job roles for a given resume embedding.
-
-    Parameters
-    ----------
-    query_vector : np.ndarray
-        1-D array of shape ``(384,)`` — the resume embedding.
-    top_k : int, optional
-        Number of results (default ``settings.TOP_K_ROLES``).
+    Cosine similarity of resume embedding(s) to every role (role vectors
+    are L2-normalised; the query is normalised here).
 
     Returns
     -------
-    list[dict]
-        Each dict has ``role``, ``score``, and ``rank`` keys.
+    np.ndarray
+        ``(N_roles,)`` for a 1-D query, ``(Q, N_roles)`` for a ``(Q, 384)`` matrix.
     """
-    if not _ready or _index is None:
+    if not _ready or _embeddings is None:
         raise RuntimeError("Vector store not initialised. Call initialise() first.")
 
-    if top_k is None:
-        top_k = settings.TOP_K_ROLES
-    top_k = min(top_k, _index.ntotal)
+    qm = np.asarray(query, dtype=np.float32)
+    single = qm.ndim == 1
+    qm = qm.reshape(1, -1) if single else qm
+    norms = np.linalg.norm(qm, axis=1, keepdims=True)
+    qm = np.divide(qm, norms, out=np.zeros_like(qm), where=norms > 0)
+    scores = qm @ _embeddings.T
+    return scores[0] if single else scores
 
-    # Normalise the query vector for cosine similarity via inner product
-    qv = np.asarray(query_vector, dtype=np.float32).reshape(1, -1)
-    faiss.normalize_L2(qv)
 
-    scores, indices = _index.search(qv, top_k)  # type: ignore[call-arg]
+def get_role_features() -> RoleFeatures | None:
+    """Sparse skill/keyword matrices and experience arrays for every role (shared)."""
+    return _role_features
 
-    results: list[dict] = []
-    for rank, (idx, score) in enumerate(zip(indices[0], scores[0]), start=1):
-        role = _roles[int(idx)]
-        results.append({
-            "rank": rank,
-            "role_name": role.role_name,
-            "role_category": role.role_category,
-            "role_level": role.role_level,
-            "domain": role.domain,
-            "industry_sector": role.industry_sector,
-            "score": round(float(score), 4),
-        })
-    return results
 
+def get_roles() -> tuple[JobRole, ...]:
+    """Return the deduplicated roles, in matrix row order (shared, immutable)."""
+    return _roles
 
-def get_roles() -> list[JobRole]:
-    """Return the deduplicated role list (for inspection / other engines)."""
-    return list(_roles)
+
+def get_role(role_name: str) -> JobRole | None:
+    """Look up a role by name (case-insensitive)."""
+    pos = _position_by_name.get(role_name.lower())
+    return None if pos is None else _roles[pos]
+
+
+def get_role_by_id(role_id: str) -> JobRole | None:
+    """Look up a role by its ``role_id`` (the roles_database.json key)."""
+    pos = _position_by_id.get(role_id)
+    return None if pos is None else _roles[pos]
 
 
 def get_embeddings() -> np.ndarray | None:
@@ -247,8 +459,8 @@ def is_ready() -> bool:
     return _ready
 
 
-def get_roles_db() -> dict:
-    """Return the full roles database dict (from JSON)."""
+def get_roles_db() -> Mapping[str, dict]:
+    """Return the full roles database (read-only view shared via dataset_registry)."""
     return _roles_db
 
 
@@ -259,10 +471,13 @@ def get_role_names() -> list[str]:
 
 def get_role_info(role_name: str) -> dict | None:
     """Look up a role's full info from the JSON database by name."""
-    for _key, info in _roles_db.items():
-        if info["role_name"].lower() == role_name.lower():
-            return info
-    return None
+    role = get_role(role_name)
+    return _roles_db.get(role.role_id) if role else None
+
+
+def _terms(role_name: str) -> _RoleTerms:
+    pos = _position_by_name.get(role_name.lower())
+    return _NO_TERMS if pos is None else _role_terms[pos]
 
 
 def get_default_jd(role_name: str) -> str:
@@ -273,15 +488,19 @@ def get_default_jd(role_name: str) -> str:
 
 def get_role_skills(role_name: str) -> list[str]:
     """Return required + preferred skills for a role from the JSON DB."""
-    info = get_role_info(role_name)
-    if not info:
-        return []
-    required = info.get("required_skills", [])
-    preferred = info.get("preferred_skills", [])
-    return list(dict.fromkeys(required + preferred))  # deduplicated, order preserved
+    return list(_terms(role_name).skills)  # deduplicated, order preserved
 
 
 def get_role_keywords(role_name: str) -> list[str]:
     """Return keywords for a role from the JSON DB."""
-    info = get_role_info(role_name)
-    return info.get("keywords", []) if info else []
+    return list(_terms(role_name).keywords)
+
+
+def get_role_skill_set(role_name: str) -> frozenset[str]:
+    """Lower-cased, stripped required + preferred skills (shared, for overlap scoring)."""
+    return _terms(role_name).skill_set
+
+
+def get_role_keyword_set(role_name: str) -> frozenset[str]:
+    """Lower-cased, stripped role keywords (shared, for overlap scoring)."""
+    return _terms(role_name).keyword_set
@@ -15,6 +15,8 @@ from __future__ import annotations
 import logging
 import re
 
+from app.core.parsed_resume import ParsedResume
+
 logger = logging.getLogger(__name__)
 
 
@@ -83,7 +85,7 @@ class ATSSimulationEngine:
 
     def simulate(
         self,
-        resume_text: str,
+        resume_text: str | ParsedResume,
         target_keywords: list[str] | None = None,
     ) -> dict:
         """
@@ -98,12 +100,12 @@ class ATSSimulationEngine:
         """
         try:
             logger.info("Running ATS simulation")
-            text_lower = resume_text.lower()
+            resume = ParsedResume.of(resume_text)
 
-            keyword_report = self._keyword_analysis(text_lower, target_keywords or [])
-            formatting = self._formatting_check(resume_text)
-            sections = self._section_completeness(text_lower)
-            readability = self._readability_analysis(resume_text)
+            keyword_report = self._keyword_analysis(resume, target_keywords or [])
+            formatting = self._formatting_check(resume.text)
+            sections = self._section_completeness(resume.lower)
+            readability = self._readability_analysis(resume)
             alerts = self._generate_alerts(keyword_report, formatting, sections, readability)
             ats_score = self._compute_ats_score(keyword_report, formatting, sections, readability)
 
@@ -132,7 +134,7 @@ class ATSSimulationEngine:
     # Keyword Analysis — returns flat format
     # -----------------------------------------------------------------
 
-    def _keyword_analysis(self, text: str, target_keywords: list[str]) -> dict:
+    def _keyword_analysis(self, resume: ParsedResume, target_keywords: list[str]) -> dict:
         """
         Returns
         -------
@@ -140,7 +142,8 @@ class ATSSimulationEngine:
             found: list[str], missing: list[str], density: float,
             coverage_percent: float
         """
-        word_count = max(len(text.split()), 1)
+        text = resume.lower
+        word_count = max(resume.word_count, 1)
         found: list[str] = []
         missing: list[str] = []
         total_kw_occurrences = 0
@@ -197,7 +200,7 @@ class ATSSimulationEngine:
     # Readability — returns flat dict with standard keys
     # -----------------------------------------------------------------
 
-    def _readability_analysis(self, text: str) -> dict:
+    def _readability_analysis(self, resume: ParsedResume) -> dict:
         """
         Returns
         -------
@@ -205,18 +208,15 @@ class ATSSimulationEngine:
             score, bullet_count, action_verb_count, quantified_achievements,
             word_count, sentence_count, avg_sentence_length
         """
-        sentences = [s.strip() for s in re.split(r"[.!?]+", text) if s.strip()]
-        words = text.split()
-        word_count = len(words)
+        sentences = resume.sentences
+        word_count = resume.word_count
 
         avg_sentence_len = (
             round(word_count / len(sentences), 1) if sentences else 0
         )
         long_sentences = sum(1 for s in sentences if len(s.split()) > 25)
 
-        bullet_count = len(
-            re.findall(r"^[\s]*[•\-\*\u2022\u25CF]", text, re.MULTILINE)
-        )
+        bullet_count = len(resume.bullets)
 
         action_verbs = [
             "developed", "designed", "implemented", "managed", "led", "created",
@@ -224,15 +224,14 @@ class ATSSimulationEngine:
             "increased", "launched", "established", "coordinated", "analyzed",
             "automated", "streamlined", "spearheaded", "architected", "mentored",
         ]
-        lines = [ln.strip().lower() for ln in text.split("\n") if ln.strip()]
         action_verb_count = sum(
-            1 for line in lines
+            1 for line in resume.lines
             if any(line.startswith(v) for v in action_verbs)
         )
 
         quantified = len(re.findall(
             r"\d+%|\$\d+|\d+\+?\s*(?:users|clients|projects|team|customers|revenue|sales)",
-            text,
+            resume.text,
             re.IGNORECASE,
         ))
 
@@ -57,11 +57,10 @@ class CareerPathEngine:
             current_info = roles_db.get(current_role_id)
             if not current_info:
                 # Try matching by role_name
-                for key, info in roles_db.items():
-                    if info["role_name"].lower() == current_role_id.lower():
-                        current_info = info
-                        current_role_id = key
-                        break
+                role = vector_store.get_role(current_role_id)
+                if role is not None:
+                    current_info = roles_db.get(role.role_id)
+                    current_role_id = role.role_id
 
             if not current_info:
                 return {"current_role": current_role_id, "paths": [], "count": 0}
@@ -70,11 +69,7 @@ class CareerPathEngine:
             current_category = current_info.get("category", "")
             current_level = current_info.get("level", "Mid")
             current_domain = current_info.get("domain", "")
-            current_skills = set(
-                s.lower()
-                for s in current_info.get("required_skills", [])
-                + current_info.get("preferred_skills", [])
-            )
+            current_skills = vector_store.get_role_skill_set(current_name)
             current_rank = _LEVEL_RANK.get(current_level, 1)
 
             candidates: list[dict] = []
@@ -87,11 +82,7 @@ class CareerPathEngine:
                 target_category = info.get("category", "")
                 target_level = info.get("level", "Mid")
                 target_domain = info.get("domain", "")
-                target_skills = set(
-                    s.lower()
-                    for s in info.get("required_skills", [])
-                    + info.get("preferred_skills", [])
-                )
+                target_skills = vector_store.get_role_skill_set(target_name)
                 target_rank = _LEVEL_RANK.get(target_level, 1)
 
                 # ── Scoring logic ────────────────────────────────
@@ -12,9 +12,9 @@ from __future__ import annotations
 
 import logging
 
-import pandas as pd
+import numpy as np
 
-from app.config import settings
+from app.core import dataset_registry, dataset_snapshot
 
 logger = logging.getLogger(__name__)
 
@@ -147,42 +147,38 @@ class CertificationEngine:
     }
 
     def __init__(self) -> None:
-        skills_path = settings.DATASETS_DIR / "skills_master.csv"
-        certs_path = settings.DATASETS_DIR / "certification_master.csv"
+        # Build skill_name → skill_id lookup (first occurrence per name, CSV order)
+        self._name_to_id: dict[str, str] = {}
+        try:
+            skills = dataset_registry.get("skills_master")
+            order = np.argsort(skills["first_seen"], kind="stable")
+            self._name_to_id = dict(zip(
+                skills["skill_lower"][order].tolist(),
+                skills["skill_id"][order].tolist(),
+            ))
+        except Exception:
+            logger.warning("Could not load skills_master.csv — only role-based certifications available")
 
-        skills_df = pd.read_csv(skills_path)
-        certs_df = pd.read_csv(certs_path)
+        # Group certifications by related_skill_id. The snapshot is already
+        # deduplicated per (cert_name, related_skill_id) and sorted by
+        # recognition score, so each list stays highest-recognition first.
+        certs = dataset_snapshot.load("certification_master")
+        self._certs_by_skill: dict[str, list[tuple]] = {}
+        for row in zip(
+            certs["related_skill_id"].tolist(),
+            certs["certification_name"].tolist(),
+            certs["provider"].tolist(),
+            certs["difficulty_level"].tolist(),
+            certs["average_cost"].tolist(),
+            certs["duration_months"].tolist(),
+            certs["global_recognition_score"].tolist(),
+        ):
+            self._certs_by_skill.setdefault(row[0], []).append(row[1:])
 
-        # Build skill_name → skill_id lookup (median aggregation for duplicates)
-        skills_df["skill_lower"] = skills_df["skill_name"].str.lower().str.strip()
-        skills_df["skill_id"] = skills_df["skill_id"].astype(str).str.strip()
-        
-        # Keep first occurrence per skill name (consistent with other engines)
-        skill_map = (
-            skills_df.drop_duplicates(subset=["skill_lower"], keep="first")
-            .set_index("skill_lower")["skill_id"]
-            .to_dict()
-        )
-        # Type cast to fix Hashable->str type error
-        self._name_to_id: dict[str, str] = {str(k): str(v) for k, v in skill_map.items()}
-
-        # Normalize cert data
-        certs_df["related_skill_id"] = certs_df["related_skill_id"].astype(str).str.strip()
-        certs_df["global_recognition_score"] = pd.to_numeric(
-            certs_df["global_recognition_score"], errors="coerce"
-        ).fillna(0)
-
-        # Deduplicate: keep highest-recognition entry per (cert_name, related_skill_id)
-        self.certs = (
-            certs_df.sort_values("global_recognition_score", ascending=False)
-            .drop_duplicates(subset=["certification_name", "related_skill_id"], keep="first")
-            .reset_index(drop=True)
-        )
-        
         logger.info(
             "CertificationEngine: %d skill mappings, %d certifications loaded",
             len(self._name_to_id),
-            len(self.certs),
+            len(certs["certification_name"]),
         )
 
     def suggest(self, missing_skills: list[str], role_name: str | None = None) -> dict:
@@ -331,21 +327,19 @@ class CertificationEngine:
         self, skill_id: str, skill_name: str
     ) -> list[dict]:
         """Get all certifications for a given skill_id."""
-        matches = self.certs[self.certs["related_skill_id"] == skill_id]
-        certs = []
-        
-        for _, row in matches.iterrows():
-            certs.append({
-                "certification": row["certification_name"],
-                "provider": row["provider"],
+        return [
+            {
+                "certification": name,
+                "provider": provider,
                 "for_skill": skill_name,
-                "difficulty": row["difficulty_level"],
-                "cost_usd": int(row["average_cost"]),
-                "duration_months": int(row["duration_months"]),
-                "recognition_score": round(float(row["global_recognition_score"]), 2),
-            })
-        
-        return certs
+                "difficulty": difficulty,
+                "cost_usd": int(cost),
+                "duration_months": int(duration),
+                "recognition_score": round(float(recognition), 2),
+            }
+            for name, provider, difficulty, cost, duration, recognition
+            in self._certs_by_skill.get(skill_id, [])
+        ]
 
     def _extract_domains(self, skills: list[str]) -> set[str]:
         """
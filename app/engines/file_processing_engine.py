@@ -2,32 +2,61 @@
 TalentIQ — Engine 1: File Processing Engine
 Extracts raw text from PDF and DOCX resume files.
 Handles tables, text boxes, headers/footers — not just paragraphs.
+
+Documents beyond ``MAX_PDF_PAGES`` pages or ``MAX_EXTRACTED_CHARS``
+characters are rejected with ``DocumentLimitError`` before (PDF) or while
+(text) they are processed, so one oversized file cannot pin a worker.
 """
 
 from __future__ import annotations
 
+import io
 import logging
+import os
+from typing import BinaryIO
 from xml.etree import ElementTree
 
 import pdfplumber
 from docx import Document
 
+from app.config import settings
+
 logger = logging.getLogger(__name__)
 
 
+class DocumentLimitError(ValueError):
+    """Raised when a document exceeds the page or extracted-text limits (HTTP 422)."""
+
+
+def _check_chars(count: int) -> None:
+    if count > settings.MAX_EXTRACTED_CHARS:
+        raise DocumentLimitError(
+            f"Document text exceeds {settings.MAX_EXTRACTED_CHARS:,} characters"
+        )
+
+
 class FileProcessingEngine:
     """Extract raw text from uploaded resume files."""
 
     SUPPORTED = {".pdf", ".docx"}
 
-    def extract_text(self, file_path: str) -> str:
+    def extract_text(
+        self,
+        source: str | os.PathLike | bytes | BinaryIO,
+        filename: str | None = None,
+    ) -> str:
         """
         Extract all readable text from a resume file.
 
         Parameters
         ----------
-        file_path : str
-            Path to the PDF or DOCX file.
+        source : str | PathLike | bytes | BinaryIO
+            Path to the file, its raw bytes, or a readable binary file
+            object (e.g. an upload's spooled buffer). In-memory sources are
+            parsed directly — nothing is written to disk.
+        filename : str, optional
+            Name used to detect the format. Required for bytes and file
+            objects; defaults to the path for path sources.
 
         Returns
         -------
@@ -38,46 +67,63 @@ class FileProcessingEngine:
         ------
         ValueError
             If the file format is not supported.
+        DocumentLimitError
+            If the document exceeds ``MAX_PDF_PAGES`` or ``MAX_EXTRACTED_CHARS``.
         RuntimeError
             If text extraction fails.
         """
-        logger.info("Extracting text from %s", file_path)
-        path_lower = file_path.lower()
+        is_path = isinstance(source, (str, os.PathLike))
+        name = filename or (os.fspath(source) if is_path else "<upload>")
+        logger.info("Extracting text from %s", name)
+        path_lower = name.lower()
+
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            source = io.BytesIO(source)
+        elif is_path:
+            source = os.fspath(source)
 
         try:
             if path_lower.endswith(".pdf"):
-                return self._extract_pdf(file_path)
+                return self._extract_pdf(source)
             elif path_lower.endswith(".docx"):
-                return self._extract_docx(file_path)
+                return self._extract_docx(source)
             else:
                 raise ValueError(
-                    f"Unsupported file format: {file_path}. "
+                    f"Unsupported file format: {name}. "
                     f"Supported: {', '.join(self.SUPPORTED)}"
                 )
         except (ValueError, FileNotFoundError):
             raise
         except Exception as exc:
-            logger.exception("Text extraction failed for %s", file_path)
+            logger.exception("Text extraction failed for %s", name)
             raise RuntimeError(
-                f"Failed to extract text from {file_path}: {exc}"
+                f"Failed to extract text from {name}: {exc}"
             ) from exc
 
     # ------------------------------------------------------------------
 
     @staticmethod
-    def _extract_pdf(file_path: str) -> str:
+    def _extract_pdf(source: str | BinaryIO) -> str:
         pages: list[str] = []
-        with pdfplumber.open(file_path) as pdf:
+        chars = 0
+        with pdfplumber.open(source) as pdf:
+            if len(pdf.pages) > settings.MAX_PDF_PAGES:
+                raise DocumentLimitError(
+                    f"PDF has {len(pdf.pages)} pages — the limit is {settings.MAX_PDF_PAGES}"
+                )
             for page in pdf.pages:
                 text = page.extract_text()
                 if text:
                     pages.append(text)
+                    chars += len(text)
                 # Also try extracting from tables
                 for table in (page.extract_tables() or []):
                     for row in (table or []):
                         cells = [str(c).strip() for c in (row or []) if c]
                         if cells:
                             pages.append(" | ".join(cells))
+                            chars += len(pages[-1])
+                _check_chars(chars)
         result = "\n".join(pages)
         logger.info("PDF extracted: %d chars from %d page-blocks", len(result), len(pages))
         if not result.strip():
@@ -85,29 +131,42 @@ class FileProcessingEngine:
         return result
 
     @staticmethod
-    def _extract_docx(file_path: str) -> str:
+    def _extract_docx(source: str | BinaryIO) -> str:
         """
         Extract text from DOCX including:
         - Regular paragraphs
         - Tables (cells)
         - Text boxes / shapes (via XML fallback)
         - Headers and footers
+
+        Blocks are deduplicated as they are collected (the XML fallback may
+        re-capture paragraphs) and the running length is checked against
+        ``MAX_EXTRACTED_CHARS`` after each one, so a small but highly
+        compressible DOCX is rejected before all of its text is joined.
         """
-        doc = Document(file_path)
-        parts: list[str] = []
+        doc = Document(source)
+        parts: dict[str, None] = {}     # insertion-ordered set of text blocks
+        chars = 0
+
+        def add(text: str) -> None:
+            nonlocal chars
+            if text not in parts:
+                parts[text] = None
+                chars += len(text) + (1 if len(parts) > 1 else 0)   # + "\n" separator
+                _check_chars(chars)
 
         # 1. Paragraphs (the standard approach)
         for p in doc.paragraphs:
             text = p.text.strip()
             if text:
-                parts.append(text)
+                add(text)
 
         # 2. Tables — many resumes are table-based layouts
         for table in doc.tables:
             for row in table.rows:
                 cells = [cell.text.strip() for cell in row.cells if cell.text.strip()]
                 if cells:
-                    parts.append(" | ".join(cells))
+                    add(" | ".join(cells))
 
         # 3. Headers and footers (often contain name/contact info)
         for section in doc.sections:
@@ -116,7 +175,7 @@ class FileProcessingEngine:
                     for p in header_footer.paragraphs:
                         text = p.text.strip()
                         if text:
-                            parts.append(text)
+                            add(text)
 
         # 4. Text boxes / shapes — extract from raw XML
         #    Many designed resumes put content in text boxes
@@ -134,24 +193,18 @@ class FileProcessingEngine:
             for t_elem in root.iter("{http://schemas.openxmlformats.org/wordprocessingml/2006/main}t"):
                 txt = (t_elem.text or "").strip()
                 if txt and len(txt) > 1:
-                    parts.append(txt)
+                    add(txt)
+        except DocumentLimitError:
+            raise
         except Exception:
             pass  # XML fallback is best-effort
 
-        # Deduplicate while preserving order (XML fallback may re-capture paragraphs)
-        seen: set[str] = set()
-        unique_parts: list[str] = []
-        for part in parts:
-            if part not in seen:
-                unique_parts.append(part)
-                seen.add(part)
-
-        result = "\n".join(unique_parts)
+        result = "\n".join(parts)
         logger.info(
             "DOCX extracted: %d chars from %d text blocks "
             "(paragraphs=%d, tables=%d, sections=%d)",
             len(result),
-            len(unique_parts),
+            len(parts),
             len(doc.paragraphs),
             len(doc.tables),
             len(doc.sections),
@@ -14,9 +14,7 @@ from __future__ import annotations
 
 import logging
 
-import pandas as pd
-
-from app.config import settings
+from app.core import dataset_registry
 
 logger = logging.getLogger(__name__)
 
@@ -30,40 +28,27 @@ class IndustryInsightEngine:
     """Calculate market-demand alignment for a candidate's skills."""
 
     def __init__(self) -> None:
-        csv_path = settings.DATASETS_DIR / "skills_master.csv"
-        self._skills_df: pd.DataFrame | None = None
         self._skills_lookup: dict[str, dict] = {}
 
         try:
-            df = pd.read_csv(csv_path)
-            df["skill_lower"] = df["skill_name"].str.lower().str.strip()
-            df["demand_score"] = pd.to_numeric(df["demand_score"], errors="coerce").fillna(0)
-            df["global_trend_score"] = pd.to_numeric(
-                df["global_trend_score"], errors="coerce"
-            ).fillna(0)
-            df["is_emerging"] = df["is_emerging"].str.strip().str.lower() == "yes"
-
-            # ── Deduplicate using MEDIAN demand score (not MAX) ──────────
+            # ── Deduplicated using MEDIAN demand score (not MAX) ─────────
             # Skills appear with many different demand scores in CSV
-            # Taking max gives 100 to everyone; median is more realistic
-            deduped = (
-                df.groupby("skill_lower", as_index=False)
-                .agg({
-                    "skill_name": "first",
-                    "demand_score": "median",  # Use median, not max
-                    "global_trend_score": "median",
-                    "is_emerging": lambda x: x.mode()[0] if len(x.mode()) > 0 else False
-                })
-            )
-            self._skills_df = deduped
+            # Taking max gives 100 to everyone; median is more realistic.
+            # The compiled snapshot already holds one median row per skill.
+            skills = dataset_registry.get("skills_master")
             self._skills_lookup = {
-                row["skill_lower"]: {
-                    "demand_score": float(row["demand_score"]),
-                    "global_trend": float(row["global_trend_score"]),
-                    "is_emerging": bool(row["is_emerging"]),
-                    "name": row["skill_lower"],
+                name: {
+                    "demand_score": demand,
+                    "global_trend": trend,
+                    "is_emerging": emerging,
+                    "name": name,
                 }
-                for _, row in deduped.iterrows()
+                for name, demand, trend, emerging in zip(
+                    skills["skill_lower"].tolist(),
+                    skills["demand_score"].tolist(),
+                    skills["global_trend_score"].tolist(),
+                    skills["is_emerging"].tolist(),
+                )
             }
             logger.info("IndustryInsightEngine: loaded %d unique skills", len(self._skills_lookup))
         except Exception:
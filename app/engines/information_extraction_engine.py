@@ -11,18 +11,27 @@ Design principle: extract what is ACTUALLY in the resume, never fabricate.
 
 from __future__ import annotations
 
-import json
 import logging
 import re
 from datetime import datetime
 from pathlib import Path
 
-import pandas as pd
-
-from app.config import settings
+from app.core import dataset_registry
+from app.core.aho_corasick import AhoCorasick
+from app.core.parsed_resume import ParsedResume
 
 logger = logging.getLogger(__name__)
 
+_SEPARATOR_RUN = re.compile(r"[\s/\-]+")
+_ASCII_LETTERS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ")
+_LETTER_RUN = re.compile(r"[a-z]+")
+_WORD_CHAR = re.compile(r"\w")
+
+
+def _normalize_separators(text: str) -> str:
+    """Collapse runs of whitespace, "/" and "-" to one space ("ci/cd" → "ci cd")."""
+    return _SEPARATOR_RUN.sub(" ", text).strip()
+
 
 # ═══════════════════════════════════════════════════════════════════════
 # Comprehensive built-in skill vocabulary  (PRIMARY source)
@@ -168,29 +177,6 @@ _BUILTIN_SKILLS: set[str] = {
 }
 
 
-def _load_role_skills() -> set[str]:
-    """Load required + preferred skills from roles_database.json.
-    
-    NOTE: We deliberately exclude role 'keywords' — those are generic 
-    domain terms (e.g. 'deployment', 'compliance', 'operations') that 
-    would match too broadly and produce false-positive skill detections.
-    """
-    extra: set[str] = set()
-    try:
-        json_path = settings.DATASETS_DIR / "roles_database.json"
-        if json_path.exists():
-            with open(json_path, encoding="utf-8") as fh:
-                data = json.load(fh)
-            for _key, info in data.get("roles", {}).items():
-                for s in info.get("required_skills", []):
-                    extra.add(s.lower().strip())
-                for s in info.get("preferred_skills", []):
-                    extra.add(s.lower().strip())
-    except Exception:
-        logger.warning("Could not load role skills from roles_database.json")
-    return extra
-
-
 class InformationExtractionEngine:
     """
     Extract skills, education, experience, and keywords
@@ -201,15 +187,20 @@ class InformationExtractionEngine:
         # 1. Start with comprehensive built-in skill list
         all_skills: set[str] = set(_BUILTIN_SKILLS)
 
-        # 2. Add skills from roles_database.json (so we can match them)
-        all_skills.update(_load_role_skills())
+        # 2. Add required + preferred skills from roles_database.json so we
+        #    can match them. Role 'keywords' are deliberately excluded — they
+        #    are generic domain terms (e.g. 'deployment', 'compliance') that
+        #    would produce false-positive skill detections.
+        try:
+            all_skills.update(dataset_registry.get("role_skills"))
+        except Exception:
+            logger.warning("Could not load role skills from roles_database.json")
 
         # 3. Supplement with CSV (if anything extra there)
-        skills_path = settings.DATASETS_DIR / "skills_master.csv"
         try:
-            df = pd.read_csv(skills_path)
-            csv_skills = df["skill_name"].dropna().str.lower().str.strip().unique()
-            all_skills.update(s for s in csv_skills if len(s) > 1)
+            all_skills.update(
+                s for s in dataset_registry.get("skill_names") if len(s) > 1
+            )
         except Exception:
             pass
 
@@ -233,6 +224,23 @@ class InformationExtractionEngine:
             reverse=True,
         )
 
+        # One automaton over the separator-normalised forms of every multi-word
+        # and special-char skill: a single pass over the text finds them all
+        self._skill_forms: dict[str, list[str]] = {}
+        for skill in (*self.special_skills, *self.multi_word_skills):
+            form = _normalize_separators(skill)
+            if form and skill not in self._skill_forms.setdefault(form, []):
+                self._skill_forms[form].append(skill)
+        self._skill_matcher = AhoCorasick(self._skill_forms)
+
+        # Vocabulary for ALL-CAPS tokens (AWS, SQL, CI/CD)
+        self._upper_token_skills = frozenset(self.single_word_skills | _BUILTIN_SKILLS)
+
+        # Domain keyword index: token trie + the bigrams it can yield directly
+        self._keyword_trie, self._keyword_bigrams = self._compile_keyword_index(
+            self.DOMAIN_KEYWORDS, self._KEYWORD_STOP
+        )
+
         logger.info(
             "InformationExtraction: %d single + %d multi + %d special skills ready",
             len(self.single_word_skills),
@@ -244,7 +252,7 @@ class InformationExtractionEngine:
     # Public API
     # ------------------------------------------------------------------
 
-    def extract(self, text: str) -> dict:
+    def extract(self, text: str | ParsedResume) -> dict:
         """
         Extract structured profile from resume text.
 
@@ -256,7 +264,8 @@ class InformationExtractionEngine:
             experience: dict     — {"max_years", "years_mentioned", "job_titles", "date_ranges"}
             keywords : list[str] — domain keywords actually present in the text
         """
-        text_lower = text.lower()
+        resume = ParsedResume.of(text)
+        text, text_lower = resume.text, resume.lower
         return {
             "skills": self._extract_skills(text, text_lower),
             "education": self._extract_education(text),
@@ -284,22 +293,18 @@ class InformationExtractionEngine:
         """Find skills actually mentioned in the resume text."""
         found: set[str] = set()
 
-        # 1. Special-char skills (c++, c#, .net, node.js, etc.)
-        for skill in self.special_skills:
-            escaped = re.escape(skill)
-            if re.search(r"(?<![a-zA-Z])" + escaped + r"(?![a-zA-Z])", text_lower):
-                found.add(skill)
-
-        # 2. Multi-word skills — regex boundary match (longer first)
-        for skill in self.multi_word_skills:
-            # Allow flexible separators: "ci/cd", "ci cd", "ci-cd" all match
-            pattern_str = re.escape(skill)
-            # Make / and - and space interchangeable
-            pattern_str = pattern_str.replace(r"\-", r"[\s/\-]")
-            pattern_str = pattern_str.replace(r"\/", r"[\s/\-]")
-            pattern_str = pattern_str.replace(r"\ ", r"[\s/\-]+")
-            if re.search(r"(?<![a-zA-Z])" + pattern_str + r"(?![a-zA-Z])", text_lower):
-                found.add(skill)
+        # 1-2. Special-char (c++, c#, .net, node.js) and multi-word skills —
+        #      one automaton pass. Separators are folded on both sides, so
+        #      "ci/cd", "ci cd" and "ci-cd" all match; a hit must not touch
+        #      a letter on either side.
+        normalized = _normalize_separators(text_lower)
+        last = len(normalized)
+        for start, end, form in self._skill_matcher.iter_matches(normalized):
+            if (start and normalized[start - 1] in _ASCII_LETTERS) or (
+                end < last and normalized[end] in _ASCII_LETTERS
+            ):
+                continue
+            found.update(self._skill_forms[form])
 
         # 3. Single-word skills — tokenize text and intersect
         tokens = set(re.findall(r"\b[a-z][a-z+#.]{1,}\b", text_lower))
@@ -309,7 +314,7 @@ class InformationExtractionEngine:
         upper_tokens = set(re.findall(r"\b[A-Z][A-Z+#./]{1,}\b", text))
         for tok in upper_tokens:
             low = tok.lower()
-            if low in self.single_word_skills or low in {s for s in _BUILTIN_SKILLS}:
+            if low in self._upper_token_skills:
                 found.add(low)
 
         # 5. Remove blacklisted generic terms
@@ -676,28 +681,98 @@ class InformationExtractionEngine:
         "including", "based", "within", "across", "along", "etc",
     }
 
+    @staticmethod
+    def _compile_keyword_index(
+        keywords: set[str], stop: set[str]
+    ) -> tuple[dict, frozenset[str]]:
+        """
+        Compile ``keywords`` into a trie over letter runs, plus the set of
+        two-word keywords the bigram rule can emit.
+
+        The first trie level is keyed by a letter run; deeper levels by
+        ``(gap, run)``, where ``gap`` is ``" "`` for a hyphen joint (matches
+        any run of whitespace, "-" or "/" in the text) and the literal joint
+        otherwise ("ci/cd"). The ``None`` key of a node lists
+        ``(suffix, keyword)`` pairs ending there; ``suffix`` holds trailing
+        non-letters that must follow verbatim ("web3").
+
+        Keywords containing a space are left to the bigram rule: the
+        per-keyword regexes this index replaced never matched them (the
+        hyphen substitution also rewrote the separator class inserted for
+        spaces), and extraction output is kept unchanged.
+        """
+        trie: dict = {}
+        for kw in keywords:
+            if " " in kw:
+                continue
+            parts = re.split(r"([^a-z]+)", kw)
+            if not parts[0]:
+                logger.warning("Domain keyword %r must start with a letter — skipped", kw)
+                continue
+            node = trie.setdefault(parts[0], {})
+            suffix = ""
+            for i in range(1, len(parts), 2):
+                joint, run = parts[i], parts[i + 1]
+                if not run:
+                    suffix = joint
+                    break
+                gap = " " if not joint.strip(" -") else joint
+                node = node.setdefault((gap, run), {})
+            node.setdefault(None, []).append((suffix, kw))
+
+        bigrams = frozenset(
+            kw for kw in keywords
+            if re.fullmatch(r"[a-z]{3,} [a-z]{3,}", kw)
+            and not any(word in stop for word in kw.split())
+        )
+        return trie, bigrams
+
     def _extract_keywords(self, text: str, text_lower: str) -> list[str]:
         """
         Extract domain keywords that are ACTUALLY in the resume text.
-        Combines pattern-matching for known domain terms with extraction
-        of meaningful multi-word phrases.
+        Combines matching of known domain terms with extraction of
+        meaningful multi-word phrases, in one pass over the letter runs.
         """
         found: set[str] = set()
-
-        # 1. Match known domain keywords
-        for kw in self.DOMAIN_KEYWORDS:
-            escaped = re.escape(kw)
-            escaped = escaped.replace(r"\ ", r"[\s\-/]+")
-            escaped = escaped.replace(r"\-", r"[\s\-/]+")
-            if re.search(r"(?<![a-zA-Z])" + escaped + r"(?![a-zA-Z])", text_lower):
-                found.add(kw)
-
-        # 2. Extract meaningful bigrams from the text itself
-        words = re.findall(r"\b[a-z]{3,}\b", text_lower)
-        for i in range(len(words) - 1):
-            if words[i] not in self._KEYWORD_STOP and words[i + 1] not in self._KEYWORD_STOP:
-                bigram = f"{words[i]} {words[i + 1]}"
-                if bigram in self.DOMAIN_KEYWORDS:
-                    found.add(bigram)
+        runs = [(m.start(), m.end(), m.group()) for m in _LETTER_RUN.finditer(text_lower)]
+        size = len(text_lower)
+        trie = self._keyword_trie
+        prev_word = None
+
+        for i, (start, end, run) in enumerate(runs):
+            # 1. Known domain keywords starting at this run — a keyword's
+            #    words are whole runs, joined by separators in the text
+            nodes = [trie[run]] if run in trie else []
+            j = i
+            while nodes:
+                run_end = runs[j][1]
+                for node in nodes:
+                    for suffix, kw in node.get(None, ()):
+                        tail = run_end + len(suffix)
+                        if text_lower.startswith(suffix, run_end) and (
+                            tail == size or text_lower[tail] not in _ASCII_LETTERS
+                        ):
+                            found.add(kw)
+                if j + 1 == len(runs):
+                    break
+                joint = text_lower[run_end:runs[j + 1][0]]
+                nxt = runs[j + 1][2]
+                keys = [(joint, nxt)]
+                if joint != " " and _SEPARATOR_RUN.fullmatch(joint):
+                    keys.append((" ", nxt))
+                nodes = [node[key] for node in nodes for key in keys if key in node]
+                j += 1
+
+            # 2. Bigrams of consecutive whole words (3+ letters) from the text
+            #    (a run touching a digit, "_" or non-ASCII letter is no word)
+            is_word = (
+                len(run) >= 3
+                and not (start and _WORD_CHAR.match(text_lower, start - 1))
+                and not (end < size and _WORD_CHAR.match(text_lower, end))
+            )
+            if is_word:
+                if prev_word is not None and f"{prev_word} {run}" in self._keyword_bigrams:
+                    found.add(f"{prev_word} {run}")
+                prev_word = run
 
         return sorted(found)
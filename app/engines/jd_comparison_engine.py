@@ -6,16 +6,85 @@ Produces:
     - matched/missing keywords
     - section_scores (flat dict for immediate UI consumption)
     - overall_match_percent
+
+Modes (``settings.JD_COMPARISON_MODE``, or ``compare(mode=...)``):
+    lexical   — keyword/n-gram overlap plus the section scores above.
+    semantic  — lexical, plus requirement-level evidence: the JD is split
+                into requirement sentences, the resume's bullet lines (all
+                lines if it has none) are embedded in one batched encode, and
+                a single matmul gives every requirement's best-matching
+                resume line. The share of requirements met joins
+                ``section_scores`` as "requirements".
+
+Everything derived from the JD alone (keywords, skill/tool/education terms,
+required years, requirement sentences and their vectors) is a ``JDFeatures``
+built once per distinct JD text. The roles' default JDs are pinned at
+startup in a read-only map (with requirement vectors when semantic mode is
+configured) that is never modified afterwards; user-provided JDs live in a
+bounded LRU cache keyed by the text's sha256 (``JD_CACHE_SIZE``).
 """
 
 from __future__ import annotations
 
+import dataclasses
+import hashlib
 import logging
 import re
+import threading
 from collections import Counter
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+
+import numpy as np
+
+from app.config import settings
+from app.core import embedding_dispatcher, metrics, vector_store
+from app.core.lru_cache import LRUCache
+from app.core.parsed_resume import ParsedResume
 
 logger = logging.getLogger(__name__)
 
+MODE_LEXICAL = "lexical"
+MODE_SEMANTIC = "semantic"
+
+_REQUIREMENT_SPLIT = re.compile(r"\n+|(?<=[.!?;])\s+")
+_LIST_MARKER = re.compile(r"^(?:\s*(?:[•\-*●▪◦·\uf0a7]|\d{1,2}[.)](?!\d)))+")
+_MIN_REQUIREMENT_WORDS = 3
+_MIN_EVIDENCE_WORDS = 4
+_MAX_EVIDENCE_LINES = 300
+
+
+def configured_mode() -> str:
+    """The JD comparison mode requested in settings (unknown values mean ``lexical``)."""
+    mode = settings.JD_COMPARISON_MODE.strip().lower()
+    return mode if mode in (MODE_LEXICAL, MODE_SEMANTIC) else MODE_LEXICAL
+
+
+def _statements(parts: Iterable[str], min_words: int) -> list[str]:
+    """Non-trivial ``parts`` with list markers stripped, deduplicated, in order."""
+    found: dict[str, None] = {}
+    for part in parts:
+        part = _LIST_MARKER.sub("", part).strip(" \t.;:")
+        if len(part.split()) >= min_words:
+            found.setdefault(part)
+    return list(found)
+
+
+@dataclass(frozen=True, slots=True)
+class JDFeatures:
+    """The JD-only inputs of ``compare`` (shared — never mutate)."""
+
+    lower: str
+    keywords: frozenset[str]
+    skills: frozenset[str]              # keywords that look like skills (all keywords if none do)
+    years: int                          # highest "N years" requirement
+    edu_level: int                      # highest ``EDU_LEVELS`` term mentioned
+    fields: tuple[str, ...]             # ``EDU_FIELDS`` mentioned
+    tools: frozenset[str]               # ``TOOL_KEYWORDS`` mentioned
+    requirements: tuple[str, ...] = ()  # requirement sentences (semantic mode)
+    requirement_vectors: np.ndarray | None = None  # (len(requirements), dim), filled on demand
+
 
 class JDComparisonEngine:
     """Compare resume text with a job description."""
@@ -41,32 +110,174 @@ class JDComparisonEngine:
         "years", "year", "minimum", "plus", "least", "join", "responsible",
     }
 
+    # Terms that mark a JD keyword as a skill requirement
+    SKILL_INDICATORS: set[str] = {
+        "python", "java", "javascript", "typescript", "c++", "c#", "ruby", "php",
+        "go", "golang", "rust", "swift", "kotlin", "scala", "perl", "r",
+        "react", "angular", "vue", "nodejs", "node.js", "express", "django", "flask",
+        "spring", "laravel", "rails", "nextjs", "next.js", "fastapi", "graphql",
+        "docker", "kubernetes", "k8s", "aws", "azure", "gcp", "terraform", "ansible",
+        "jenkins", "circleci", "github actions", "gitlab ci", "ci/cd", "devops",
+        "sql", "mysql", "postgresql", "postgres", "mongodb", "redis", "elasticsearch",
+        "cassandra", "dynamodb", "firebase", "supabase", "oracle", "sqlite",
+        "machine learning", "deep learning", "nlp", "computer vision", "ai", "ml",
+        "tensorflow", "pytorch", "keras", "scikit-learn", "pandas", "numpy", "spark",
+        "html", "css", "sass", "less", "bootstrap", "tailwind", "webpack",
+        "rest", "api", "microservices", "grpc", "websocket", "http", "json",
+        "linux", "unix", "bash", "shell", "powershell", "git", "agile", "scrum",
+        "testing", "jest", "pytest", "junit", "selenium", "cypress", "automation",
+        "data science", "data analysis", "data engineering", "etl", "tableau", "power bi",
+        "figma", "sketch", "adobe", "photoshop", "illustrator", "ui", "ux",
+    }
+
+    EDU_LEVELS: dict[str, int] = {
+        "phd": 5, "doctorate": 5, "ph.d": 5,
+        "master": 4, "m.s": 4, "m.tech": 4, "m.e": 4, "mba": 4, "mca": 4, "ms": 4,
+        "bachelor": 3, "b.s": 3, "b.tech": 3, "b.e": 3, "bca": 3, "bs": 3, "ba": 3,
+        "degree": 2, "diploma": 1, "certificate": 1, "certification": 1,
+    }
+
+    EDU_FIELDS: tuple[str, ...] = (
+        "computer science", "engineering", "information technology", "data science",
+        "mathematics", "statistics", "physics", "business", "management",
+        "software", "electrical", "mechanical", "civil", "chemical",
+    )
+
+    TOOL_KEYWORDS: tuple[str, ...] = (
+        "git", "github", "gitlab", "bitbucket", "svn",
+        "jira", "confluence", "asana", "trello", "notion", "monday",
+        "docker", "kubernetes", "jenkins", "circleci", "travis", "bamboo",
+        "terraform", "ansible", "puppet", "chef", "vagrant",
+        "webpack", "babel", "vite", "rollup", "parcel", "esbuild",
+        "npm", "yarn", "pip", "maven", "gradle", "cargo",
+        "figma", "sketch", "adobe xd", "invision", "zeplin",
+        "postman", "swagger", "insomnia", "curl",
+        "vscode", "visual studio", "intellij", "pycharm", "webstorm", "vim", "emacs",
+        "linux", "ubuntu", "centos", "debian", "windows server",
+        "nginx", "apache", "iis", "tomcat",
+        "slack", "teams", "zoom", "discord",
+        "aws", "s3", "ec2", "lambda", "cloudfront", "rds",
+        "azure", "gcp", "heroku", "vercel", "netlify", "digitalocean",
+    )
+
+    def __init__(self) -> None:
+        self._cache = LRUCache(settings.JD_CACHE_SIZE)
+        self._defaults: Mapping[str, JDFeatures] | None = None   # read-only once set
+        self._defaults_lock = threading.Lock()
+
+    # -----------------------------------------------------------------
+    # JD features
+    # -----------------------------------------------------------------
+
+    def features(self, jd_text: str) -> JDFeatures:
+        """
+        Features of ``jd_text`` — pinned for default JDs, else from the LRU
+        cache (built and stored on a miss).
+        """
+        key = hashlib.sha256(jd_text.encode("utf-8")).hexdigest()
+        found = self.pin_defaults().get(key) or self._cache.get(key)
+        if found is None:
+            found = self._build_features(jd_text)
+            self._cache.put(key, found)
+        return found
+
+    def pin_defaults(self) -> Mapping[str, JDFeatures]:
+        """
+        Build (once) the features of every role's ``default_jd`` — and, in
+        semantic mode, encode every default requirement in one batch.
+        Called at startup; until the vector store is ready it returns an
+        empty map. The map is published once, complete, and never modified,
+        so readers need no lock.
+        """
+        if self._defaults is not None or not vector_store.is_ready():
+            return self._defaults or MappingProxyType({})
+        with self._defaults_lock:
+            if self._defaults is None:
+                pinned: dict[str, JDFeatures] = {}
+                for role in vector_store.get_roles():
+                    jd_text = vector_store.get_default_jd(role.role_name)
+                    key = hashlib.sha256(jd_text.encode("utf-8")).hexdigest()
+                    if jd_text and key not in pinned:
+                        pinned[key] = self._build_features(jd_text)
+                if configured_mode() == MODE_SEMANTIC:
+                    sentences = [r for f in pinned.values() for r in f.requirements]
+                    vectors = embedding_dispatcher.encode(sentences)
+                    offset = 0
+                    for key, found in pinned.items():
+                        n = len(found.requirements)
+                        pinned[key] = dataclasses.replace(
+                            found, requirement_vectors=vectors[offset:offset + n],
+                        )
+                        offset += n
+                self._defaults = MappingProxyType(pinned)
+                logger.info("Pinned features for %d default JDs", len(pinned))
+        return self._defaults
+
+    def cache_stats(self) -> dict:
+        """LRU counters for user-provided JDs plus the number of pinned defaults."""
+        return {**self._cache.stats(), "pinned": len(self._defaults or {})}
+
+    def _build_features(self, jd_text: str) -> JDFeatures:
+        jd_lower = jd_text.lower()
+        keywords = self._extract_keywords(jd_lower)
+        skills = {
+            kw for kw in keywords
+            if any(ind in kw for ind in self.SKILL_INDICATORS) or kw in self.SKILL_INDICATORS
+        }
+        return JDFeatures(
+            lower=jd_lower,
+            keywords=frozenset(keywords),
+            skills=frozenset(skills or keywords),
+            years=self._extract_years(jd_lower),
+            edu_level=max((lvl for term, lvl in self.EDU_LEVELS.items() if term in jd_lower), default=0),
+            fields=tuple(f for f in self.EDU_FIELDS if f in jd_lower),
+            tools=frozenset(t for t in self.TOOL_KEYWORDS if t in jd_lower),
+            requirements=tuple(_statements(_REQUIREMENT_SPLIT.split(jd_text), _MIN_REQUIREMENT_WORDS)),
+        )
+
     # -----------------------------------------------------------------
 
     def compare(
         self,
-        resume_text: str,
+        resume_text: str | ParsedResume,
         jd_text: str,
         resume_skills: list[str] | None = None,
+        mode: str | None = None,
     ) -> dict:
         """
         Enhanced resume-vs-JD comparison with fuzzy matching.
 
+        ``mode`` overrides ``settings.JD_COMPARISON_MODE`` for this call
+        ("lexical" or "semantic"; anything else raises ``ValueError``).
+
         Returns
         -------
         dict
             overall_match_percent, keyword_coverage_percent,
             matched_keywords, missing_keywords, partial_matches,
-            section_scores (flat dict)
+            section_scores (flat dict) — plus, in semantic mode, mode,
+            requirements [{requirement, evidence, score, met}],
+            requirements_met and requirement_count
         """
+        if mode is None:
+            mode = configured_mode()
+        elif mode.strip().lower() in (MODE_LEXICAL, MODE_SEMANTIC):
+            mode = mode.strip().lower()
+        else:
+            raise ValueError(
+                f"Unknown JD comparison mode {mode!r} — expected "
+                f"{MODE_LEXICAL!r} or {MODE_SEMANTIC!r}"
+            )
+
         try:
             logger.info("Running enhanced JD comparison analysis")
 
-            resume_lower = resume_text.lower()
-            jd_lower = jd_text.lower()
+            resume = ParsedResume.of(resume_text)
+            resume_lower = resume.lower
+            jd = self.features(jd_text)
 
             # Extract meaningful keywords
-            jd_keywords = self._extract_keywords(jd_lower)
+            jd_keywords = jd.keywords
             resume_keywords = self._extract_keywords(resume_lower)
 
             # Exact matches
@@ -100,7 +311,20 @@ class JDComparisonEngine:
             coverage = (total_credits / len(jd_keywords) * 100) if jd_keywords else 0.0
 
             # Section-wise analysis (with boost from actual resume_skills)
-            sections = self._section_analysis(resume_lower, jd_lower, resume_skills)
+            sections = self._section_analysis(resume_lower, jd, resume_keywords, resume_skills)
+
+            # Semantic requirement evidence joins the lexical section scores
+            requirements: list[dict] = []
+            if mode == MODE_SEMANTIC:
+                with metrics.timed("JDRequirementMatch"):
+                    requirements = self._requirement_evidence(resume, jd_text, jd)
+                if requirements:
+                    met = sum(r["met"] for r in requirements)
+                    sections["requirements"] = {
+                        "relevance_percent": round(met / len(requirements) * 100, 1),
+                        "met": met,
+                        "total": len(requirements),
+                    }
 
             # Flat section_scores dict for immediate UI consumption
             section_scores = {
@@ -110,7 +334,7 @@ class JDComparisonEngine:
             # Weighted overall match (slightly more generous)
             overall = self._compute_overall_match(coverage, sections)
 
-            return {
+            result = {
                 "overall_match_percent": round(overall, 2),
                 "keyword_coverage_percent": round(coverage, 2),
                 "matched_keywords": exact_matched,
@@ -124,6 +348,14 @@ class JDComparisonEngine:
                 "section_scores": section_scores,
                 "sections": sections,
             }
+            if mode == MODE_SEMANTIC:
+                result.update(
+                    mode=mode,
+                    requirements=requirements,
+                    requirements_met=sections.get("requirements", {}).get("met", 0),
+                    requirement_count=len(requirements),
+                )
+            return result
         except Exception as exc:
             logger.exception("JD comparison failed: %s", exc)
             return {
@@ -141,6 +373,51 @@ class JDComparisonEngine:
 
     # -----------------------------------------------------------------
 
+    def _requirement_evidence(self, resume: ParsedResume, jd_text: str, jd: JDFeatures) -> list[dict]:
+        """
+        Best resume line for every JD requirement by cosine similarity.
+
+        Evidence comes from the parsed bullet lines (all lines when the
+        resume has no usable bullets), lower-cased as ``ParsedResume`` keeps
+        them — the embedding model is uncased. Resume lines and any not-yet-cached
+        requirement vectors are encoded in one batch; the vectors are
+        L2-normalised, so one matmul gives the full requirement × line
+        similarity matrix. Vectors of a user JD go back into the LRU cache;
+        a default JD pinned without vectors (lexical mode configured) is
+        encoded per call — the pinned map is never modified.
+        """
+        lines = (
+            _statements(resume.bullets, _MIN_EVIDENCE_WORDS)
+            or _statements(resume.lines, _MIN_EVIDENCE_WORDS)
+        )[:_MAX_EVIDENCE_LINES]
+        if not jd.requirements or not lines:
+            return []
+
+        if jd.requirement_vectors is None:
+            vectors = embedding_dispatcher.encode(list(jd.requirements) + lines)
+            n = len(jd.requirements)
+            jd = dataclasses.replace(jd, requirement_vectors=vectors[:n])
+            key = hashlib.sha256(jd_text.encode("utf-8")).hexdigest()
+            if key not in self.pin_defaults():
+                self._cache.put(key, jd)
+            line_vectors = vectors[n:]
+        else:
+            line_vectors = embedding_dispatcher.encode(lines)
+
+        similarity = jd.requirement_vectors @ line_vectors.T
+        best = similarity.argmax(axis=1)
+        threshold = settings.JD_REQUIREMENT_THRESHOLD
+        evidence = []
+        for i, requirement in enumerate(jd.requirements):
+            score = float(similarity[i, best[i]])
+            evidence.append({
+                "requirement": requirement,
+                "evidence": lines[best[i]],
+                "score": round(score, 4),
+                "met": score >= threshold,
+            })
+        return evidence
+
     def _extract_keywords(self, text: str) -> set[str]:
         """
         Extract meaningful keywords with enhanced matching.
@@ -168,7 +445,8 @@ class JDComparisonEngine:
     def _section_analysis(
         self,
         resume_lower: str,
-        jd_lower: str,
+        jd: JDFeatures,
+        resume_keywords: set[str],
         resume_skills: list[str] | None = None,
     ) -> dict:
         """
@@ -181,44 +459,15 @@ class JDComparisonEngine:
         # SKILLS SECTION - Compare technical skills mentioned
         # ═══════════════════════════════════════════════════════════════
         
-        # Extract ALL skill-like terms from JD
-        jd_skill_keywords = self._extract_keywords(jd_lower)
-        resume_skill_keywords = self._extract_keywords(resume_lower)
+        resume_skill_keywords = set(resume_keywords)
         
         # Also add explicit resume_skills if provided
         if resume_skills:
             for skill in resume_skills:
                 resume_skill_keywords.add(skill.lower().strip())
         
-        # Filter to skill-relevant terms (remove general words)
-        skill_indicators = {
-            "python", "java", "javascript", "typescript", "c++", "c#", "ruby", "php",
-            "go", "golang", "rust", "swift", "kotlin", "scala", "perl", "r",
-            "react", "angular", "vue", "nodejs", "node.js", "express", "django", "flask",
-            "spring", "laravel", "rails", "nextjs", "next.js", "fastapi", "graphql",
-            "docker", "kubernetes", "k8s", "aws", "azure", "gcp", "terraform", "ansible",
-            "jenkins", "circleci", "github actions", "gitlab ci", "ci/cd", "devops",
-            "sql", "mysql", "postgresql", "postgres", "mongodb", "redis", "elasticsearch",
-            "cassandra", "dynamodb", "firebase", "supabase", "oracle", "sqlite",
-            "machine learning", "deep learning", "nlp", "computer vision", "ai", "ml",
-            "tensorflow", "pytorch", "keras", "scikit-learn", "pandas", "numpy", "spark",
-            "html", "css", "sass", "less", "bootstrap", "tailwind", "webpack",
-            "rest", "api", "microservices", "grpc", "websocket", "http", "json",
-            "linux", "unix", "bash", "shell", "powershell", "git", "agile", "scrum",
-            "testing", "jest", "pytest", "junit", "selenium", "cypress", "automation",
-            "data science", "data analysis", "data engineering", "etl", "tableau", "power bi",
-            "figma", "sketch", "adobe", "photoshop", "illustrator", "ui", "ux",
-        }
-        
-        # Find skill terms in JD
-        jd_skills = set()
-        for kw in jd_skill_keywords:
-            if any(ind in kw for ind in skill_indicators) or kw in skill_indicators:
-                jd_skills.add(kw)
-        
-        # If no clear skills found, use general keyword match
-        if not jd_skills:
-            jd_skills = jd_skill_keywords
+        # Skill terms in JD (all JD keywords if no clear skills were found)
+        jd_skills = jd.skills
         
         # Count matches
         if jd_skills:
@@ -241,7 +490,7 @@ class JDComparisonEngine:
         # ═══════════════════════════════════════════════════════════════
         
         # Extract years from both
-        exp_jd = self._extract_years(jd_lower)
+        exp_jd = jd.years
         exp_resume = self._extract_years(resume_lower)
         
         # Also check for experience-related keywords
@@ -252,7 +501,6 @@ class JDComparisonEngine:
             "project", "projects", "team", "teams", "company", "organization",
         ]
         
-        jd_exp_mentions = sum(1 for k in exp_keywords if k in jd_lower)
         resume_exp_mentions = sum(1 for k in exp_keywords if k in resume_lower)
         
         # Calculate experience match
@@ -282,38 +530,16 @@ class JDComparisonEngine:
         # EDUCATION SECTION - Compare education requirements
         # ═══════════════════════════════════════════════════════════════
         
-        edu_levels = {
-            "phd": 5, "doctorate": 5, "ph.d": 5,
-            "master": 4, "m.s": 4, "m.tech": 4, "m.e": 4, "mba": 4, "mca": 4, "ms": 4,
-            "bachelor": 3, "b.s": 3, "b.tech": 3, "b.e": 3, "bca": 3, "bs": 3, "ba": 3,
-            "degree": 2, "diploma": 1, "certificate": 1, "certification": 1,
-        }
-        
-        # Find highest education level in JD
-        jd_max_level = 0
-        jd_edu_terms = []
-        for term, level in edu_levels.items():
-            if term in jd_lower:
-                jd_edu_terms.append(term)
-                jd_max_level = max(jd_max_level, level)
-        
-        # Find highest education level in resume
+        # Highest education level in JD (precomputed) and resume
+        jd_max_level = jd.edu_level
         resume_max_level = 0
-        resume_edu_terms = []
-        for term, level in edu_levels.items():
+        for term, level in self.EDU_LEVELS.items():
             if term in resume_lower:
-                resume_edu_terms.append(term)
                 resume_max_level = max(resume_max_level, level)
         
         # Also check field-specific education
-        edu_fields = [
-            "computer science", "engineering", "information technology", "data science",
-            "mathematics", "statistics", "physics", "business", "management",
-            "software", "electrical", "mechanical", "civil", "chemical",
-        ]
-        
-        jd_fields = [f for f in edu_fields if f in jd_lower]
-        resume_fields = [f for f in edu_fields if f in resume_lower]
+        jd_fields = jd.fields
+        resume_fields = [f for f in self.EDU_FIELDS if f in resume_lower]
         field_match_bonus = 10 if any(f in resume_fields for f in jd_fields) else 0
         
         # Calculate education match
@@ -335,34 +561,9 @@ class JDComparisonEngine:
         # TOOLS SECTION - Compare tools/technologies mentioned
         # ═══════════════════════════════════════════════════════════════
         
-        tool_keywords = [
-            "git", "github", "gitlab", "bitbucket", "svn",
-            "jira", "confluence", "asana", "trello", "notion", "monday",
-            "docker", "kubernetes", "jenkins", "circleci", "travis", "bamboo",
-            "terraform", "ansible", "puppet", "chef", "vagrant",
-            "webpack", "babel", "vite", "rollup", "parcel", "esbuild",
-            "npm", "yarn", "pip", "maven", "gradle", "cargo",
-            "figma", "sketch", "adobe xd", "invision", "zeplin",
-            "postman", "swagger", "insomnia", "curl",
-            "vscode", "visual studio", "intellij", "pycharm", "webstorm", "vim", "emacs",
-            "linux", "ubuntu", "centos", "debian", "windows server",
-            "nginx", "apache", "iis", "tomcat",
-            "slack", "teams", "zoom", "discord",
-            "aws", "s3", "ec2", "lambda", "cloudfront", "rds",
-            "azure", "gcp", "heroku", "vercel", "netlify", "digitalocean",
-        ]
-        
-        # Extract tools from JD
-        jd_tools = set()
-        for tool in tool_keywords:
-            if tool in jd_lower:
-                jd_tools.add(tool)
-        
-        # Extract tools from resume
-        resume_tools = set()
-        for tool in tool_keywords:
-            if tool in resume_lower:
-                resume_tools.add(tool)
+        # Tools from JD (precomputed) and resume
+        jd_tools = jd.tools
+        resume_tools = {tool for tool in self.TOOL_KEYWORDS if tool in resume_lower}
         
         # Calculate match
         if jd_tools:
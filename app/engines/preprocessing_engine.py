@@ -1,24 +1,124 @@
 """
 TalentIQ — Engine #3: Text Preprocessing Engine
 Cleans and tokenizes raw resume text for downstream analysis.
+
+NLTK resources are resolved once per process from the local nltk_data paths
+— never downloaded. If a resource is missing the engine degrades to a
+built-in regex tokenizer and English stopword list (no lemmatization).
 """
 
+from __future__ import annotations
+
+import logging
 import re
-import nltk
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
-from nltk.stem import WordNetLemmatizer
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# resource name → path passed to nltk.data.find()
+_NLTK_RESOURCES: dict[str, str] = {
+    "punkt_tab": "tokenizers/punkt_tab",
+    "stopwords": "corpora/stopwords",
+    "wordnet": "corpora/wordnet",
+}
+
+# Mirrors nltk.corpus.stopwords.words("english") for offline fallback
+_FALLBACK_STOPWORDS: frozenset[str] = frozenset({
+    "i", "me", "my", "myself", "we", "our", "ours", "ourselves", "you",
+    "you're", "you've", "you'll", "you'd", "your", "yours", "yourself",
+    "yourselves", "he", "him", "his", "himself", "she", "she's", "her",
+    "hers", "herself", "it", "it's", "its", "itself", "they", "them",
+    "their", "theirs", "themselves", "what", "which", "who", "whom", "this",
+    "that", "that'll", "these", "those", "am", "is", "are", "was", "were",
+    "be", "been", "being", "have", "has", "had", "having", "do", "does",
+    "did", "doing", "a", "an", "the", "and", "but", "if", "or", "because",
+    "as", "until", "while", "of", "at", "by", "for", "with", "about",
+    "against", "between", "into", "through", "during", "before", "after",
+    "above", "below", "to", "from", "up", "down", "in", "out", "on", "off",
+    "over", "under", "again", "further", "then", "once", "here", "there",
+    "when", "where", "why", "how", "all", "any", "both", "each", "few",
+    "more", "most", "other", "some", "such", "no", "nor", "not", "only",
+    "own", "same", "so", "than", "too", "very", "s", "t", "can", "will",
+    "just", "don", "don't", "should", "should've", "now", "d", "ll", "m",
+    "o", "re", "ve", "y", "ain", "aren", "aren't", "couldn", "couldn't",
+    "didn", "didn't", "doesn", "doesn't", "hadn", "hadn't", "hasn",
+    "hasn't", "haven", "haven't", "isn", "isn't", "ma", "mightn",
+    "mightn't", "mustn", "mustn't", "needn", "needn't", "shan", "shan't",
+    "shouldn", "shouldn't", "wasn", "wasn't", "weren", "weren't", "won",
+    "won't", "wouldn", "wouldn't",
+})
+
+_resolved: dict[str, bool] | None = None
+_resolve_lock = threading.Lock()
+
+
+def resolve_nltk_resources() -> dict[str, bool]:
+    """
+    Check which NLTK resources exist locally — once per process, offline.
+
+    Returns
+    -------
+    dict[str, bool]
+        resource name → available
+    """
+    global _resolved  # noqa: PLW0603
 
-# Ensure required NLTK data is available
-for resource in ["punkt", "punkt_tab", "stopwords", "wordnet"]:
-    nltk.download(resource, quiet=True)
+    if _resolved is not None:
+        return _resolved
+
+    with _resolve_lock:
+        if _resolved is None:
+            t0 = time.perf_counter()
+            try:
+                import nltk
+            except ImportError:
+                available = {name: False for name in _NLTK_RESOURCES}
+            else:
+                available = {}
+                for name, path in _NLTK_RESOURCES.items():
+                    try:
+                        nltk.data.find(path)
+                        available[name] = True
+                    except LookupError:
+                        available[name] = False
+
+            missing = sorted(name for name, ok in available.items() if not ok)
+            logger.info(
+                "NLTK resources resolved offline in %.1f ms — missing: %s",
+                (time.perf_counter() - t0) * 1000,
+                ", ".join(missing) or "none",
+            )
+            _resolved = available
+    return _resolved
+
+
+def _regex_tokenize(text: str) -> list[str]:
+    return re.findall(r"\w+", text)
 
 
 class TextPreprocessingEngine:
 
     def __init__(self):
-        self.stop_words = set(stopwords.words("english"))
-        self.lemmatizer = WordNetLemmatizer()
+        available = resolve_nltk_resources()
+
+        if available["stopwords"]:
+            from nltk.corpus import stopwords
+            self.stop_words = set(stopwords.words("english"))
+        else:
+            self.stop_words = set(_FALLBACK_STOPWORDS)
+
+        self.lemmatizer = None
+        if available["wordnet"]:
+            from nltk.stem import WordNetLemmatizer
+            self.lemmatizer = WordNetLemmatizer()
+
+        # word_tokenize() needs punkt_tab on NLTK ≥ 3.9
+        if available["punkt_tab"]:
+            from nltk.tokenize import word_tokenize
+            self._word_tokenize = word_tokenize
+        else:
+            self._word_tokenize = _regex_tokenize
 
     def clean(self, text: str) -> str:
         """Normalize whitespace and strip non-alphanumeric characters."""
@@ -29,9 +129,17 @@ class TextPreprocessingEngine:
 
     def tokenize(self, text: str) -> list[str]:
         """Tokenize and lemmatize text, removing stopwords."""
-        tokens = word_tokenize(text)
+        tokens = self._word_tokenize(text)
+        lemmatize = self.lemmatizer.lemmatize if self.lemmatizer else (lambda t: t)
         return [
-            self.lemmatizer.lemmatize(token)
+            lemmatize(token)
             for token in tokens
             if token.lower() not in self.stop_words and len(token) > 1
         ]
+
+    def count_tokens(self, text: str) -> int:
+        """Number of tokens ``tokenize`` returns, without lemmatizing them."""
+        return sum(
+            1 for token in self._word_tokenize(text)
+            if token.lower() not in self.stop_words and len(token) > 1
+        )
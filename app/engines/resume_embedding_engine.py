@@ -1,15 +1,127 @@
 """
 TalentIQ — Engine #6: Resume Embedding Engine
 Generates 384-dimension vector embeddings from resume text.
+
+Encodes go through ``embedding_dispatcher`` so concurrent requests share
+one batched forward pass. Vectors are L2-normalised.
+
+Modes (``settings.RESUME_EMBEDDING_MODE``):
+    full     — the whole text in one encode. The model truncates its input
+               (256 word pieces for all-MiniLM-L6-v2), so only roughly the
+               first page of a long resume is embedded.
+    chunked  — resumes longer than one window are split into sections
+               (``ParsedResume.sections``) and each section into overlapping
+               word windows prefixed with its heading. All chunks are encoded
+               in one batch and pooled (``RESUME_EMBEDDING_POOLING``):
+               "mean" weights each chunk by its word count, "max" takes the
+               element-wise maximum.
 """
 
+from __future__ import annotations
+
 import numpy as np
-from app.core.model_loader import model
+
+from app.config import settings
+from app.core import embedding_dispatcher
+from app.core.parsed_resume import ParsedResume
+
+MODE_FULL = "full"
+MODE_CHUNKED = "chunked"
+POOL_MEAN = "mean"
+POOL_MAX = "max"
+
+
+def configured_mode() -> str:
+    """The resume embedding mode requested in settings (unknown values mean ``full``)."""
+    mode = settings.RESUME_EMBEDDING_MODE.strip().lower()
+    return mode if mode in (MODE_FULL, MODE_CHUNKED) else MODE_FULL
+
+
+def configured_pooling() -> str:
+    """The chunk pooling requested in settings (unknown values mean ``mean``)."""
+    pooling = settings.RESUME_EMBEDDING_POOLING.strip().lower()
+    return pooling if pooling in (POOL_MEAN, POOL_MAX) else POOL_MEAN
+
+
+def fingerprint() -> str:
+    """Settings that shape resume vectors, for cache versioning."""
+    if configured_mode() == MODE_FULL:
+        return MODE_FULL
+    return (
+        f"{MODE_CHUNKED}/{configured_pooling()}/"
+        f"{settings.RESUME_CHUNK_WORDS}/{settings.RESUME_CHUNK_OVERLAP}"
+    )
+
+
+def chunk_resume(
+    resume: str | ParsedResume,
+    max_words: int | None = None,
+    overlap: int | None = None,
+) -> list[str]:
+    """
+    Split a resume into embedding-sized chunks (see module doc).
+
+    A resume that fits in one window — or has no text — comes back whole,
+    so chunked and full mode embed short resumes identically.
+    """
+    resume = ParsedResume.of(resume)
+    max_words = max(1, max_words or settings.RESUME_CHUNK_WORDS)
+    overlap = settings.RESUME_CHUNK_OVERLAP if overlap is None else overlap
+    step = max(1, max_words - max(0, overlap))
+    if resume.word_count <= max_words:
+        return [resume.text]
+
+    spans = [(s.heading, s.start, s.end) for s in resume.sections] or [("", 0, len(resume.text))]
+    chunks: list[str] = []
+    for heading, start, end in spans:
+        words = resume.text[start:end].split()
+        if not words:
+            continue
+        prefix = f"{heading}: " if heading else ""
+        last = max(len(words) - overlap, 1)
+        for i in range(0, last, step):
+            chunks.append(prefix + " ".join(words[i:i + max_words]))
+    return chunks or [resume.text]
+
+
+def pool(vectors: np.ndarray, weights: list[int] | None = None, method: str = POOL_MEAN) -> np.ndarray:
+    """Pool ``(n, dim)`` chunk vectors into one L2-normalised ``(dim,)`` vector."""
+    if method == POOL_MAX:
+        pooled = vectors.max(axis=0)
+    else:
+        pooled = np.average(vectors, axis=0, weights=weights)
+    norm = float(np.linalg.norm(pooled))
+    return (pooled / norm if norm > 0 else pooled).astype(np.float32)
 
 
 class ResumeEmbeddingEngine:
 
-    def generate(self, text: str) -> np.ndarray:
+    def generate(self, text: str | ParsedResume) -> np.ndarray:
         """Generate a 384-dim embedding vector for the given resume text."""
-        embedding = model.encode(text)
-        return np.asarray(embedding)
+        if configured_mode() == MODE_FULL:
+            return embedding_dispatcher.encode_one(
+                text.text if isinstance(text, ParsedResume) else text
+            )
+        return self.generate_batch([text])[0]
+
+    def generate_batch(self, texts: list[str | ParsedResume]) -> np.ndarray:
+        """Embed many resumes in one batched encode → (N, 384) matrix."""
+        if configured_mode() == MODE_FULL:
+            return embedding_dispatcher.encode(
+                [t.text if isinstance(t, ParsedResume) else t for t in texts]
+            )
+
+        # Every chunk of every resume in one encode, then pool per resume
+        per_resume = [chunk_resume(t) for t in texts]
+        vectors = embedding_dispatcher.encode([c for chunks in per_resume for c in chunks])
+        method = configured_pooling()
+        out = np.zeros((len(texts), vectors.shape[1]), dtype=np.float32)
+        offset = 0
+        for i, chunks in enumerate(per_resume):
+            rows = vectors[offset:offset + len(chunks)]
+            offset += len(chunks)
+            if len(chunks) == 1:
+                out[i] = rows[0]
+            else:
+                out[i] = pool(rows, [len(c.split()) for c in chunks], method)
+        return out
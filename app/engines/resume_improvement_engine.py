@@ -19,6 +19,8 @@ from __future__ import annotations
 import logging
 import re
 
+from app.core.parsed_resume import ParsedResume
+
 logger = logging.getLogger(__name__)
 
 
@@ -55,7 +57,7 @@ class ResumeImprovementEngine:
 
     def analyze(
         self,
-        text: str,
+        text: str | ParsedResume,
         candidate_skills: list[str] | None = None,
         role_required_skills: list[str] | None = None,
         role_name: str | None = None,
@@ -66,7 +68,7 @@ class ResumeImprovementEngine:
         
         Parameters
         ----------
-        text : str
+        text : str | ParsedResume
             Resume text to analyze
         candidate_skills : list[str]
             Skills detected in resume
@@ -83,6 +85,9 @@ class ResumeImprovementEngine:
             suggestions, issue_count, improvement_score
         """
         try:
+            resume = ParsedResume.of(text)
+            has_metrics = self._has_sufficient_metrics(resume.text)
+            passive_count = self._detect_passive_voice(resume)
             suggestions: list[dict] = []
             
             # ── Strategy 1: Skill Gap Suggestions ──────────────────────
@@ -99,7 +104,7 @@ class ResumeImprovementEngine:
                         })
             
             # ── Strategy 2: Quantification Suggestions ─────────────────
-            if not self._has_sufficient_metrics(text):
+            if not has_metrics:
                 suggestions.append({
                     "category": "quantification",
                     "priority": "high",
@@ -109,7 +114,6 @@ class ResumeImprovementEngine:
                 })
             
             # ── Strategy 3: Passive Voice Detection ───────────────────
-            passive_count = self._detect_passive_voice(text)
             if passive_count > 2:
                 suggestions.append({
                     "category": "writing_style",
@@ -120,7 +124,7 @@ class ResumeImprovementEngine:
                 })
             
             # ── Strategy 4: Weak Action Verbs ─────────────────────────
-            weak_verbs = self._detect_weak_verbs(text)
+            weak_verbs = self._detect_weak_verbs(resume)
             if weak_verbs:
                 suggestions.append({
                     "category": "action_verbs",
@@ -151,7 +155,7 @@ class ResumeImprovementEngine:
                 })
             
             # ── Strategy 7: Impact Statements ─────────────────────────
-            if not self._has_impact_statements(text):
+            if not self._has_impact_statements(resume):
                 suggestions.append({
                     "category": "impact",
                     "priority": "high",
@@ -182,9 +186,9 @@ class ResumeImprovementEngine:
             improvement_score = max(85 - penalty, 55)  # Floor at 55, starts at 85
             
             # Bonus points for good traits
-            if self._has_sufficient_metrics(text):
+            if has_metrics:
                 improvement_score += 5
-            if self._detect_passive_voice(text) <= 1:
+            if passive_count <= 1:
                 improvement_score += 5
             if not weak_verbs:
                 improvement_score += 5
@@ -210,28 +214,25 @@ class ResumeImprovementEngine:
         metrics = re.findall(r"\d+[%$]|\d+\+|\d+[KM]|\$\d+|\d+%|by \d+", text, re.IGNORECASE)
         return len(metrics) >= 3  # At least 3 metrics is good
     
-    def _detect_passive_voice(self, text: str) -> int:
+    def _detect_passive_voice(self, resume: ParsedResume) -> int:
         """Count passive voice occurrences."""
         count = 0
-        text_lower = text.lower()
         for pattern in self.PASSIVE_PATTERNS:
-            count += len(re.findall(pattern, text_lower))
+            count += len(re.findall(pattern, resume.lower))
         return count
     
-    def _detect_weak_verbs(self, text: str) -> set[str]:
-        """Find weak action verbs in text."""
-        text_lower = text.lower()
+    def _detect_weak_verbs(self, resume: ParsedResume) -> set[str]:
+        """Find weak action verbs used as whole words in the text."""
         found = set()
         for verb in self.WEAK_VERBS:
-            if re.search(r"\b" + verb + r"\b", text_lower):
+            if verb in resume.token_set:
                 found.add(verb)
         return found
     
-    def _has_impact_statements(self, text: str) -> bool:
+    def _has_impact_statements(self, resume: ParsedResume) -> bool:
         """Check if resume has impact/result statements."""
         impact_keywords = [
             "increased", "reduced", "improved", "achieved", "delivered",
             "saved", "generated", "grew", "accelerated", "optimized"
         ]
-        text_lower = text.lower()
-        return sum(1 for kw in impact_keywords if kw in text_lower) >= 2
+        return sum(1 for kw in impact_keywords if kw in resume.lower) >= 2
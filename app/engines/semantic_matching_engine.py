@@ -12,9 +12,13 @@ This hybrid approach significantly improves match accuracy vs pure embeddings.
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping
+
 import numpy as np
+from scipy import sparse
 
-from app.core import vector_store
+from app.core import metrics, vector_store
+from app.core.parsed_resume import ParsedResume
 from app.engines.resume_embedding_engine import ResumeEmbeddingEngine
 
 logger = logging.getLogger(__name__)
@@ -38,19 +42,22 @@ class SemanticMatchingEngine:
 
     def match(
         self,
-        resume_text: str,
+        resume_text: str | ParsedResume,
         candidate_skills: list[str] | None = None,
         candidate_experience: int | float = 0,
         candidate_keywords: list[str] | None = None,
         top_k: int = 5,
+        embedding: np.ndarray | None = None,
+        role_scores: np.ndarray | None = None,
     ) -> dict:
         """
-        Hybrid semantic + structural role matching.
+        Hybrid semantic + structural role matching over the whole role catalogue.
 
         Parameters
         ----------
-        resume_text : str
-            Full resume text for embedding generation.
+        resume_text : str | ParsedResume
+            Full resume text for embedding generation (parsed sections are
+            reused when ``RESUME_EMBEDDING_MODE`` is "chunked").
         candidate_skills : list[str], optional
             Extracted/normalized skills from resume.
         candidate_experience : int|float, optional
@@ -59,6 +66,11 @@ class SemanticMatchingEngine:
             Domain keywords extracted from resume.
         top_k : int
             Number of top matches to return (default 5).
+        embedding : np.ndarray, optional
+            Precomputed resume embedding (batch analysis) — skips encoding.
+        role_scores : np.ndarray, optional
+            Precomputed ``vector_store.similarities`` row for ``embedding``
+            (batch analysis) — skips the similarity pass.
 
         Returns
         -------
@@ -70,7 +82,8 @@ class SemanticMatchingEngine:
                 "matching_method": "hybrid",
             }
         """
-        if not resume_text or not resume_text.strip():
+        text = resume_text.text if isinstance(resume_text, ParsedResume) else resume_text
+        if not text or not text.strip():
             return {
                 "top_roles": [],
                 "embedding_dim": 0,
@@ -80,22 +93,24 @@ class SemanticMatchingEngine:
             }
 
         # 1. Generate resume embedding
-        embedding: np.ndarray = self._embedder.generate(resume_text)
-
-        # 2. Get base semantic matches (top_k * 2 for re-ranking)
-        search_k = min(top_k * 3, 20)  # Get more candidates for re-ranking
-        base_matches = vector_store.search(embedding, top_k=search_k)
-
-        # 3. Hybrid re-ranking with skill/experience/keyword boosts
-        enhanced_matches = self._hybrid_rerank(
-            base_matches=base_matches,
-            candidate_skills=candidate_skills or [],
-            candidate_experience=candidate_experience,
-            candidate_keywords=candidate_keywords or [],
-        )
-
-        # 4. Return top_k after re-ranking
-        final_matches = enhanced_matches[:top_k]
+        if embedding is None:
+            with metrics.timed("ResumeEmbedding"):
+                embedding = self._embedder.generate(resume_text)
+
+        # 2. Semantic similarity to every role
+        if role_scores is None:
+            with metrics.timed("VectorSearch"):
+                role_scores = vector_store.similarities(embedding)
+
+        # 3. Hybrid scoring of the whole catalogue → top_k
+        with metrics.timed("HybridRerank"):
+            final_matches = self._hybrid_rank(
+                role_scores=role_scores,
+                candidate_skills=candidate_skills or [],
+                candidate_experience=candidate_experience,
+                candidate_keywords=candidate_keywords or [],
+                top_k=top_k,
+            )
 
         return {
             "top_roles": final_matches,
@@ -104,119 +119,132 @@ class SemanticMatchingEngine:
             "matching_method": "hybrid",
         }
 
+    def embed_batch(self, texts: list[str | ParsedResume]) -> np.ndarray:
+        """Embed many resumes in one batched encode → (N, 384) matrix."""
+        return self._embedder.generate_batch(texts)
+
     # ------------------------------------------------------------------
     # Hybrid Scoring Logic
     # ------------------------------------------------------------------
 
-    def _hybrid_rerank(
+    def _hybrid_rank(
         self,
-        base_matches: list[dict],
+        role_scores: np.ndarray,
         candidate_skills: list[str],
         candidate_experience: int | float,
         candidate_keywords: list[str],
+        top_k: int,
     ) -> list[dict]:
         """
-        Re-rank initial semantic matches using skill/experience/keyword boosts.
+        Score every role with semantic/skill/experience/keyword components
+        in one vectorised pass and return the ``top_k`` best.
 
         Scoring formula (0-1 scale):
           final_score = 0.40*semantic + 0.35*skills + 0.15*experience + 0.10*keywords
 
-        Returns re-ranked list with updated scores and breakdown.
+        Skill and keyword overlap are sparse matrix-vector products against
+        ``vector_store.get_role_features()``, so a role with a modest
+        embedding score but a strong skill match is still considered.
         """
-        cand_skills_set = {s.lower().strip() for s in candidate_skills}
-        cand_keywords_set = {k.lower().strip() for k in candidate_keywords}
-
-        enhanced = []
-        for match in base_matches:
-            role_name = match["role_name"]
-            semantic_score = match["score"]  # Already 0-1 from cosine similarity
-
-            # ── Component 2: Skill Overlap ──
-            role_skills = vector_store.get_role_skills(role_name)
-            role_skills_set = {s.lower().strip() for s in role_skills}
-
-            if role_skills_set:
-                skill_overlap = len(cand_skills_set & role_skills_set) / len(role_skills_set)
-            else:
-                skill_overlap = 0.0
-
-            # ── Component 3: Experience Alignment ──
-            role_obj = next(
-                (r for r in vector_store.get_roles() if r.role_name == role_name),
-                None,
-            )
-            if role_obj:
-                role_min = float(role_obj.years_experience_min) if role_obj.years_experience_min else 0
-                role_max = float(role_obj.years_experience_max) if role_obj.years_experience_max else role_min * 2
-            else:
-                role_min = role_max = 0
-
-            exp_score = self._compute_exp_alignment(candidate_experience, role_min, role_max)
-
-            # ── Component 4: Keyword/Domain Match ──
-            role_keywords = vector_store.get_role_keywords(role_name)
-            role_keywords_set = {k.lower().strip() for k in role_keywords}
-
-            if role_keywords_set:
-                keyword_overlap = len(cand_keywords_set & role_keywords_set) / len(role_keywords_set)
-            else:
-                keyword_overlap = 0.0
-
-            # ── Final Hybrid Score ──
-            final_score = (
-                self.W_SEMANTIC * semantic_score
-                + self.W_SKILLS * skill_overlap
-                + self.W_EXPERIENCE * exp_score
-                + self.W_KEYWORDS * keyword_overlap
-            )
+        features = vector_store.get_role_features()
+        roles = vector_store.get_roles()
+        if features is None or not roles:
+            return []
+
+        # ── Component 1: Semantic similarity (cosine to every role) ──
+        semantic = np.round(np.asarray(role_scores, dtype=np.float64), 4)
+
+        # ── Component 2: Skill Overlap ──
+        skill_overlap = self._overlap(
+            {s.lower().strip() for s in candidate_skills},
+            features.skill_vocab, features.skills, features.skill_counts,
+        )
+
+        # ── Component 3: Experience Alignment ──
+        exp_score = self._exp_alignment(
+            float(candidate_experience), features.exp_min, features.exp_max,
+        )
+
+        # ── Component 4: Keyword/Domain Match ──
+        keyword_overlap = self._overlap(
+            {k.lower().strip() for k in candidate_keywords},
+            features.keyword_vocab, features.keywords, features.keyword_counts,
+        )
 
-            enhanced.append({
-                **match,
-                "score": round(final_score, 4),
+        # ── Final Hybrid Score ──
+        final_score = (
+            self.W_SEMANTIC * semantic
+            + self.W_SKILLS * skill_overlap
+            + self.W_EXPERIENCE * exp_score
+            + self.W_KEYWORDS * keyword_overlap
+        )
+        final_rounded = np.round(final_score, 4)
+
+        # Best first; ties keep the semantic order (then catalogue order).
+        # Only roles scoring at least the k-th best need the full sort.
+        if 0 < top_k < len(final_rounded):
+            kth = final_rounded[np.argpartition(-final_rounded, top_k - 1)[:top_k]].min()
+            candidates = np.flatnonzero(final_rounded >= kth)
+        else:
+            candidates = np.arange(len(final_rounded))
+        order = candidates[np.lexsort((-semantic[candidates], -final_rounded[candidates]))][:top_k]
+
+        ranked = []
+        for rank, pos in enumerate(order.tolist(), start=1):
+            role = roles[pos]
+            ranked.append({
+                "rank": rank,
+                "role_name": role.role_name,
+                "role_category": role.role_category,
+                "role_level": role.role_level,
+                "domain": role.domain,
+                "industry_sector": role.industry_sector,
+                "score": round(float(final_score[pos]), 4),
                 "breakdown": {
-                    "semantic": round(semantic_score, 4),
-                    "skills": round(skill_overlap, 4),
-                    "experience": round(exp_score, 4),
-                    "keywords": round(keyword_overlap, 4),
+                    "semantic": round(float(semantic[pos]), 4),
+                    "skills": round(float(skill_overlap[pos]), 4),
+                    "experience": round(float(exp_score[pos]), 4),
+                    "keywords": round(float(keyword_overlap[pos]), 4),
                 },
             })
+        return ranked
 
-        # Sort by final hybrid score descending
-        enhanced.sort(key=lambda x: x["score"], reverse=True)
-
-        # Re-assign ranks
-        for rank, match in enumerate(enhanced, start=1):
-            match["rank"] = rank
-
-        return enhanced
+    @staticmethod
+    def _overlap(
+        terms: set[str],
+        vocab: Mapping[str, int],
+        matrix: sparse.csr_matrix,
+        counts: np.ndarray,
+    ) -> np.ndarray:
+        """Fraction of each role's terms present in ``terms`` → (N,) array."""
+        hits = np.zeros(matrix.shape[1], dtype=np.float32)
+        hits[[vocab[t] for t in terms if t in vocab]] = 1.0
+        shared = matrix @ hits
+        return np.divide(
+            shared, counts, out=np.zeros(len(counts), dtype=np.float64), where=counts > 0,
+        )
 
     @staticmethod
-    def _compute_exp_alignment(
+    def _exp_alignment(
         candidate_exp: float,
-        role_min: float,
-        role_max: float,
-    ) -> float:
+        role_min: np.ndarray,
+        role_max: np.ndarray,
+    ) -> np.ndarray:
         """
-        Calculate experience alignment score (0-1).
+        Calculate experience alignment score (0-1) for every role.
 
         Logic:
+          - No minimum: 1.0
           - Below min: scaled 0 → 0.7
           - Within range: 0.7 → 1.0
           - Above max: 1.0 (over-qualification is fine for matching)
         """
-        if role_min <= 0:
-            return 1.0  # No requirement — perfect match
-
-        if candidate_exp < role_min:
-            # Under-qualified: scale from 0 to 0.7
-            return (candidate_exp / role_min) * 0.7
-
-        if candidate_exp <= role_max:
-            # Perfect fit: scale from 0.7 to 1.0
-            if role_max == role_min:
-                return 1.0
-            progress = (candidate_exp - role_min) / (role_max - role_min)
-            return 0.7 + progress * 0.3
-
-        # Over-qualified: still 1.0 (for matching purposes)
-        return 1.0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            under = candidate_exp / role_min * 0.7
+            span = role_max - role_min
+            within = np.where(span == 0, 1.0, 0.7 + (candidate_exp - role_min) / span * 0.3)
+        return np.select(
+            [role_min <= 0, candidate_exp < role_min, candidate_exp <= role_max],
+            [1.0, under, within],
+            default=1.0,
+        )
@@ -5,8 +5,7 @@ Maps skill variations, abbreviations, and synonyms to canonical skill names.
 
 import logging
 
-import pandas as pd
-from app.config import settings
+from app.core import dataset_snapshot
 
 logger = logging.getLogger(__name__)
 
@@ -285,16 +284,14 @@ BUILTIN_SYNONYMS: dict[str, str] = {
 class SkillNormalizationEngine:
 
     def __init__(self):
-        # Load CSV synonyms as supplementary mappings
-        csv_path = settings.DATASETS_DIR / "skill_synonyms.csv"
+        # Load CSV synonyms as supplementary mappings (compiled snapshot when fresh)
         self.csv_synonyms: dict[str, str] = {}
         try:
-            df = pd.read_csv(csv_path)
-            for _, row in df.iterrows():
-                orig = str(row["original_term"]).strip().lower()
-                canon = str(row["normalized_skill_name"]).strip().lower()
-                if orig and canon and orig != canon:
-                    self.csv_synonyms[orig] = canon
+            columns = dataset_snapshot.load("skill_synonyms")
+            self.csv_synonyms = dict(zip(
+                columns["original_term"].tolist(),
+                columns["normalized_skill_name"].tolist(),
+            ))
         except Exception:
             logger.warning("Could not load skill_synonyms.csv — using built-in map only")
 
@@ -2,7 +2,8 @@
 TalentIQ — Engine 10: Soft Skill Analysis Engine
 Detects leadership, communication, teamwork, and adaptability signals.
 
-Performance-optimized: pre-builds a dict lookup instead of iterating 50K rows.
+Performance-optimized: pre-builds a dict lookup from the compiled dataset
+snapshot instead of iterating 50K CSV rows.
 Score is normalized to 0-100 scale for consistent dashboard display.
 
 Output contract:
@@ -17,9 +18,8 @@ from __future__ import annotations
 
 import logging
 
-import pandas as pd
-
-from app.config import settings
+from app.core import dataset_snapshot
+from app.core.parsed_resume import ParsedResume
 
 logger = logging.getLogger(__name__)
 
@@ -35,30 +35,26 @@ class SoftSkillEngine:
         self._indicators: dict[str, dict] = {}
         self._load_builtin_defaults()
 
-        # Supplement with CSV data (add any phrases we don't already have)
-        csv_path = settings.DATASETS_DIR / "soft_skill_indicators.csv"
+        # Supplement with CSV data (add any phrases we don't already have).
+        # The snapshot is already deduplicated: one row per phrase, best
+        # confidence first, weights floored at 0.3.
         try:
-            df = pd.read_csv(csv_path)
-            df["phrase_lower"] = df["phrase_pattern"].str.lower().str.strip()
-            df["weight"] = pd.to_numeric(df["weight"], errors="coerce").fillna(0.5)
-            df["confidence_score"] = pd.to_numeric(
-                df["confidence_score"], errors="coerce"
-            ).fillna(0.5)
-
-            deduped = (
-                df.sort_values("confidence_score", ascending=False)
-                .drop_duplicates(subset=["phrase_lower", "soft_skill_type"], keep="first")
-            )
+            columns = dataset_snapshot.load("soft_skill_indicators")
 
             csv_added = 0
-            for _, row in deduped.iterrows():
-                phrase = row["phrase_lower"]
-                if phrase and len(phrase) > 2 and phrase not in self._indicators:
+            for phrase, skill_type, weight, polarity, original in zip(
+                columns["phrase"].tolist(),
+                columns["type"].tolist(),
+                columns["weight"].tolist(),
+                columns["polarity"].tolist(),
+                columns["original"].tolist(),
+            ):
+                if phrase not in self._indicators:
                     self._indicators[phrase] = {
-                        "type": str(row["soft_skill_type"]).strip(),
-                        "weight": max(float(row["weight"]), 0.3),  # floor low weights
-                        "polarity": str(row.get("polarity", "positive")).strip().lower(),
-                        "original": str(row["phrase_pattern"]).strip(),
+                        "type": skill_type,
+                        "weight": weight,
+                        "polarity": polarity,
+                        "original": original,
                     }
                     csv_added += 1
 
@@ -134,7 +130,7 @@ class SoftSkillEngine:
         }
         self._indicators = defaults
 
-    def analyze(self, text: str) -> dict:
+    def analyze(self, text: str | ParsedResume) -> dict:
         """
         Scan resume text for soft-skill indicator phrases.
 
@@ -144,7 +140,7 @@ class SoftSkillEngine:
             composite_score (0-100), categories, detected, matches, match_count
         """
         try:
-            text_lower = text.lower()
+            text_lower = ParsedResume.of(text).lower
             raw_score: float = 0.0
             categories: set[str] = set()
             detected: set[str] = set()
@@ -4,14 +4,23 @@ Main FastAPI Application Entry Point
 """
 
 import logging
+import time
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
 from app.config import settings
-from app.core import vector_store
-from app.routers import upload, analyze
+from app.core import (
+    dataset_registry,
+    embedding_dispatcher,
+    metrics,
+    model_loader,
+    pipeline_executor,
+    vector_store,
+)
+from app.routers import upload, analyze, metrics as metrics_router
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -23,8 +32,17 @@ async def lifespan(app: FastAPI):
     logger.info("🚀 Starting %s v%s …", settings.APP_NAME, settings.APP_VERSION)
     vector_store.initialise()
     logger.info("✅ Vector store ready — %d roles indexed", len(vector_store.get_roles()))
+    analyze.analysis_service.jd_comparer.pin_defaults()
+    if settings.EMBEDDING_WARMUP:
+        load_seconds = model_loader.warm_up()
+        logger.info("✅ Embedding model warm (%.2f s load)", load_seconds)
+    pipeline_executor.start()
+    analyze.job_manager.start()
+    analyze.analysis_service.upload_store.purge()
     yield
     logger.info("👋 Shutting down %s", settings.APP_NAME)
+    analyze.job_manager.shutdown()
+    pipeline_executor.shutdown()
 
 
 app = FastAPI(
@@ -44,6 +62,95 @@ app.add_middleware(
 )
 
 
+# Room for the multipart framing and text fields (target_role, jd_text, …)
+_FORM_OVERHEAD_MB = 1
+
+
+def request_body_limit(path: str) -> int:
+    """Largest body accepted on ``path``: one file, or ``MAX_BATCH_MB`` for a batch."""
+    if path.rstrip("/").endswith("/analyze/batch"):
+        limit_mb = max(settings.MAX_BATCH_MB, settings.MAX_FILE_SIZE_MB)
+    else:
+        limit_mb = settings.MAX_FILE_SIZE_MB
+    return (limit_mb + _FORM_OVERHEAD_MB) * 1024 * 1024
+
+
+class RequestSizeLimitMiddleware:
+    """
+    Reject request bodies larger than ``request_body_limit`` with 413.
+
+    Bytes are counted as they arrive on the ASGI ``receive`` stream, so an
+    oversized upload is cut off before Starlette finishes spooling the
+    multipart form — with or without a Content-Length (chunked transfer).
+    A declared Content-Length over the limit is rejected without reading.
+    Individual files are also capped at ``MAX_FILE_SIZE_MB`` while read.
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        limit = request_body_limit(scope["path"])
+        detail = f"Request body exceeds the {limit / (1024 * 1024):g} MB limit"
+        headers = dict(scope.get("headers") or [])
+        content_length = headers.get(b"content-length", b"")
+        if content_length.isdigit() and int(content_length) > limit:
+            await JSONResponse(status_code=413, content={"detail": detail})(scope, receive, send)
+            return
+
+        received = 0
+        started = False
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    # Re-raised by FastAPI's body parsing → 413 response
+                    raise HTTPException(status_code=413, detail=detail)
+            return message
+
+        async def tracking_send(message):
+            nonlocal started
+            if message["type"] == "http.response.start":
+                started = True
+            await send(message)
+
+        try:
+            await self.app(scope, limited_receive, tracking_send)
+        except HTTPException as exc:
+            # Body read outside a route (e.g. by a middleware)
+            if exc.status_code != 413 or started:
+                raise
+            await JSONResponse(status_code=413, content={"detail": detail})(scope, receive, send)
+
+
+app.add_middleware(RequestSizeLimitMiddleware)
+
+
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    """Count requests and time them per route template (for ``/metrics``)."""
+    start = time.perf_counter()
+    status_code = 500
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+        return response
+    finally:
+        route = request.scope.get("route")
+        path = getattr(route, "path", "unmatched")
+        metrics.http_requests.labels(request.method, path, str(status_code)).inc()
+        metrics.http_request_seconds.labels(request.method, path).observe(
+            time.perf_counter() - start
+        )
+
+
 @app.get("/", tags=["Health"])
 async def root():
     return {
@@ -55,8 +162,20 @@ async def root():
 
 @app.get("/health", tags=["Health"])
 async def health_check():
-    return {"status": "TalentIQ backend running"}
+    return {
+        "status": "TalentIQ backend running",
+        "model_loaded": model_loader.is_loaded(),
+        "model_load_seconds": model_loader.load_time(),
+        "embedding_backend": model_loader.active_backend(),
+        "embedding_dispatcher": embedding_dispatcher.stats(),
+        "datasets": dataset_registry.stats(),
+        "pipeline": pipeline_executor.stats(),
+        "jobs": analyze.job_manager.stats(),
+        "result_cache": analyze.analysis_service.result_cache.stats(),
+        "profile_cache": analyze.analysis_service.profile_cache.stats(),
+    }
 
 # --- Routers ---
 app.include_router(upload.router)
 app.include_router(analyze.router)
+app.include_router(metrics_router.router)
@@ -1,19 +1,34 @@
 """
 TalentIQ — Analyze Router
-POST /analyze  — full analysis pipeline (file + optional target_role & jd_text)
-GET  /roles    — list all available roles for the UI dropdown
+POST   /analyze            — full analysis pipeline (file + optional target_role & jd_text)
+POST   /analyze/stream     — same pipeline, streamed as NDJSON / SSE events per section
+POST   /analyze/batch      — many resumes in one request (batched embedding + search)
+POST   /analyze/jobs       — same pipeline, asynchronously (returns a job id)
+GET    /analyze/jobs/{id}  — job status and, once finished, the report
+DELETE /analyze/jobs/{id}  — cancel a queued or running job
+GET    /roles              — list all available roles for the UI dropdown
 """
 
-from fastapi import APIRouter, UploadFile, File, Form, HTTPException
+import asyncio
+import json
 from typing import Optional
 
+from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Query, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+
+from app.config import settings
+from app.engines.file_processing_engine import DocumentLimitError
 from app.services.analysis_service import AnalysisService
-from app.core import vector_store
+from app.services.upload_store import UploadTooLargeError
+from app.services.job_service import STATUS_CANCELLED, JobManager, JobQueueFullError
+from app.core import pipeline_executor, vector_store
 
 router = APIRouter()
 
 # Single service instance — engines are initialised once
 analysis_service = AnalysisService()
+job_manager = JobManager()
 
 
 @router.get("/roles", tags=["Roles"])
@@ -46,6 +61,9 @@ async def analyze_resume(
       best semantic match is used automatically.
     - **jd_text**: (optional) job description to compare — if omitted, the
       default JD for the resolved role is loaded from the database.
+
+    Returns 413 if the file exceeds ``MAX_FILE_SIZE_MB`` and 422 if the
+    document exceeds ``MAX_PDF_PAGES`` / ``MAX_EXTRACTED_CHARS``.
     """
     try:
         report = await analysis_service.process(
@@ -53,6 +71,14 @@ async def analyze_resume(
             target_role=target_role,
             jd_text=jd_text,
         )
+    except UploadTooLargeError as exc:
+        raise HTTPException(status_code=413, detail=str(exc))
+    except DocumentLimitError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+    except pipeline_executor.QueueFullError as exc:
+        raise HTTPException(
+            status_code=503, detail=str(exc), headers={"Retry-After": "5"},
+        )
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc))
 
@@ -60,3 +86,209 @@ async def analyze_resume(
         raise HTTPException(status_code=400, detail=report["error"])
 
     return report
+
+
+def _upload_error(exc: ValueError) -> HTTPException:
+    status_code = 413 if isinstance(exc, UploadTooLargeError) else 400
+    return HTTPException(status_code=status_code, detail=str(exc))
+
+
+def _format_event(event: str, data, fmt: str) -> str:
+    data = jsonable_encoder(data)
+    if fmt == "sse":
+        return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+    return json.dumps({"event": event, "data": data}) + "\n"
+
+
+@router.post("/analyze/stream", tags=["Analysis"])
+async def analyze_resume_stream(
+    request: Request,
+    file: UploadFile = File(...),
+    target_role: Optional[str] = Form(None),
+    jd_text: Optional[str] = Form(None),
+    fmt: Optional[str] = Query(None, alias="format", pattern="^(ndjson|sse)$"),
+):
+    """
+    Run the full analysis and stream each report section as it finishes.
+
+    Events use the report's own keys — ``candidate_profile``,
+    ``role_matches``, ``ats_score``, ``skill_gap``, ``soft_skill``, … —
+    followed by ``meta`` and finally ``summary``. On failure a single
+    ``error`` event is sent.
+
+    - **format**: ``ndjson`` (one ``{"event", "data"}`` object per line) or
+      ``sse`` (``text/event-stream``). Defaults to SSE when the ``Accept``
+      header asks for ``text/event-stream``, NDJSON otherwise.
+
+    POST only: the resume is uploaded in the request body.
+    """
+    if fmt is None:
+        accept = request.headers.get("accept", "")
+        fmt = "sse" if "text/event-stream" in accept else "ndjson"
+
+    try:
+        upload = await analysis_service.read_upload(file)
+    except ValueError as exc:
+        raise _upload_error(exc)
+
+    loop = asyncio.get_running_loop()
+    events: asyncio.Queue = asyncio.Queue()
+
+    def on_event(key: str, value: dict) -> None:
+        loop.call_soon_threadsafe(events.put_nowait, (key, value))
+
+    try:
+        future = pipeline_executor.submit(
+            analysis_service.stream_job(
+                upload.data, on_event, filename=upload.filename,
+                target_role=target_role, jd_text=jd_text,
+            )
+        )
+    except pipeline_executor.QueueFullError as exc:
+        raise HTTPException(
+            status_code=503, detail=str(exc), headers={"Retry-After": "5"},
+        )
+    # Queued after every event the job emitted, so it marks the end
+    future.add_done_callback(lambda _: loop.call_soon_threadsafe(events.put_nowait, None))
+
+    async def event_stream():
+        sent: set[str] = set()
+        try:
+            while (item := await events.get()) is not None:
+                key, value = item
+                sent.add(key)
+                yield _format_event(key, value, fmt)
+
+            try:
+                report = future.result()
+            except Exception as exc:
+                status_code = 422 if isinstance(exc, DocumentLimitError) else 500
+                yield _format_event(
+                    "error", {"detail": str(exc), "status_code": status_code}, fmt,
+                )
+                return
+            if "error" in report and "summary" not in report:
+                yield _format_event("error", {"detail": report["error"]}, fmt)
+                return
+
+            # Anything not streamed live (process mode, meta), summary last
+            for key, value in report.items():
+                if key not in sent and key != "summary":
+                    yield _format_event(key, value, fmt)
+            yield _format_event("summary", report.get("summary", {}), fmt)
+        finally:
+            future.cancel()  # no-op once finished; drops a still-queued job
+
+    media_type = "text/event-stream" if fmt == "sse" else "application/x-ndjson"
+    return StreamingResponse(
+        event_stream(),
+        media_type=media_type,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.post("/analyze/batch", tags=["Analysis"])
+async def analyze_batch(
+    files: Optional[list[UploadFile]] = File(None),
+    texts: Optional[list[str]] = Form(None),
+    target_role: Optional[str] = Form(None),
+    jd_text: Optional[str] = Form(None),
+):
+    """
+    Analyze many resumes in one request.
+
+    - **files**: PDF/DOCX resumes (repeat the field for each file)
+    - **texts**: plain-text resumes (repeat the field for each text)
+    - **target_role** / **jd_text**: optional, shared by every resume
+
+    All resumes are embedded in one batched encode and scored against
+    every role in one matmul. Returns per-item reports plus aggregate
+    timing; a bad item is reported as an error without failing the batch.
+    """
+    files = files or []
+    texts = [t for t in (texts or []) if t and t.strip()]
+    count = len(files) + len(texts)
+    if count == 0:
+        raise HTTPException(status_code=400, detail="Provide at least one file or text.")
+    if count > settings.MAX_BATCH_SIZE:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch of {count} exceeds MAX_BATCH_SIZE={settings.MAX_BATCH_SIZE}",
+        )
+
+    items: list[dict] = []
+    for file in files:
+        name = file.filename or "resume"
+        try:
+            items.append(await analysis_service.batch_item(file))
+        except ValueError as exc:
+            items.append({"name": name, "error": str(exc)})
+    for i, text in enumerate(texts, start=1):
+        items.append({"name": f"text_{i}", "text": text})
+
+    try:
+        return await pipeline_executor.run(
+            analysis_service.batch_job(items, target_role=target_role, jd_text=jd_text)
+        )
+    except pipeline_executor.QueueFullError as exc:
+        raise HTTPException(
+            status_code=503, detail=str(exc), headers={"Retry-After": "5"},
+        )
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=str(exc))
+
+
+@router.post("/analyze/jobs", status_code=202, tags=["Analysis"])
+async def create_analysis_job(
+    file: UploadFile = File(...),
+    target_role: Optional[str] = Form(None),
+    jd_text: Optional[str] = Form(None),
+):
+    """
+    Queue a resume for analysis and return immediately with a job id.
+
+    Poll ``GET /analyze/jobs/{job_id}`` until ``status`` is ``succeeded``
+    (the report is under ``result``), ``failed`` or ``cancelled``.
+    """
+    try:
+        upload = await analysis_service.read_upload(file)
+    except ValueError as exc:
+        raise _upload_error(exc)
+
+    try:
+        job = job_manager.submit(
+            analysis_service.pipeline_job(
+                upload.data, filename=upload.filename,
+                target_role=target_role, jd_text=jd_text,
+            ),
+            filename=file.filename or "resume",
+            target_role=target_role,
+        )
+    except JobQueueFullError as exc:
+        raise HTTPException(
+            status_code=503, detail=str(exc), headers={"Retry-After": "30"},
+        )
+
+    return {**job.to_dict(), "status_url": f"/analyze/jobs/{job.job_id}"}
+
+
+@router.get("/analyze/jobs/{job_id}", tags=["Analysis"])
+async def get_analysis_job(job_id: str):
+    """Return a job's status, and its report once it has succeeded."""
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job '{job_id}' not found or expired")
+    return job.to_dict()
+
+
+@router.delete("/analyze/jobs/{job_id}", tags=["Analysis"])
+async def cancel_analysis_job(job_id: str):
+    """Cancel a queued or running job (a running job's result is discarded)."""
+    job = job_manager.cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job '{job_id}' not found or expired")
+    if job.status != STATUS_CANCELLED:
+        raise HTTPException(
+            status_code=409, detail=f"Job '{job_id}' already {job.status}",
+        )
+    return job.to_dict()
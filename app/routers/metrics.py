@@ -0,0 +1,128 @@
+"""
+TalentIQ — Metrics Router
+GET    /metrics            — Prometheus text exposition of in-process metrics
+
+Engine/step histograms are observed where the work runs. With
+``PIPELINE_EXECUTOR="process"`` the pipeline runs in worker processes, so
+only work done in the API process shows up here — the per-request
+breakdown in ``meta.timings_seconds`` is complete in both modes.
+"""
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.core import (
+    dataset_registry,
+    embedding_dispatcher,
+    metrics,
+    model_loader,
+    pipeline_executor,
+    vector_store,
+)
+from app.routers.analyze import analysis_service, job_manager
+
+router = APIRouter()
+
+
+def _render() -> str:
+    out = metrics.PrometheusText()
+
+    # ── HTTP ─────────────────────────────────────────────────────
+    out.counter(
+        "talentiq_http_requests_total", "HTTP requests by route template and status.",
+        [(labels, c.value) for labels, c in metrics.http_requests.items()],
+    )
+    out.histogram(
+        "talentiq_http_request_duration_seconds", "Time to response headers per route.",
+        [(labels, h.snapshot()) for labels, h in metrics.http_request_seconds.items()],
+    )
+
+    # ── Pipeline steps / engines ─────────────────────────────────
+    out.histogram(
+        "talentiq_step_duration_seconds",
+        "Wall time per pipeline step and engine (nested steps overlap).",
+        [(labels, h.snapshot()) for labels, h in metrics.step_seconds.items()],
+    )
+
+    # ── Executor and jobs ────────────────────────────────────────
+    pipeline = pipeline_executor.stats()
+    out.gauge("talentiq_pipeline_workers", "Pipeline executor workers.", pipeline["workers"])
+    out.gauge("talentiq_pipeline_in_flight", "Analyses running or queued.", pipeline["in_flight"])
+    out.gauge("talentiq_pipeline_queued", "Analyses waiting for a worker.", pipeline["queued"])
+    for key in ("submitted", "completed", "failed", "rejected"):
+        out.counter(
+            f"talentiq_pipeline_{key}_total", f"Pipeline jobs {key}.", pipeline[key],
+        )
+    jobs = job_manager.stats()
+    out.gauge(
+        "talentiq_jobs", "Asynchronous analysis jobs by status.",
+        [({"status": status}, jobs[status])
+         for status in ("queued", "running", "succeeded", "failed", "cancelled")],
+    )
+
+    # ── Caches ───────────────────────────────────────────────────
+    result_cache = analysis_service.result_cache.stats()
+    profile_cache = analysis_service.profile_cache.stats()
+    jd_cache = analysis_service.jd_comparer.cache_stats()
+    caches = {
+        "result": (result_cache["hits"] + result_cache["disk_hits"], result_cache),
+        "profile": (profile_cache["hits"], profile_cache),
+        "jd": (jd_cache["hits"], jd_cache),
+    }
+    out.counter(
+        "talentiq_cache_hits_total", "Cache hits.",
+        [({"cache": name}, hits) for name, (hits, _) in caches.items()],
+    )
+    out.counter(
+        "talentiq_cache_misses_total", "Cache misses.",
+        [({"cache": name}, s["misses"]) for name, (_, s) in caches.items()],
+    )
+    out.gauge(
+        "talentiq_cache_hit_ratio", "Hits / lookups since start.",
+        [({"cache": name}, s["hit_ratio"]) for name, (_, s) in caches.items()],
+    )
+    out.gauge(
+        "talentiq_cache_entries", "Entries currently cached.",
+        [({"cache": name}, s["entries"]) for name, (_, s) in caches.items()],
+    )
+    out.gauge("talentiq_result_cache_bytes", "Bytes held by the result cache.", result_cache["bytes"])
+
+    # ── Embedding model, dispatcher and index ────────────────────
+    out.gauge("talentiq_model_loaded", "Embedding model loaded.", model_loader.is_loaded())
+    out.gauge(
+        "talentiq_model_load_seconds", "Seconds spent loading the embedding model.",
+        model_loader.load_time() or 0.0,
+    )
+    dispatcher = embedding_dispatcher.stats()
+    out.gauge("talentiq_embedding_queue_depth", "Encode requests waiting.", dispatcher["queued"])
+    out.histogram(
+        "talentiq_embedding_batch_size", "Texts per encode call.", dispatcher["batch_size"],
+    )
+    out.histogram(
+        "talentiq_embedding_queue_wait_milliseconds",
+        "Wait before an encode request joins a batch.", dispatcher["wait_ms"],
+    )
+    embeddings = vector_store.get_embeddings()
+    out.gauge("talentiq_index_roles", "Roles in the vector store.", len(vector_store.get_roles()))
+    out.gauge(
+        "talentiq_index_bytes", "Size of the role embedding matrix.",
+        int(embeddings.nbytes) if embeddings is not None else 0,
+    )
+
+    # ── Datasets ─────────────────────────────────────────────────
+    datasets = dataset_registry.stats()
+    out.gauge(
+        "talentiq_dataset_load_seconds", "Seconds spent loading each dataset.",
+        [({"dataset": name}, d["load_seconds"]) for name, d in datasets.items()],
+    )
+    out.gauge(
+        "talentiq_dataset_bytes", "Approximate in-memory size of each dataset.",
+        [({"dataset": name}, d["nbytes"]) for name, d in datasets.items()],
+    )
+    return out.render()
+
+
+@router.get("/metrics", tags=["Health"], response_class=PlainTextResponse)
+async def prometheus_metrics():
+    """Prometheus scrape endpoint (text exposition format 0.0.4)."""
+    return PlainTextResponse(_render(), media_type=metrics.PrometheusText.CONTENT_TYPE)
@@ -1,27 +1,30 @@
 """
 TalentIQ — Resume Upload Router
 Handles PDF/DOCX resume file uploads.
+
+Files are parsed straight from the upload buffer; a copy is kept only when
+``PERSIST_UPLOADS`` is enabled (content-addressed, see ``UploadStore``).
 """
 
 from fastapi import APIRouter, UploadFile, File, HTTPException
-import shutil
 import os
 
 from app.config import settings
-from app.engines.file_processing_engine import FileProcessingEngine
+from app.core import pipeline_executor
+from app.engines.file_processing_engine import DocumentLimitError, FileProcessingEngine
+from app.routers.analyze import analysis_service
+from app.services.upload_store import UploadTooLargeError, read_limited
 
 router = APIRouter()
 
-UPLOAD_FOLDER = os.path.join(settings.BASE_DIR, "uploads")
-os.makedirs(UPLOAD_FOLDER, exist_ok=True)
-
 file_engine = FileProcessingEngine()
+upload_store = analysis_service.upload_store   # one store, one purge schedule
 
 
 @router.post("/upload", tags=["Upload"])
 async def upload_resume(file: UploadFile = File(...)):
     # Validate extension
-    filename = file.filename or "resume"
+    filename = os.path.basename(file.filename or "resume")
     ext = os.path.splitext(filename)[1].lower()
     if ext not in settings.ALLOWED_EXTENSIONS:
         raise HTTPException(
@@ -29,16 +32,26 @@ async def upload_resume(file: UploadFile = File(...)):
             detail=f"Invalid file type '{ext}'. Allowed: {', '.join(settings.ALLOWED_EXTENSIONS)}",
         )
 
-    file_path = os.path.join(UPLOAD_FOLDER, filename)
-
-    with open(file_path, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
-
-    # Extract text using File Processing Engine
-    extracted_text = file_engine.extract_text(file_path)
+    try:
+        data = await read_limited(file, declared_size=file.size, filename=filename)
+    except UploadTooLargeError as exc:
+        raise HTTPException(status_code=413, detail=str(exc))
+
+    # Extract text using File Processing Engine — CPU-bound, so it runs on
+    # the pipeline executor like /analyze instead of blocking the event loop
+    try:
+        extracted_text = await pipeline_executor.run(file_engine.extract_text, data, filename)
+    except DocumentLimitError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+    except pipeline_executor.QueueFullError as exc:
+        raise HTTPException(
+            status_code=503, detail=str(exc), headers={"Retry-After": "5"},
+        )
+    except (ValueError, RuntimeError) as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
 
     return {
-        "file_path": file_path,
+        "file_path": upload_store.save(data, filename),   # None unless PERSIST_UPLOADS
         "extracted_text": extracted_text,
         "char_count": len(extracted_text),
     }
@@ -8,7 +8,7 @@ Redesigned Pipeline (v3 — Stabilized):
     3.  Extract skills/info       (InformationExtractionEngine)
     4.  Normalize skills          (SkillNormalizationEngine)
     5.  Generate resume embedding (via SemanticMatchingEngine)
-    6.  Match job roles           (SemanticMatchingEngine → FAISS)
+    6.  Match job roles           (SemanticMatchingEngine → all roles)
     7.  Resolve target role       (user-selected or top semantic match)
     8.  Resolve JD                (user-provided or default from DB)
     9.  Compute ATS score         (ATSScoringEngine)
@@ -23,6 +23,12 @@ Redesigned Pipeline (v3 — Stabilized):
     18. Suggest career paths      (CareerPathEngine)
     19. Compile final report      (FeedbackEngine)
 
+Steps 9-18 form a dependency graph run by ``stage_scheduler``: engines
+that only need the text, skills and resolved role run concurrently;
+certifications wait for the skill gap, the explanation for the skill gap
+and ATS score. ``meta.stages`` records per-stage timings and the critical
+path.
+
 Error Handling:
     Every engine call is wrapped in try/except. If an engine fails, a
     safe default is used so the pipeline never crashes entirely.
@@ -31,15 +37,29 @@ Error Handling:
 from __future__ import annotations
 
 import logging
+import copy
+import hashlib
 import os
-import shutil
 import time
 import traceback
+from functools import partial
+from typing import Callable
 
+import numpy as np
 from fastapi import UploadFile
 
 from app.config import settings
-from app.core import vector_store
+from app.core import metrics, model_loader, pipeline_executor, stage_scheduler, vector_store
+from app.core.lru_cache import LRUCache
+from app.core.parsed_resume import ParsedResume
+from app.core.stage_scheduler import Stage
+from app.services.result_cache import ResultCache
+from app.services.upload_store import (
+    ResumeUpload,
+    UploadStore,
+    UploadTooLargeError,
+    read_limited,
+)
 
 # Engines
 from app.engines.file_processing_engine import FileProcessingEngine
@@ -61,14 +81,19 @@ from app.engines.ats_simulation_engine import ATSSimulationEngine
 
 logger = logging.getLogger(__name__)
 
-# Upload directory — created on demand
-UPLOAD_DIR = os.path.join(str(settings.BASE_DIR), "uploads")
+# Per-request inputs available to the stage graph (steps 9-18)
+_STAGE_CONTEXT = frozenset({
+    "resume", "jd_text", "normalized_skills", "role_required_skills",
+    "role_keywords", "role_name", "role_id", "role_min_exp", "role_max_exp",
+    "max_years", "semantic_score",
+})
 
 
 def _safe_call(engine_name: str, fn, *args, **kwargs) -> dict:
-    """Call an engine function and return a safe fallback on failure."""
+    """Call an engine function (timed) and return a safe fallback on failure."""
     try:
-        result = fn(*args, **kwargs)
+        with metrics.timed(engine_name):
+            result = fn(*args, **kwargs)
         return result if isinstance(result, dict) else {}
     except Exception as exc:
         logger.error(
@@ -78,6 +103,19 @@ def _safe_call(engine_name: str, fn, *args, **kwargs) -> dict:
         return {"_error": f"{engine_name} failed: {exc}"}
 
 
+# Process-pool workers build their own service on first use
+_worker_service: AnalysisService | None = None
+
+
+def _run_in_worker(method: str, *args, **kwargs) -> dict:
+    """Entry point for ``pipeline_executor`` in process mode (picklable)."""
+    global _worker_service  # noqa: PLW0603
+
+    if _worker_service is None:
+        _worker_service = AnalysisService()
+    return getattr(_worker_service, method)(*args, **kwargs)
+
+
 class AnalysisService:
     """The Brain — orchestrates every TalentIQ engine in one call."""
 
@@ -99,6 +137,12 @@ class AnalysisService:
         self.jd_comparer = JDComparisonEngine()
         self.ats_simulator = ATSSimulationEngine()
 
+        self._stages = self._build_stages()
+        stage_scheduler.validate(self._stages, _STAGE_CONTEXT)
+        self.result_cache = ResultCache()
+        self.upload_store = UploadStore()
+        self.profile_cache = LRUCache(settings.PROFILE_CACHE_SIZE)
+
         logger.info("AnalysisService initialised — all 19 engines ready.")
 
     # ------------------------------------------------------------------
@@ -111,40 +155,193 @@ class AnalysisService:
         target_role: str | None = None,
         jd_text: str | None = None,
     ) -> dict:
-        filename = file.filename or "resume"
+        try:
+            upload = await self.read_upload(file)
+        except UploadTooLargeError:
+            raise
+        except ValueError as exc:
+            return {"error": str(exc)}
+
+        # Identical upload + role + JD under the same pipeline version →
+        # serve the stored report instead of re-running every engine
+        target_role = self.canonical_role(target_role)
+        cache_key = self.result_cache.key(upload.sha256, target_role, jd_text)
+        cached = self.result_cache.get(cache_key)
+        if cached is not None:
+            logger.info("process: result cache hit for %s", upload.filename)
+            cached.setdefault("meta", {})["result_cache"] = "hit"
+            return cached
+
+        # The pipeline is CPU-bound — run it on the bounded executor so the
+        # event loop keeps serving other requests. Raises QueueFullError
+        # when the executor is saturated.
+        job = self.pipeline_job(
+            upload.data, filename=upload.filename,
+            target_role=target_role, jd_text=jd_text,
+        )
+        report = await pipeline_executor.run(job)
+        # Key on the backend that actually embedded this report (a worker
+        # process may have fallen back from ONNX to torch)
+        meta = report.get("meta") if isinstance(report.get("meta"), dict) else {}
+        self.result_cache.observe_backend(meta.get("embedding_backend"))
+        cache_key = self.result_cache.key(upload.sha256, target_role, jd_text)
+        self.result_cache.put(cache_key, report)
+        if isinstance(report.get("meta"), dict):
+            report["meta"]["result_cache"] = "miss"
+        return report
+
+    async def read_upload(self, file: UploadFile) -> ResumeUpload:
+        """
+        Validate the extension and read an upload into memory.
+
+        The bytes are parsed in memory; a copy is written to the
+        content-addressed upload store only when ``PERSIST_UPLOADS`` is on.
+
+        Raises
+        ------
+        UploadTooLargeError
+            If the file exceeds ``settings.MAX_FILE_SIZE_MB``.
+        ValueError
+            If the file type is not in ``settings.ALLOWED_EXTENSIONS``.
+        """
+        filename = self._upload_filename(file)
+        data = await read_limited(file, declared_size=file.size, filename=filename)
+        upload = ResumeUpload(
+            filename=filename, data=data, sha256=hashlib.sha256(data).hexdigest(),
+        )
+        self.upload_store.save(upload.data, upload.filename, digest=upload.sha256)
+        return upload
+
+    async def batch_item(self, file: UploadFile) -> dict:
+        """
+        One ``analyze_batch`` item for an upload.
+
+        In thread mode the item carries the spooled upload itself and the
+        batch parses it when its turn comes, so a batch never holds every
+        file's bytes at once. Process mode must pickle the bytes across.
+
+        Raises
+        ------
+        UploadTooLargeError / ValueError
+            As ``read_upload``.
+        """
+        if pipeline_executor.uses_processes() or file.size is None:
+            upload = await self.read_upload(file)
+            return {"name": upload.filename, "data": upload.data}
+
+        filename = self._upload_filename(file)
+        max_bytes = settings.MAX_FILE_SIZE_MB * 1024 * 1024
+        if file.size > max_bytes:
+            raise UploadTooLargeError(
+                f"File '{filename}' exceeds the {settings.MAX_FILE_SIZE_MB} MB upload limit"
+            )
+        if self.upload_store.enabled:
+            data = await file.read()
+            self.upload_store.save(data, filename)
+            del data
+            await file.seek(0)
+        return {"name": filename, "file": file.file}
+
+    @staticmethod
+    def _upload_filename(file: UploadFile) -> str:
+        """The upload's base name; raises ``ValueError`` for a disallowed extension."""
+        filename = os.path.basename(file.filename or "resume")
         ext = os.path.splitext(filename)[1].lower()
         if ext not in settings.ALLOWED_EXTENSIONS:
-            return {
-                "error": (
-                    f"Invalid file type '{ext}'. "
-                    f"Allowed: {', '.join(settings.ALLOWED_EXTENSIONS)}"
-                ),
-            }
+            raise ValueError(
+                f"Invalid file type '{ext}'. "
+                f"Allowed: {', '.join(settings.ALLOWED_EXTENSIONS)}"
+            )
+        return filename
+
+    def canonical_role(self, target_role: str | None) -> str | None:
+        """
+        Collapse whitespace and map a known role to its database spelling,
+        so "data  scientist" and "Data Scientist" resolve (and cache) alike.
+        Unknown roles are kept as typed; blank means "best match".
+        """
+        name = " ".join((target_role or "").split())
+        if not name:
+            return None
+        role = self._find_role(name)
+        return role.role_name if role else name
+
+    def pipeline_job(
+        self,
+        source: str | bytes,
+        filename: str | None = None,
+        target_role: str | None = None,
+        jd_text: str | None = None,
+    ) -> Callable[[], dict]:
+        """Zero-argument callable running ``analyze_file`` — picklable in process mode."""
+        return self._job(
+            "analyze_file", source, filename=filename,
+            target_role=target_role, jd_text=jd_text,
+        )
 
-        os.makedirs(UPLOAD_DIR, exist_ok=True)
-        file_path = os.path.join(UPLOAD_DIR, filename)
-        with open(file_path, "wb") as buf:
-            shutil.copyfileobj(file.file, buf)
+    def batch_job(
+        self,
+        items: list[dict],
+        target_role: str | None = None,
+        jd_text: str | None = None,
+    ) -> Callable[[], dict]:
+        """Zero-argument callable running ``analyze_batch`` — picklable in process mode."""
+        return self._job("analyze_batch", items, target_role=target_role, jd_text=jd_text)
 
-        logger.info("process: saved %s → %s", filename, file_path)
-        return self.analyze_file(file_path, target_role=target_role, jd_text=jd_text)
+    def stream_job(
+        self,
+        source: str | bytes,
+        on_event: Callable[[str, dict], None],
+        filename: str | None = None,
+        target_role: str | None = None,
+        jd_text: str | None = None,
+    ) -> Callable[[], dict]:
+        """
+        Like ``pipeline_job`` but reports sections through ``on_event`` as
+        they finish. Callbacks cannot cross a process boundary, so in
+        process mode no events are emitted and callers replay them from
+        the finished report.
+        """
+        if pipeline_executor.uses_processes():
+            return self.pipeline_job(
+                source, filename=filename, target_role=target_role, jd_text=jd_text,
+            )
+        return partial(
+            self.analyze_file, source, filename=filename,
+            target_role=target_role, jd_text=jd_text, on_event=on_event,
+        )
+
+    def _job(self, method: str, *args, **kwargs) -> Callable[[], dict]:
+        if pipeline_executor.uses_processes():
+            return partial(_run_in_worker, method, *args, **kwargs)
+        return partial(getattr(self, method), *args, **kwargs)
 
     # ------------------------------------------------------------------
-    # Public API — from file path
+    # Public API — from file path or bytes
     # ------------------------------------------------------------------
 
     def analyze_file(
         self,
-        file_path: str,
+        source: str | bytes,
         top_k: int = 5,
         target_role: str | None = None,
         jd_text: str | None = None,
+        on_event: Callable[[str, dict], None] | None = None,
+        filename: str | None = None,
     ) -> dict:
-        logger.info("analyze_file: %s (target_role=%s)", file_path, target_role)
-        raw_text = self.file_processor.extract_text(file_path)
-        return self._run_pipeline(
-            raw_text, top_k=top_k, target_role=target_role, jd_text=jd_text,
-        )
+        """
+        Run the pipeline on a resume file — a path, or the file's bytes
+        plus its ``filename`` (used to detect PDF vs DOCX).
+        """
+        name = filename or (source if isinstance(source, str) else "<upload>")
+        logger.info("analyze_file: %s (target_role=%s)", name, target_role)
+        with metrics.collect_timings():
+            with metrics.timed("FileProcessing"):
+                raw_text = self.file_processor.extract_text(source, filename)
+            return self._run_pipeline(
+                raw_text, top_k=top_k, target_role=target_role, jd_text=jd_text,
+                on_event=on_event,
+            )
 
     # ------------------------------------------------------------------
     # Public API — from raw text
@@ -156,41 +353,171 @@ class AnalysisService:
         top_k: int = 5,
         target_role: str | None = None,
         jd_text: str | None = None,
+        on_event: Callable[[str, dict], None] | None = None,
     ) -> dict:
-        return self._run_pipeline(
-            raw_text, top_k=top_k, target_role=target_role, jd_text=jd_text,
-        )
+        with metrics.collect_timings():
+            return self._run_pipeline(
+                raw_text, top_k=top_k, target_role=target_role, jd_text=jd_text,
+                on_event=on_event,
+            )
 
     # ------------------------------------------------------------------
-    # Internal pipeline
+    # Public API — batch
     # ------------------------------------------------------------------
 
-    def _run_pipeline(
+    def analyze_batch(
         self,
-        raw_text: str,
+        items: list[dict],
         top_k: int = 5,
         target_role: str | None = None,
         jd_text: str | None = None,
     ) -> dict:
+        """
+        Analyze many resumes with one batched encode and one similarity matmul.
+
+        The batch holds a single pipeline slot, so items are extracted and
+        analyzed one at a time (each analysis still fans out over the stage
+        scheduler like any request); every resume is embedded in a single
+        ``encode`` call and scored against every role as one matrix product
+        between those two phases.
+
+        Parameters
+        ----------
+        items : list[dict]
+            Each has ``name`` and one of ``data`` (file bytes; ``name``
+            gives the format), ``file`` (a readable binary file object,
+            e.g. a spooled upload), ``file_path`` or ``text``. Items
+            that already carry an ``error`` (e.g. a rejected upload) are
+            reported as failed without being processed.
+
+        Returns
+        -------
+        dict
+            results : list[dict] — per item: name, status ("ok" | "error"),
+                      and report or error
+            summary : dict       — counts and aggregate timing
+        """
         t0 = time.perf_counter()
+        results: list[dict] = [
+            {"name": item.get("name") or f"item_{i + 1}"} for i, item in enumerate(items)
+        ]
+
+        def _extract(item: dict) -> tuple[ParsedResume, dict, dict] | str:
+            if "error" in item:
+                return item["error"]
+            with metrics.collect_timings({}) as timings:
+                try:
+                    with metrics.timed("FileProcessing"):
+                        raw_text = item.get("text")
+                        if raw_text is None and "data" in item:
+                            raw_text = self.file_processor.extract_text(item["data"], item["name"])
+                        elif raw_text is None and "file" in item:
+                            raw_text = self.file_processor.extract_text(item["file"], item["name"])
+                        elif raw_text is None:
+                            raw_text = self.file_processor.extract_text(item["file_path"])
+                except Exception as exc:
+                    return str(exc)
+                if not raw_text or not raw_text.strip():
+                    return "No text could be extracted."
+                resume = ParsedResume.parse(raw_text)
+                return resume, self._build_profile(resume), timings
+
+        # ── 1-4. Extract text + profile (one item at a time) ─
+        extracted = [_extract(item) for item in items]
+        t_extract = time.perf_counter()
+
+        live: list[int] = []
+        for i, outcome in enumerate(extracted):
+            if isinstance(outcome, str):
+                results[i].update(status="error", error=outcome)
+            else:
+                live.append(i)
+
+        # ── 5. One batched encode for every resume ───────────
+        embeddings = (
+            self.matcher.embed_batch([extracted[i][0] for i in live]) if live else None
+        )
+        t_embed = time.perf_counter()
+
+        # ── 6. One similarity matmul against every role ──────
+        role_scores = vector_store.similarities(embeddings) if live else None
+        t_search = time.perf_counter()
+
+        # ── 7-19. Role analysis per resume ──────────────────
+        def _analyze(pos: int) -> dict:
+            resume, profile, timings = extracted[live[pos]]
+            try:
+                with metrics.collect_timings(timings):
+                    return self._run_pipeline(
+                        resume,
+                        top_k=top_k,
+                        target_role=target_role,
+                        jd_text=jd_text,
+                        profile=profile,
+                        embedding=embeddings[pos],
+                        role_scores=role_scores[pos],
+                    )
+            except Exception as exc:
+                logger.exception("Batch item %s failed", results[live[pos]]["name"])
+                return {"error": str(exc)}
+
+        reports = [_analyze(pos) for pos in range(len(live))]
+        t_end = time.perf_counter()
+
+        for i, report in zip(live, reports):
+            if "error" in report:
+                results[i].update(status="error", error=report["error"])
+            else:
+                results[i].update(status="ok", report=report)
+
+        succeeded = sum(1 for r in results if r["status"] == "ok")
+        total = t_end - t0
+        logger.info(
+            "Batch of %d analyzed in %.3f s (%d ok, %d failed)",
+            len(items), total, succeeded, len(items) - succeeded,
+        )
+        return {
+            "results": results,
+            "summary": {
+                "items": len(items),
+                "succeeded": succeeded,
+                "failed": len(items) - succeeded,
+                "timing_seconds": {
+                    "extraction": round(t_extract - t0, 3),
+                    "embedding": round(t_embed - t_extract, 3),
+                    "search": round(t_search - t_embed, 3),
+                    "analysis": round(t_end - t_search, 3),
+                    "total": round(total, 3),
+                },
+                "resumes_per_second": round(len(items) / total, 2) if total > 0 else 0.0,
+            },
+        }
+
+    # ------------------------------------------------------------------
+    # Internal pipeline
+    # ------------------------------------------------------------------
+
+    def _build_profile(self, resume: ParsedResume) -> dict:
+        """Steps 1-4: preprocess, extract and normalize the candidate profile."""
         errors: list[str] = []
 
-        # ── 1-2. Preprocess ──────────────────────────────────────
+        # ── 1-2. Preprocess (only the token count is reported) ───
         try:
-            cleaned = self.preprocessor.clean(raw_text)
-            tokens = self.preprocessor.tokenize(cleaned)
+            with metrics.timed("Preprocessing"):
+                cleaned = self.preprocessor.clean(resume.text)
+                token_count = self.preprocessor.count_tokens(cleaned)
         except Exception as exc:
             logger.error("Preprocessing failed: %s", exc)
-            cleaned = raw_text
-            tokens = raw_text.split()
+            token_count = resume.word_count
             errors.append(f"Preprocessing: {exc}")
 
         # ── 3. Information extraction ────────────────────────────
         try:
-            profile = self.extractor.extract(raw_text)
+            with metrics.timed("InformationExtraction"):
+                extracted = self.extractor.extract(resume)
         except Exception as exc:
             logger.error("Information extraction failed: %s", exc)
-            profile = {
+            extracted = {
                 "skills": [],
                 "education": {"degrees": []},
                 "experience": {"years_mentioned": [], "max_years": 0},
@@ -198,10 +525,10 @@ class AnalysisService:
             }
             errors.append(f"InfoExtraction: {exc}")
 
-        raw_skills = profile.get("skills", [])
-        education = profile.get("education", {"degrees": []})
-        experience = profile.get("experience", {"years_mentioned": [], "max_years": 0})
-        keywords = profile.get("keywords", [])
+        raw_skills = extracted.get("skills", [])
+        education = extracted.get("education", {"degrees": []})
+        experience = extracted.get("experience", {"years_mentioned": [], "max_years": 0})
+        keywords = extracted.get("keywords", [])
         max_years = experience.get("max_years", 0) if isinstance(experience, dict) else 0
 
         # Ensure education is a dict with "degrees" key
@@ -212,37 +539,136 @@ class AnalysisService:
 
         # ── 4. Normalize skills ──────────────────────────────────
         try:
-            normalized_skills = self.normalizer.normalize(raw_skills)
+            with metrics.timed("SkillNormalization"):
+                normalized_skills = self.normalizer.normalize(raw_skills)
         except Exception as exc:
             logger.error("Skill normalization failed: %s", exc)
             normalized_skills = raw_skills
             errors.append(f"SkillNorm: {exc}")
 
+        return {
+            "token_count": token_count,
+            "raw_skills": raw_skills,
+            "normalized_skills": normalized_skills,
+            "education": education,
+            "experience": experience,
+            "keywords": keywords,
+            "max_years": max_years,
+            "errors": errors,
+        }
+
+    def _profile_phase(
+        self,
+        resume: ParsedResume,
+        top_k: int = 5,
+        profile: dict | None = None,
+        embedding: np.ndarray | None = None,
+        role_scores: np.ndarray | None = None,
+    ) -> tuple[dict, bool]:
+        """
+        Steps 1-6 — everything that does not depend on the target role or JD.
+
+        Returns ``(phase, cached)`` where ``phase`` holds ``profile``,
+        ``candidate_profile`` and ``role_matches``. Results for the same
+        text and ``top_k`` are memoised (``PROFILE_CACHE_SIZE``), so
+        re-running a resume against another role or JD skips extraction,
+        embedding and role scoring. Batch callers pass precomputed
+        inputs and bypass the memo.
+        """
+        precomputed = profile is not None or embedding is not None or role_scores is not None
+        key = (hashlib.sha256(resume.text.encode("utf-8")).hexdigest(), top_k)
+        if not precomputed:
+            phase = self.profile_cache.get(key)
+            if phase is not None:
+                # Report sections are built around these dicts — hand out a copy
+                return copy.deepcopy(phase), True
+
+        # ── 1-4. Candidate profile ───────────────────────────────
+        if profile is None:
+            profile = self._build_profile(resume)
+        normalized_skills = profile["normalized_skills"]
+        experience = profile["experience"]
+        keywords = profile["keywords"]
+        candidate_profile = {
+            "skills_raw": profile["raw_skills"],
+            "skills_normalized": normalized_skills,
+            "education": profile["education"],
+            "experience": experience,
+            "keywords": keywords,
+            "token_count": profile["token_count"],
+        }
+
         # ── 5-6. Semantic role matching (HYBRID v2.0) ────────────
         # Pass candidate data to enable skill/experience/keyword boosting
         role_matches = _safe_call(
             "SemanticMatching",
             self.matcher.match,
-            resume_text=raw_text,
+            resume_text=resume,
             candidate_skills=normalized_skills,
             candidate_experience=experience.get("max_years", 0) if isinstance(experience, dict) else 0,
             candidate_keywords=keywords,
             top_k=top_k,
+            embedding=embedding,
+            role_scores=role_scores,
         )
-        top_roles = role_matches.get("top_roles", [])
 
+        phase = {
+            "profile": profile,
+            "candidate_profile": candidate_profile,
+            "role_matches": role_matches,
+        }
+        # Only memoise clean runs — a failed engine may succeed next time
+        if not precomputed and not profile["errors"] and role_matches.get("top_roles"):
+            self.profile_cache.put(key, copy.deepcopy(phase))
+        return phase, False
+
+    def _run_pipeline(
+        self,
+        resume: str | ParsedResume,
+        top_k: int = 5,
+        target_role: str | None = None,
+        jd_text: str | None = None,
+        profile: dict | None = None,
+        embedding: np.ndarray | None = None,
+        role_scores: np.ndarray | None = None,
+        on_event: Callable[[str, dict], None] | None = None,
+    ) -> dict:
+        """
+        Steps 1-19 for one resume: the role-independent profile phase
+        (1-6, memoised) followed by the role/JD scoring phase (7-19).
+
+        ``on_event(key, value)`` — if given — is called as soon as each
+        section of the report is ready, using the report's own keys
+        (``candidate_profile``, ``role_matches``, ``ats_score``, …).
+
+        The text is parsed once (``ParsedResume``) and shared by every
+        engine that reads it.
+        """
+        t0 = time.perf_counter()
+        emit = on_event or (lambda key, value: None)
+        resume = ParsedResume.of(resume)
+
+        # ── 1-6. Profile phase ───────────────────────────────────
+        phase, profile_cached = self._profile_phase(
+            resume, top_k=top_k, profile=profile,
+            embedding=embedding, role_scores=role_scores,
+        )
+        profile = phase["profile"]
+        candidate_profile = phase["candidate_profile"]
+        role_matches = phase["role_matches"]
+        normalized_skills = profile["normalized_skills"]
+        max_years = profile["max_years"]
+        errors: list[str] = list(profile["errors"])
+        t_profile = time.perf_counter()
+        emit("candidate_profile", candidate_profile)
+
+        top_roles = role_matches.get("top_roles", [])
         if not top_roles:
             return {
                 "error": "No matching roles found.",
-                "candidate_profile": {
-                    "skills_raw": raw_skills,
-                    "skills_normalized": normalized_skills,
-                    "education": education,
-                    "experience": experience,
-                    "keywords": keywords,
-                    "token_count": len(tokens),
-                },
+                "candidate_profile": candidate_profile,
             }
+        emit("role_matches", role_matches)
 
         # ── 7. Resolve target role ───────────────────────────────
         if target_role:
@@ -276,92 +702,34 @@ class AnalysisService:
         if not role_required_skills:
             role_required_skills = self._get_fallback_skills(role_name)
 
-        # ── 9. ATS score ─────────────────────────────────────────
-        ats_result = _safe_call(
-            "ATSScoring",
-            self.ats_scorer.calculate,
-            candidate_skills=normalized_skills,
-            role_required_skills=role_required_skills,
-            candidate_experience=max_years,
-            role_min_exp=role_min_exp,
-            semantic_score=semantic_score,
-            role_max_exp=role_max_exp,
-        )
-
-        # ── 10. JD comparison ────────────────────────────────────
-        jd_comparison: dict = {}
-        if jd_text:
-            jd_comparison = _safe_call(
-                "JDComparison",
-                self.jd_comparer.compare,
-                resume_text=raw_text,
-                jd_text=jd_text,
-                resume_skills=normalized_skills,
-            )
-
-        # ── 11. ATS simulation ───────────────────────────────────
-        ats_simulation = _safe_call(
-            "ATSSimulation",
-            self.ats_simulator.simulate,
-            resume_text=raw_text,
-            target_keywords=role_required_skills + role_keywords,
-        )
-
-        # ── 12. Skill gap ────────────────────────────────────────
-        gap_result = _safe_call(
-            "SkillGap",
-            self.skill_gap.identify,
-            candidate_skills=normalized_skills,
-            role_required_skills=role_required_skills,
-        )
-
-        # ── 13. Soft skills ──────────────────────────────────────
-        soft_result = _safe_call("SoftSkill", self.soft_skill.analyze, raw_text)
-
-        # ── 14. Resume improvements (v2.0: role-aware) ───────────
-        improvement_result = _safe_call(
-            "ResumeImprovement",
-            self.improvement.analyze,
-            text=raw_text,
-            candidate_skills=normalized_skills,
-            role_required_skills=role_required_skills,
-            role_name=role_name,
-            skill_match_percent=semantic_score,
-        )
-
-        # ── 15. Industry alignment ───────────────────────────────
-        industry_result = _safe_call(
-            "IndustryInsight",
-            self.industry.calculate_alignment,
-            normalized_skills,
-            role_required_skills,
-        )
-
-        # ── 16. Certifications ───────────────────────────────────
-        cert_result = _safe_call(
-            "Certifications",
-            self.certifications.suggest,
-            gap_result.get("missing_skills", []),
-            role_name,
-        )
-
-        # ── 17. Role explanation ─────────────────────────────────
-        explanation = _safe_call(
-            "RoleExplanation",
-            self.explainer.generate,
-            role_name=role_name,
-            overlap_percent=gap_result.get("coverage_percent", 0),
-            experience_years=max_years,
-            matched_skills=gap_result.get("matched_skills", []),
-            missing_skills=gap_result.get("missing_skills", []),
-            semantic_score=semantic_score,
-            ats_score=ats_result.get("final_score", 0),
-        )
-
-        # ── 18. Career paths ─────────────────────────────────────
-        career_result = _safe_call(
-            "CareerPath", self.career_path.suggest, str(role_id),
+        # ── 9-18. Engine stages (dependency-aware, concurrent) ───
+        stage_outputs, stage_trace = stage_scheduler.run(
+            self._stages,
+            {
+                "resume": resume,
+                "jd_text": jd_text,
+                "normalized_skills": normalized_skills,
+                "role_required_skills": role_required_skills,
+                "role_keywords": role_keywords,
+                "role_name": role_name,
+                "role_id": role_id,
+                "role_min_exp": role_min_exp,
+                "role_max_exp": role_max_exp,
+                "max_years": max_years,
+                "semantic_score": semantic_score,
+            },
+            on_stage_done=emit,
         )
+        ats_result = stage_outputs["ats_score"]
+        jd_comparison = stage_outputs["jd_comparison"]
+        ats_simulation = stage_outputs["ats_simulation"]
+        gap_result = stage_outputs["skill_gap"]
+        soft_result = stage_outputs["soft_skill"]
+        improvement_result = stage_outputs["improvements"]
+        industry_result = stage_outputs["industry_alignment"]
+        cert_result = stage_outputs["certifications"]
+        explanation = stage_outputs["explanation"]
+        career_result = stage_outputs["career_paths"]
 
         # ── 19. Compile final report ─────────────────────────────
         elapsed = round(time.perf_counter() - t0, 3)
@@ -376,14 +744,7 @@ class AnalysisService:
             explanation=explanation,
             career_paths=career_result,
             role_matches=role_matches,
-            candidate_profile={
-                "skills_raw": raw_skills,
-                "skills_normalized": normalized_skills,
-                "education": education,
-                "experience": experience,
-                "keywords": keywords,
-                "token_count": len(tokens),
-            },
+            candidate_profile=candidate_profile,
         )
 
         report["jd_comparison"] = jd_comparison
@@ -395,6 +756,18 @@ class AnalysisService:
             "target_role": role_name,
             "jd_source": jd_source,
             "total_roles_available": len(vector_store.get_roles()),
+            "embedding_backend": model_loader.active_backend(),
+            "stages": stage_trace,
+            "profile_phase": {
+                "cached": profile_cached,
+                "seconds": round(t_profile - t0, 4),
+            },
+            # Per-engine / per-step wall time (nested: SemanticMatching
+            # includes ResumeEmbedding, VectorSearch and HybridRerank)
+            "timings_seconds": {
+                step: round(seconds, 4)
+                for step, seconds in (metrics.current_timings() or {}).items()
+            },
         }
 
         # Include any engine errors for debugging
@@ -407,16 +780,104 @@ class AnalysisService:
         )
         return report
 
+    # ------------------------------------------------------------------
+    # Stage graph — steps 9-18
+    # ------------------------------------------------------------------
+
+    def _build_stages(self) -> tuple[Stage, ...]:
+        """
+        Steps 9-18 as a DAG. Each stage sees only the inputs it declares;
+        stages without a path between them run concurrently.
+        """
+        return (
+            # ── 9. ATS score
+            Stage("ats_score", lambda c: _safe_call(
+                "ATSScoring",
+                self.ats_scorer.calculate,
+                candidate_skills=c["normalized_skills"],
+                role_required_skills=c["role_required_skills"],
+                candidate_experience=c["max_years"],
+                role_min_exp=c["role_min_exp"],
+                semantic_score=c["semantic_score"],
+                role_max_exp=c["role_max_exp"],
+            ), ("normalized_skills", "role_required_skills", "max_years",
+                "role_min_exp", "role_max_exp", "semantic_score")),
+            # ── 10. JD comparison
+            Stage("jd_comparison", lambda c: _safe_call(
+                "JDComparison",
+                self.jd_comparer.compare,
+                resume_text=c["resume"],
+                jd_text=c["jd_text"],
+                resume_skills=c["normalized_skills"],
+            ) if c["jd_text"] else {}, ("resume", "jd_text", "normalized_skills")),
+            # ── 11. ATS simulation
+            Stage("ats_simulation", lambda c: _safe_call(
+                "ATSSimulation",
+                self.ats_simulator.simulate,
+                resume_text=c["resume"],
+                target_keywords=c["role_required_skills"] + c["role_keywords"],
+            ), ("resume", "role_required_skills", "role_keywords")),
+            # ── 12. Skill gap
+            Stage("skill_gap", lambda c: _safe_call(
+                "SkillGap",
+                self.skill_gap.identify,
+                candidate_skills=c["normalized_skills"],
+                role_required_skills=c["role_required_skills"],
+            ), ("normalized_skills", "role_required_skills")),
+            # ── 13. Soft skills
+            Stage("soft_skill", lambda c: _safe_call(
+                "SoftSkill", self.soft_skill.analyze, c["resume"],
+            ), ("resume",)),
+            # ── 14. Resume improvements (v2.0: role-aware)
+            Stage("improvements", lambda c: _safe_call(
+                "ResumeImprovement",
+                self.improvement.analyze,
+                text=c["resume"],
+                candidate_skills=c["normalized_skills"],
+                role_required_skills=c["role_required_skills"],
+                role_name=c["role_name"],
+                skill_match_percent=c["semantic_score"],
+            ), ("resume", "normalized_skills", "role_required_skills",
+                "role_name", "semantic_score")),
+            # ── 15. Industry alignment
+            Stage("industry_alignment", lambda c: _safe_call(
+                "IndustryInsight",
+                self.industry.calculate_alignment,
+                c["normalized_skills"],
+                c["role_required_skills"],
+            ), ("normalized_skills", "role_required_skills")),
+            # ── 16. Certifications (needs the skill gap)
+            Stage("certifications", lambda c: _safe_call(
+                "Certifications",
+                self.certifications.suggest,
+                c["skill_gap"].get("missing_skills", []),
+                c["role_name"],
+            ), ("skill_gap", "role_name")),
+            # ── 17. Role explanation (needs skill gap + ATS score)
+            Stage("explanation", lambda c: _safe_call(
+                "RoleExplanation",
+                self.explainer.generate,
+                role_name=c["role_name"],
+                overlap_percent=c["skill_gap"].get("coverage_percent", 0),
+                experience_years=c["max_years"],
+                matched_skills=c["skill_gap"].get("matched_skills", []),
+                missing_skills=c["skill_gap"].get("missing_skills", []),
+                semantic_score=c["semantic_score"],
+                ats_score=c["ats_score"].get("final_score", 0),
+            ), ("role_name", "skill_gap", "max_years", "semantic_score", "ats_score")),
+            # ── 18. Career paths
+            Stage("career_paths", lambda c: _safe_call(
+                "CareerPath", self.career_path.suggest, str(c["role_id"]),
+            ), ("role_id",)),
+        )
+
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
 
     @staticmethod
     def _find_role(role_name: str):
-        for r in vector_store.get_roles():
-            if r.role_name.lower() == role_name.lower():
-                return r
-        return None
+        return vector_store.get_role(role_name)
 
     @staticmethod
     def _get_fallback_skills(role_name: str) -> list[str]:
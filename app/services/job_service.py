@@ -0,0 +1,283 @@
+"""
+TalentIQ — Analysis Job Service
+Asynchronous counterpart of ``POST /analyze`` for large resumes and bursts:
+callers get a job id immediately and poll for the report instead of
+holding an HTTP connection open for the whole pipeline.
+
+Lifecycle:
+    queued → running → succeeded | failed
+    queued | running → cancelled        (DELETE /analyze/jobs/{id})
+
+Jobs wait in a bounded in-process queue (``JOB_MAX_PENDING``). A single
+dispatcher thread hands them to ``pipeline_executor`` only when a worker is
+idle, so jobs share the same workers as synchronous requests but never take
+the executor's wait queue: a burst of jobs cannot make ``/analyze`` return
+503, while synchronous requests queue ahead of the job backlog. Finished jobs are kept for ``JOB_RESULT_TTL_SECONDS``
+and then purged.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from functools import partial
+from typing import Callable
+
+from app.config import settings
+from app.core import pipeline_executor
+
+logger = logging.getLogger(__name__)
+
+STATUS_QUEUED = "queued"
+STATUS_RUNNING = "running"
+STATUS_SUCCEEDED = "succeeded"
+STATUS_FAILED = "failed"
+STATUS_CANCELLED = "cancelled"
+
+_FINISHED = frozenset({STATUS_SUCCEEDED, STATUS_FAILED, STATUS_CANCELLED})
+
+
+class JobQueueFullError(RuntimeError):
+    """Raised when ``JOB_MAX_PENDING`` jobs are already waiting."""
+
+
+def _iso(ts: float | None) -> str | None:
+    return datetime.fromtimestamp(ts, timezone.utc).isoformat() if ts else None
+
+
+@dataclass(slots=True)
+class Job:
+    job_id: str
+    filename: str
+    target_role: str | None
+    task: Callable[[], dict] | None
+    created_at: float = field(default_factory=time.time)
+    status: str = STATUS_QUEUED
+    started_at: float | None = None
+    finished_at: float | None = None
+    result: dict | None = None
+    error: str | None = None
+    future: pipeline_executor.PipelineFuture | None = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status in _FINISHED
+
+    def to_dict(self) -> dict:
+        data = {
+            "job_id": self.job_id,
+            "status": self.status,
+            "filename": self.filename,
+            "target_role": self.target_role,
+            "created_at": _iso(self.created_at),
+            "started_at": _iso(self.started_at),
+            "finished_at": _iso(self.finished_at),
+        }
+        if self.status == STATUS_SUCCEEDED:
+            data["result"] = self.result
+        elif self.status == STATUS_FAILED:
+            data["error"] = self.error
+        return data
+
+
+class JobManager:
+    """Bounded queue + TTL store for asynchronous analysis jobs."""
+
+    def __init__(self) -> None:
+        self._jobs: dict[str, Job] = {}
+        self._pending: queue.Queue[Job | None] = queue.Queue(
+            maxsize=max(1, settings.JOB_MAX_PENDING),
+        )
+        # Re-entrant: cancelling a future under the lock runs _on_done inline
+        self._lock = threading.RLock()
+        self._dispatcher: threading.Thread | None = None
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Start the dispatcher thread (idempotent)."""
+        with self._lock:
+            if self._dispatcher is not None and self._dispatcher.is_alive():
+                return
+            self._dispatcher = threading.Thread(
+                target=self._dispatch_loop, name="job-dispatcher", daemon=True,
+            )
+            self._dispatcher.start()
+
+    def shutdown(self) -> None:
+        """Cancel every unfinished job and stop the dispatcher."""
+        with self._lock:
+            for job in self._jobs.values():
+                if not job.finished:
+                    self._mark_cancelled(job)
+            dispatcher, self._dispatcher = self._dispatcher, None
+        if dispatcher is not None:
+            try:
+                self._pending.put_nowait(None)
+            except queue.Full:
+                pass  # daemon thread — exits with the process
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def submit(
+        self,
+        task: Callable[[], dict],
+        filename: str,
+        target_role: str | None = None,
+    ) -> Job:
+        """
+        Queue ``task`` (a zero-argument callable returning the report).
+
+        Raises
+        ------
+        JobQueueFullError
+            If ``JOB_MAX_PENDING`` jobs are already waiting.
+        """
+        self.start()
+        self._purge()
+        job = Job(
+            job_id=uuid.uuid4().hex,
+            filename=filename,
+            target_role=target_role,
+            task=task,
+        )
+        with self._lock:
+            try:
+                self._pending.put_nowait(job)
+            except queue.Full:
+                raise JobQueueFullError(
+                    f"Job queue is full ({self._pending.maxsize} pending jobs)"
+                ) from None
+            self._jobs[job.job_id] = job
+        logger.info("Job %s queued (%s)", job.job_id, filename)
+        return job
+
+    def get(self, job_id: str) -> Job | None:
+        """Return the job (status refreshed), or None if unknown or expired."""
+        self._purge()
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None:
+                self._refresh(job)
+            return job
+
+    def cancel(self, job_id: str) -> Job | None:
+        """
+        Cancel a queued or running job.
+
+        A queued job never starts. A running job cannot be interrupted — it
+        finishes in the background and its result is discarded. Finished
+        jobs are returned unchanged.
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None and not job.finished:
+                self._mark_cancelled(job)
+                logger.info("Job %s cancelled", job_id)
+            return job
+
+    def stats(self) -> dict:
+        """Job counts by status plus queue limits."""
+        with self._lock:
+            counts = dict.fromkeys(
+                (STATUS_QUEUED, STATUS_RUNNING, STATUS_SUCCEEDED,
+                 STATUS_FAILED, STATUS_CANCELLED),
+                0,
+            )
+            for job in self._jobs.values():
+                self._refresh(job)
+                counts[job.status] += 1
+        return {
+            **counts,
+            "max_pending": self._pending.maxsize,
+            "result_ttl_seconds": settings.JOB_RESULT_TTL_SECONDS,
+        }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _dispatch_loop(self) -> None:
+        while True:
+            job = self._pending.get()
+            if job is None:
+                return
+            with self._lock:
+                if job.finished:           # cancelled while queued
+                    continue
+                task, job.task = job.task, None
+            try:
+                future = pipeline_executor.submit_blocking(task)
+            except Exception as exc:
+                with self._lock:
+                    if not job.finished:
+                        job.status = STATUS_FAILED
+                        job.error = str(exc)
+                        job.finished_at = time.time()
+                continue
+
+            with self._lock:
+                job.future = future
+                if job.finished:
+                    future.cancel()
+            future.add_done_callback(partial(self._on_done, job))
+
+    def _on_done(self, job: Job, future: pipeline_executor.PipelineFuture) -> None:
+        with self._lock:
+            job.started_at = future.started_at
+            if job.finished:              # cancelled while running — discard
+                return
+            job.finished_at = time.time()
+            if future.cancelled():
+                job.status = STATUS_CANCELLED
+                return
+            exc = future.exception()
+            if exc is not None:
+                job.status = STATUS_FAILED
+                job.error = str(exc)
+                return
+            report = future.result()
+            if "error" in report and len(report) == 1:
+                job.status = STATUS_FAILED
+                job.error = report["error"]
+            else:
+                job.status = STATUS_SUCCEEDED
+                job.result = report
+        logger.info(
+            "Job %s %s in %.2f s", job.job_id, job.status,
+            job.finished_at - job.created_at,
+        )
+
+    @staticmethod
+    def _refresh(job: Job) -> None:
+        if job.status == STATUS_QUEUED and job.future is not None and job.future.started():
+            job.status = STATUS_RUNNING
+
+    @staticmethod
+    def _mark_cancelled(job: Job) -> None:
+        job.status = STATUS_CANCELLED
+        job.finished_at = time.time()
+        job.task = None
+        if job.future is not None:
+            job.future.cancel()
+
+    def _purge(self) -> None:
+        cutoff = time.time() - settings.JOB_RESULT_TTL_SECONDS
+        with self._lock:
+            expired = [
+                job_id for job_id, job in self._jobs.items()
+                if job.finished and job.finished_at is not None and job.finished_at < cutoff
+            ]
+            for job_id in expired:
+                del self._jobs[job_id]
+        if expired:
+            logger.info("Purged %d expired job(s)", len(expired))
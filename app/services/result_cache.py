@@ -0,0 +1,325 @@
+"""
+TalentIQ — Analysis Result Cache
+Memoises full ``POST /analyze`` reports so re-running the same resume
+(after toggling roles back, refreshing the UI, re-uploading) skips text
+extraction, embedding and every engine.
+
+Key = sha256 of
+    pipeline version   — APP_VERSION, embedding model, the backend that
+                         actually embeds (after any ONNX → torch fallback),
+                         ATS weights and the size/mtime of every file in
+                         DATASETS_DIR
+    upload digest      — sha256 of the uploaded bytes
+    target role        — canonical role name ("" = best semantic match)
+    JD digest          — sha256 of the stripped JD text ("" = default JD)
+
+Changing a dataset, the model or the scoring weights changes the version,
+so stale entries are never served. The version is computed when the cache
+is created — dataset edits and settings changes take effect after a
+restart. The embedding backend is the exception: when reports (or the
+loaded model) show a different backend than assumed, the cache re-versions
+itself on the spot. Entries live in an in-memory LRU bounded
+by ``RESULT_CACHE_MAX_ENTRIES`` and ``RESULT_CACHE_MAX_MB`` and expire after
+``RESULT_CACHE_TTL_SECONDS``. With ``RESULT_CACHE_DISK`` they are also
+written under ``CACHE_DIR/results/<version>/`` and survive restarts.
+
+Reports are stored as JSON bytes: the size is exact and every hit returns
+an independent copy.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+from app.config import settings
+from app.core import model_loader
+from app.engines import jd_comparison_engine, resume_embedding_engine
+from app.engines.ats_scoring_engine import ATSScoringEngine
+
+logger = logging.getLogger(__name__)
+
+# Bump when the report layout or scoring changes without an APP_VERSION bump
+_FORMAT_VERSION = 2
+_DISK_SUBDIR = "results"
+
+
+@dataclass(slots=True)
+class _Entry:
+    payload: bytes
+    stored_at: float
+
+
+def pipeline_version(backend: str | None = None) -> str:
+    """
+    Fingerprint of everything besides the inputs that shapes a report.
+
+    ``backend`` is the embedding backend producing the reports (default: the
+    loaded one, else the configured one). Dataset files are fingerprinted by
+    name, size and mtime — any edit (or re-download) of a CSV/JSON under
+    ``DATASETS_DIR`` yields a new version.
+    """
+    backend = backend or model_loader.active_backend() or model_loader.configured_backend()
+    digest = hashlib.sha256()
+    parts = [
+        f"format={_FORMAT_VERSION}",
+        f"app={settings.APP_VERSION}",
+        f"model={settings.EMBEDDING_MODEL}",
+        f"dim={settings.EMBEDDING_DIM}",
+        f"backend={backend}",
+        f"onnx={settings.ONNX_MODEL_FILE if backend == model_loader.BACKEND_ONNX_INT8 else ''}",
+        f"resume_embedding={resume_embedding_engine.fingerprint()}",
+        f"jd_mode={jd_comparison_engine.configured_mode()}/{settings.JD_REQUIREMENT_THRESHOLD}",
+        "ats_weights={}/{}/{}".format(
+            ATSScoringEngine.WEIGHT_SKILL,
+            ATSScoringEngine.WEIGHT_EXP,
+            ATSScoringEngine.WEIGHT_SEMANTIC,
+        ),
+    ]
+    for part in parts:
+        digest.update(part.encode("utf-8") + b"\x00")
+
+    datasets = settings.DATASETS_DIR
+    if datasets.is_dir():
+        for path in sorted(datasets.iterdir()):
+            if path.is_file():
+                stat = path.stat()
+                digest.update(f"{path.name}|{stat.st_size}|{stat.st_mtime_ns}\x00".encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def _is_cacheable(report: dict) -> bool:
+    """Only complete, error-free reports — a failed engine may be transient."""
+    if "error" in report:
+        return False
+    return not any(isinstance(v, dict) and "_error" in v for v in report.values())
+
+
+class ResultCache:
+    """LRU + TTL cache of analysis reports with an optional disk tier."""
+
+    def __init__(self) -> None:
+        self.enabled = settings.RESULT_CACHE_ENABLED
+        self._backend = model_loader.active_backend() or model_loader.configured_backend()
+        self.version = pipeline_version(self._backend)
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        # Counters (guarded by ``_lock``)
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._stores = 0
+        self._evictions = 0
+        self._expirations = 0
+
+        self._disk_dir: Path | None = None
+        if self.enabled and settings.RESULT_CACHE_DISK:
+            self._disk_dir = settings.CACHE_DIR / _DISK_SUBDIR / self.version
+            self._prepare_disk()
+
+    # ------------------------------------------------------------------
+    # Keys
+    # ------------------------------------------------------------------
+
+    def key(self, file_digest: str, target_role: str | None, jd_text: str | None) -> str:
+        """
+        Cache key for one analysis request.
+
+        ``target_role`` should already be canonical (see
+        ``AnalysisService.canonical_role``); ``jd_text`` is hashed after
+        stripping, and blank means "use the role's default JD".
+        """
+        self.observe_backend(model_loader.active_backend())
+        jd = (jd_text or "").strip()
+        jd_digest = hashlib.sha256(jd.encode("utf-8")).hexdigest() if jd else ""
+        raw = "\x00".join((self.version, file_digest, target_role or "", jd_digest))
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def observe_backend(self, backend: str | None) -> None:
+        """
+        Re-version the cache if reports are embedded by ``backend`` rather
+        than the backend the version assumed (e.g. ONNX fell back to torch,
+        here or in a pipeline worker process). Keys made before the switch
+        simply stop matching.
+        """
+        if not backend or backend == self._backend:
+            return
+        version = pipeline_version(backend)
+        with self._lock:
+            if backend == self._backend:
+                return
+            logger.info(
+                "Result cache: embedding backend is %s, not %s — version %s → %s",
+                backend, self._backend, self.version, version,
+            )
+            self._backend = backend
+            self.version = version
+            self._entries.clear()
+            self._bytes = 0
+            if self._disk_dir is not None:
+                self._disk_dir = self._disk_dir.parent / version
+                self._prepare_disk()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def get(self, key: str) -> dict | None:
+        """Return a copy of the cached report, or None on a miss."""
+        if not self.enabled:
+            return None
+
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if now - entry.stored_at <= settings.RESULT_CACHE_TTL_SECONDS:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return json.loads(entry.payload)
+                self._drop(key)
+                self._expirations += 1
+
+        entry = self._read_disk(key, now)
+        report = None
+        if entry is not None:
+            try:
+                report = json.loads(entry.payload)
+            except ValueError:
+                logger.warning("Result cache: ignoring unreadable disk entry %s", key)
+        with self._lock:
+            if report is None:
+                self._misses += 1
+                return None
+            self._disk_hits += 1
+            self._insert(key, entry)
+        return report
+
+    def put(self, key: str, report: dict) -> bool:
+        """
+        Store ``report`` under ``key``. Reports carrying an error are
+        skipped. Returns True if the report was cached.
+        """
+        if not self.enabled or not _is_cacheable(report):
+            return False
+        try:
+            payload = json.dumps(report, separators=(",", ":")).encode("utf-8")
+        except (TypeError, ValueError) as exc:
+            logger.warning("Result cache: report is not JSON-serialisable: %s", exc)
+            return False
+
+        entry = _Entry(payload=payload, stored_at=time.time())
+        with self._lock:
+            if not self._insert(key, entry):
+                return False
+            self._stores += 1
+        self._write_disk(key, entry)
+        return True
+
+    def clear(self) -> None:
+        """Drop every in-memory entry (disk entries expire by TTL/version)."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        """Hit/miss counters, occupancy and limits."""
+        with self._lock:
+            lookups = self._hits + self._disk_hits + self._misses
+            return {
+                "enabled": self.enabled,
+                "version": self.version,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": settings.RESULT_CACHE_MAX_ENTRIES,
+                "max_bytes": settings.RESULT_CACHE_MAX_MB * 1024 * 1024,
+                "ttl_seconds": settings.RESULT_CACHE_TTL_SECONDS,
+                "disk": self._disk_dir is not None,
+                "hits": self._hits,
+                "disk_hits": self._disk_hits,
+                "misses": self._misses,
+                "hit_ratio": (
+                    round((self._hits + self._disk_hits) / lookups, 4) if lookups else 0.0
+                ),
+                "stores": self._stores,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+            }
+
+    # ------------------------------------------------------------------
+    # Memory tier (callers hold ``_lock``)
+    # ------------------------------------------------------------------
+
+    def _insert(self, key: str, entry: _Entry) -> bool:
+        max_bytes = settings.RESULT_CACHE_MAX_MB * 1024 * 1024
+        max_entries = max(1, settings.RESULT_CACHE_MAX_ENTRIES)
+        if len(entry.payload) > max_bytes:
+            return False
+
+        if key in self._entries:
+            self._drop(key)
+        self._entries[key] = entry
+        self._bytes += len(entry.payload)
+        while len(self._entries) > max_entries or self._bytes > max_bytes:
+            oldest = next(iter(self._entries))
+            self._drop(oldest)
+            self._evictions += 1
+        return True
+
+    def _drop(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= len(entry.payload)
+
+    # ------------------------------------------------------------------
+    # Disk tier
+    # ------------------------------------------------------------------
+
+    def _prepare_disk(self) -> None:
+        """Create this version's directory and remove other versions' entries."""
+        root = self._disk_dir.parent
+        try:
+            self._disk_dir.mkdir(parents=True, exist_ok=True)
+            for child in root.iterdir():
+                if child.is_dir() and child != self._disk_dir:
+                    shutil.rmtree(child, ignore_errors=True)
+                    logger.info("Result cache: removed stale version %s", child.name)
+        except OSError as exc:
+            logger.warning("Result cache: disk tier disabled (%s)", exc)
+            self._disk_dir = None
+
+    def _read_disk(self, key: str, now: float) -> _Entry | None:
+        if self._disk_dir is None:
+            return None
+        path = self._disk_dir / f"{key}.json"
+        try:
+            stored_at = path.stat().st_mtime
+            if now - stored_at > settings.RESULT_CACHE_TTL_SECONDS:
+                path.unlink(missing_ok=True)
+                with self._lock:
+                    self._expirations += 1
+                return None
+            return _Entry(payload=path.read_bytes(), stored_at=stored_at)
+        except OSError:
+            return None
+
+    def _write_disk(self, key: str, entry: _Entry) -> None:
+        if self._disk_dir is None:
+            return
+        path = self._disk_dir / f"{key}.json"
+        tmp = path.with_suffix(f".tmp{os.getpid()}-{threading.get_ident()}")
+        try:
+            tmp.write_bytes(entry.payload)
+            os.replace(tmp, path)
+        except OSError as exc:
+            logger.warning("Result cache: could not write %s: %s", path.name, exc)
+            tmp.unlink(missing_ok=True)
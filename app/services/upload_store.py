@@ -0,0 +1,153 @@
+"""
+TalentIQ — Upload Store
+Bounded reading of uploads (``read_limited``) and opt-in persistence of
+uploaded resumes (``PERSIST_UPLOADS``).
+
+Uploads are parsed straight from memory; this store only keeps a copy when
+persistence is enabled. Files are content-addressed —
+``UPLOAD_DIR/<sha256>.<ext>`` — so re-uploading the same resume (or two
+users uploading ``resume.pdf``) never duplicates or overwrites anything.
+Stored files not re-uploaded for ``UPLOAD_TTL_SECONDS`` are removed by
+``purge()``, which runs at startup and periodically on save. Other files in
+the directory (e.g. hand-placed samples) are never touched.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Awaitable, Protocol
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+_STORED_NAME = re.compile(r"^[0-9a-f]{64}\.[a-z0-9]+$")
+_PURGE_INTERVAL_SECONDS = 600
+_READ_CHUNK = 1 << 20
+
+
+class UploadTooLargeError(ValueError):
+    """Raised when an upload exceeds ``MAX_FILE_SIZE_MB`` (HTTP 413)."""
+
+
+class AsyncReadable(Protocol):
+    """Anything with an awaitable ``read(size)`` — e.g. ``UploadFile``."""
+
+    def read(self, size: int = -1) -> Awaitable[bytes]: ...
+
+
+async def read_limited(
+    fileobj: AsyncReadable,
+    max_bytes: int | None = None,
+    declared_size: int | None = None,
+    filename: str = "upload",
+) -> bytes:
+    """
+    Read ``fileobj`` in chunks, stopping as soon as it exceeds ``max_bytes``
+    (default ``MAX_FILE_SIZE_MB``) instead of buffering the whole file.
+
+    Reads are awaited, so a spooled upload that rolled over to disk is read
+    in Starlette's threadpool rather than blocking the event loop.
+
+    ``declared_size`` (e.g. ``UploadFile.size``) rejects oversized files
+    before reading anything.
+
+    Raises
+    ------
+    UploadTooLargeError
+        If the file is larger than the limit.
+    """
+    if max_bytes is None:
+        max_bytes = settings.MAX_FILE_SIZE_MB * 1024 * 1024
+    too_large = UploadTooLargeError(
+        f"File '{filename}' exceeds the {max_bytes / (1024 * 1024):g} MB upload limit"
+    )
+    if declared_size is not None and declared_size > max_bytes:
+        raise too_large
+
+    buf = bytearray()
+    while chunk := await fileobj.read(_READ_CHUNK):
+        buf += chunk
+        if len(buf) > max_bytes:
+            raise too_large
+    return bytes(buf)
+
+
+@dataclass(frozen=True, slots=True)
+class ResumeUpload:
+    """An upload held in memory: original filename, raw bytes and their sha256."""
+
+    filename: str
+    data: bytes
+    sha256: str
+
+
+class UploadStore:
+    """Content-addressed, TTL-bounded upload directory."""
+
+    def __init__(self, root: Path | None = None) -> None:
+        self.root = Path(root or settings.UPLOAD_DIR)
+        self._lock = threading.Lock()
+        self._last_purge = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return settings.PERSIST_UPLOADS
+
+    def save(self, data: bytes, filename: str, digest: str | None = None) -> str | None:
+        """
+        Persist ``data`` if persistence is enabled.
+
+        Returns the stored path, or None when ``PERSIST_UPLOADS`` is off.
+        Saving content that is already stored only refreshes its TTL.
+        """
+        if not self.enabled:
+            return None
+
+        digest = digest or hashlib.sha256(data).hexdigest()
+        ext = os.path.splitext(filename)[1].lower() or ".bin"
+        path = self.root / f"{digest}{ext}"
+        try:
+            if path.exists():
+                os.utime(path)
+            else:
+                self.root.mkdir(parents=True, exist_ok=True)
+                tmp = path.with_suffix(f"{ext}.tmp{os.getpid()}-{threading.get_ident()}")
+                tmp.write_bytes(data)
+                os.replace(tmp, path)
+                logger.info("Stored upload %s → %s", filename, path.name)
+        except OSError as exc:
+            logger.warning("Could not persist upload %s: %s", filename, exc)
+            return None
+
+        if time.time() - self._last_purge > _PURGE_INTERVAL_SECONDS:
+            self.purge()
+        return str(path)
+
+    def purge(self) -> int:
+        """Delete stored uploads older than ``UPLOAD_TTL_SECONDS``. Returns the count."""
+        with self._lock:
+            self._last_purge = time.time()
+            if not self.root.is_dir():
+                return 0
+            cutoff = self._last_purge - settings.UPLOAD_TTL_SECONDS
+            removed = 0
+            for path in self.root.iterdir():
+                if not _STORED_NAME.match(path.name):
+                    continue
+                try:
+                    if path.stat().st_mtime < cutoff:
+                        path.unlink()
+                        removed += 1
+                except OSError:
+                    continue
+        if removed:
+            logger.info("Purged %d expired upload(s) from %s", removed, self.root)
+        return removed
@@ -0,0 +1,178 @@
+"""
+TalentIQ — Resume Embedding Benchmark
+Compares full-text and chunked (mean / max pooled) resume embeddings on the
+sample resumes in uploads/ (or the files given): encode latency, how much of
+each resume the model actually sees, how the semantic top roles change and —
+for files labelled with ``--target`` — where the known right role ranks.
+
+Target rank is the quality measure: the 1-based position of the labelled
+role among every role by cosine to the resume vector (lower is better),
+summarised as mean rank and hits in the top k.
+
+Section coverage (cov/min) is a diagnostic only, not quality: it is the
+cosine between the resume vector and each section's own embedding, and the
+chunked vector is pooled from those same sections, so chunked modes score
+well by construction. It shows where full mode truncates (a low worst-section
+score on long resumes), not whether the matches improve.
+
+Usage:
+    python scripts/benchmark_embedding.py                  # uploads/*.pdf|docx
+    python scripts/benchmark_embedding.py cv1.pdf --repeat 5 --top-k 5
+    python scripts/benchmark_embedding.py --target cv1.pdf="Data Scientist" \
+        --target cv2.docx="DevOps Engineer"
+"""
+
+from __future__ import annotations
+
+import argparse
+import glob
+import logging
+import os
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from app.config import settings  # noqa: E402
+from app.core import embedding_dispatcher, model_loader, vector_store  # noqa: E402
+from app.core.parsed_resume import ParsedResume  # noqa: E402
+from app.engines import resume_embedding_engine  # noqa: E402
+from app.engines.file_processing_engine import FileProcessingEngine  # noqa: E402
+
+MODES = [
+    ("full", resume_embedding_engine.MODE_FULL, resume_embedding_engine.POOL_MEAN),
+    ("chunked/mean", resume_embedding_engine.MODE_CHUNKED, resume_embedding_engine.POOL_MEAN),
+    ("chunked/max", resume_embedding_engine.MODE_CHUNKED, resume_embedding_engine.POOL_MAX),
+]
+
+
+def _seen_fraction(model, text: str) -> float | None:
+    """Share of the text's word pieces that fit in the model window (None if unknown)."""
+    tokenizer = getattr(model, "tokenizer", None)
+    limit = getattr(model, "max_seq_length", None)
+    if tokenizer is None or not limit:
+        return None
+    pieces = len(tokenizer.tokenize(text)) + 2  # [CLS] … [SEP]
+    return min(1.0, limit / pieces)
+
+
+def _embed(engine, resume: ParsedResume, mode: str, pooling: str, repeat: int) -> tuple[float, np.ndarray]:
+    settings.RESUME_EMBEDDING_MODE = mode
+    settings.RESUME_EMBEDDING_POOLING = pooling
+    vector = engine.generate(resume)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        engine.generate(resume)
+    return (time.perf_counter() - start) / repeat * 1000, vector
+
+
+def _ranked_roles(vector: np.ndarray) -> list[str]:
+    """Every role name, best cosine first."""
+    scores = vector_store.similarities(vector)
+    roles = vector_store.get_roles()
+    return [roles[i].role_name for i in np.argsort(-scores, kind="stable")]
+
+
+def _parse_targets(pairs: list[str]) -> dict[str, str]:
+    """``FILE=ROLE`` pairs → {file basename: canonical role name}."""
+    targets: dict[str, str] = {}
+    for pair in pairs:
+        name, sep, role_name = pair.partition("=")
+        role = vector_store.get_role(role_name.strip()) if sep else None
+        if role is None:
+            raise SystemExit(f"--target {pair!r}: expected FILE=ROLE with a known role name")
+        targets[os.path.basename(name.strip())] = role.role_name
+    return targets
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("files", nargs="*", help="PDF/DOCX resumes (default: uploads/*)")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per file and mode")
+    parser.add_argument("--top-k", type=int, default=5, help="semantic top roles compared")
+    parser.add_argument(
+        "--target", action="append", default=[], metavar="FILE=ROLE",
+        help="known right role for a resume (repeatable) — enables the rank column",
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    paths = args.files or sorted(
+        p for p in glob.glob(os.path.join(ROOT, "uploads", "*"))
+        if p.lower().endswith((".pdf", ".docx"))
+    )
+    if not paths:
+        print("No resumes found — pass files or put samples in uploads/")
+        return 1
+
+    settings.EMBEDDING_DISPATCHER = False  # time the encode itself, not batching waits
+    processor = FileProcessingEngine()
+    resumes = [(os.path.basename(p), ParsedResume.parse(processor.extract_text(p))) for p in paths]
+    model = model_loader.get_model()
+    vector_store.initialise()
+    targets = _parse_targets(args.target)
+    engine = resume_embedding_engine.ResumeEmbeddingEngine()
+    print(
+        f"Model {settings.EMBEDDING_MODEL} (max_seq_length={getattr(model, 'max_seq_length', 'n/a')}), "
+        f"windows of {settings.RESUME_CHUNK_WORDS} words, overlap {settings.RESUME_CHUNK_OVERLAP}"
+    )
+
+    print(f"\n{'file':<28} {'words':>6} {'seen':>5} {'chunks':>6}  "
+          + "  ".join(f"{name + ' ms':>15} {'rank':>4} {'cov':>5} {'min':>5}" for name, _, _ in MODES)
+          + f"  {'roles changed':>13}")
+    totals = {name: [] for name, _, _ in MODES}
+    ranks: dict[str, list[int]] = {name: [] for name, _, _ in MODES}
+    for label, resume in resumes:
+        sections = [resume.text[s.start:s.end] for s in resume.sections if resume.text[s.start:s.end].strip()]
+        section_vectors = embedding_dispatcher.encode(sections or [resume.text])
+        seen = _seen_fraction(model, resume.text)
+
+        cells = []
+        baseline: list[str] = []
+        changed: list[int] = []
+        for name, mode, pooling in MODES:
+            ms, vector = _embed(engine, resume, mode, pooling, args.repeat)
+            cosines = section_vectors @ vector
+            totals[name].append((ms, float(cosines.mean()), float(cosines.min())))
+            ranked = _ranked_roles(vector)
+            rank = ranked.index(targets[label]) + 1 if label in targets else None
+            if rank is not None:
+                ranks[name].append(rank)
+            cells.append(
+                f"{ms:>15.1f} {'-' if rank is None else rank:>4} "
+                f"{cosines.mean():>5.3f} {cosines.min():>5.3f}"
+            )
+            roles = ranked[:args.top_k]
+            if mode == resume_embedding_engine.MODE_FULL:
+                baseline = roles
+            else:
+                changed.append(len(set(roles) - set(baseline)))
+
+        print(
+            f"{label[:28]:<28} {resume.word_count:>6} "
+            f"{'n/a' if seen is None else f'{seen:.0%}':>5} "
+            f"{len(resume_embedding_engine.chunk_resume(resume)):>6}  "
+            + "  ".join(cells) + f"  {'/'.join(map(str, changed)):>13}"
+        )
+
+    print(f"\n{'MEAN':<28} {'':>6} {'':>5} {'':>6}  " + "  ".join(
+        f"{np.mean([t[0] for t in rows]):>15.1f} "
+        f"{np.mean(ranks[name]) if ranks[name] else float('nan'):>4.1f} "
+        f"{np.mean([t[1] for t in rows]):>5.3f} {np.mean([t[2] for t in rows]):>5.3f}"
+        for name, rows in totals.items()
+    ))
+    if targets:
+        labelled = len(next(iter(ranks.values())))
+        print(f"\nTarget role in the top {args.top_k} ({labelled} labelled resumes): " + ", ".join(
+            f"{name} {sum(r <= args.top_k for r in rows)}/{labelled}" for name, rows in ranks.items()
+        ))
+    else:
+        print("\nNo --target labels: rank (quality) not measured; cov/min are diagnostics only.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,145 @@
+"""
+TalentIQ — Information Extraction Benchmark
+Times InformationExtractionEngine's skill and keyword matchers against the
+per-pattern regex implementations they replaced, on the sample resumes in uploads/ (or the
+files given), and reports whether the outputs agree.
+
+Usage:
+    python scripts/benchmark_extraction.py                 # uploads/*.pdf|docx
+    python scripts/benchmark_extraction.py cv1.pdf cv2.docx --repeat 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import glob
+import logging
+import os
+import re
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from app.engines.file_processing_engine import FileProcessingEngine  # noqa: E402
+from app.engines.information_extraction_engine import (  # noqa: E402
+    _BUILTIN_SKILLS,
+    InformationExtractionEngine,
+)
+
+
+# ---------------------------------------------------------------------------
+# Previous implementations (one compiled regex per pattern, per call)
+# ---------------------------------------------------------------------------
+
+def legacy_extract_skills(engine: InformationExtractionEngine, text: str, text_lower: str) -> list[str]:
+    found: set[str] = set()
+    for skill in engine.special_skills:
+        escaped = re.escape(skill)
+        if re.search(r"(?<![a-zA-Z])" + escaped + r"(?![a-zA-Z])", text_lower):
+            found.add(skill)
+    for skill in engine.multi_word_skills:
+        pattern_str = re.escape(skill)
+        pattern_str = pattern_str.replace(r"\-", r"[\s/\-]")
+        pattern_str = pattern_str.replace(r"\/", r"[\s/\-]")
+        pattern_str = pattern_str.replace(r"\ ", r"[\s/\-]+")
+        if re.search(r"(?<![a-zA-Z])" + pattern_str + r"(?![a-zA-Z])", text_lower):
+            found.add(skill)
+    tokens = set(re.findall(r"\b[a-z][a-z+#.]{1,}\b", text_lower))
+    found.update(tokens & engine.single_word_skills)
+    upper_tokens = set(re.findall(r"\b[A-Z][A-Z+#./]{1,}\b", text))
+    for tok in upper_tokens:
+        low = tok.lower()
+        if low in engine.single_word_skills or low in {s for s in _BUILTIN_SKILLS}:
+            found.add(low)
+    found -= engine._SKILL_BLACKLIST
+    return sorted(found)
+
+
+def legacy_extract_keywords(engine: InformationExtractionEngine, text: str, text_lower: str) -> list[str]:
+    found: set[str] = set()
+    for kw in engine.DOMAIN_KEYWORDS:
+        escaped = re.escape(kw)
+        escaped = escaped.replace(r"\ ", r"[\s\-/]+")
+        escaped = escaped.replace(r"\-", r"[\s\-/]+")
+        if re.search(r"(?<![a-zA-Z])" + escaped + r"(?![a-zA-Z])", text_lower):
+            found.add(kw)
+    words = re.findall(r"\b[a-z]{3,}\b", text_lower)
+    for i in range(len(words) - 1):
+        if words[i] not in engine._KEYWORD_STOP and words[i + 1] not in engine._KEYWORD_STOP:
+            bigram = f"{words[i]} {words[i + 1]}"
+            if bigram in engine.DOMAIN_KEYWORDS:
+                found.add(bigram)
+    return sorted(found)
+
+
+# ---------------------------------------------------------------------------
+
+def _time(fn, repeat: int) -> tuple[float, object]:
+    result = fn()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000, result
+
+
+def _compare(name, legacy, current, engine, texts, repeat) -> None:
+    print(f"\n{name}")
+    print(f"{'file':<32} {'chars':>7} {'legacy ms':>10} {'new ms':>8} {'speedup':>8}  output")
+    total_old = total_new = 0.0
+    for label, text in texts:
+        text_lower = text.lower()
+        old_ms, old = _time(lambda: legacy(engine, text, text_lower), repeat)
+        new_ms, new = _time(lambda: current(text, text_lower), repeat)
+        total_old += old_ms
+        total_new += new_ms
+        if old == new:
+            verdict = "identical"
+        else:
+            added = sorted(set(new) - set(old))
+            removed = sorted(set(old) - set(new))
+            verdict = f"+{added} -{removed}"
+        print(
+            f"{label[:32]:<32} {len(text):>7} {old_ms:>10.2f} {new_ms:>8.2f} "
+            f"{old_ms / new_ms if new_ms else 0:>7.1f}x  {verdict}"
+        )
+    print(
+        f"{'TOTAL':<32} {'':>7} {total_old:>10.2f} {total_new:>8.2f} "
+        f"{total_old / total_new if total_new else 0:>7.1f}x"
+    )
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("files", nargs="*", help="PDF/DOCX resumes (default: uploads/*)")
+    parser.add_argument("--repeat", type=int, default=10, help="timed runs per file")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    paths = args.files or sorted(
+        p for p in glob.glob(os.path.join(ROOT, "uploads", "*"))
+        if p.lower().endswith((".pdf", ".docx"))
+    )
+    if not paths:
+        print("No resumes found — pass files or put samples in uploads/")
+        return 1
+
+    processor = FileProcessingEngine()
+    texts = [(os.path.basename(p), processor.extract_text(p)) for p in paths]
+
+    build_start = time.perf_counter()
+    engine = InformationExtractionEngine()
+    print(f"Engine init: {(time.perf_counter() - build_start) * 1000:.1f} ms "
+          f"({len(engine.single_word_skills)} single, {len(engine.multi_word_skills)} multi, "
+          f"{len(engine.special_skills)} special skills)")
+
+    _compare("Skills (_extract_skills)", legacy_extract_skills,
+             engine._extract_skills, engine, texts, args.repeat)
+    _compare("Keywords (_extract_keywords)", legacy_extract_keywords,
+             engine._extract_keywords, engine, texts, args.repeat)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -1669,7 +1669,7 @@ if not uploaded_file and not analyze_btn:
         <div class="feat-card anim-up" style="animation-delay:0.1s;">
             <div class="feat-icon" style="background:#F0FDFA;">🎯</div>
             <div class="feat-title">Intelligent Matching</div>
-            <div class="feat-desc">Semantic matching across 86 engineering & management roles using FAISS vector search technology.</div>
+            <div class="feat-desc">Semantic matching across 86 engineering & management roles using sentence-embedding vector search.</div>
         </div>""", unsafe_allow_html=True)
     with c3:
         st.markdown("""